@@ -1,10 +1,10 @@
 """CLI entry point for the audiobook pipeline (scrape chapters, then generate audio)."""
 
 import argparse
-import os
 from .config import load_config, save_config
+from .replication import open_local_first
 from .state import ChapterDB
-from .pipeline import run_scrape_phase, run_audio_phase, print_summary
+from .pipeline import run_scrape_phase, run_audio_phase, print_summary, start_tts_preload
 from .utils.colors import YELLOW, RESET
 
 
@@ -33,8 +33,39 @@ def main():
         '--port', type=int, default=8086,
         help='Port for the web server (default 8086; SPA mode only).'
     )
+    parser.add_argument(
+        '--worker', metavar='URL',
+        help='Run as a remote generation worker for the server at URL '
+             '(e.g. http://192.168.0.10:8086).'
+    )
+    parser.add_argument(
+        '--worker-id',
+        help='Worker name shown in lease listings (default <hostname>-<pid>).'
+    )
+    parser.add_argument(
+        '--worker-dir', default='worker',
+        help='Local scratch directory for a worker (default ./worker).'
+    )
+    parser.add_argument(
+        '--engine',
+        help="Worker only: override the server's tts_engine (e.g. synthetic)."
+    )
+    parser.add_argument(
+        '--series', action='append',
+        help='Worker only: lease chapters of this series (repeatable; default all enabled).'
+    )
+    parser.add_argument(
+        '--drain', action='store_true',
+        help='Worker only: exit once the server has nothing left to lease.'
+    )
     args = parser.parse_args()
 
+    if args.worker:
+        from .worker import run_worker
+        run_worker(args.worker, worker_id=args.worker_id, workdir=args.worker_dir,
+                   engine=args.engine, series=args.series, drain=args.drain)
+        return
+
     if not args.cli:
         if args.legacy:
             from .web.app import launch
@@ -48,8 +79,7 @@ def main():
     config_file = 'config_dev.yml' if args.dev else 'config.yml'
     config = load_config(config_file)
 
-    out_dir = config['config']['output_dir']
-    db_path = os.path.join(out_dir, 'audiobook.db')
+    db_path, replicator = open_local_first(config, background=False)
     db = ChapterDB(db_path)
 
     try:
@@ -58,6 +88,7 @@ def main():
             print(f"{YELLOW}No enabled series found in the configuration.{RESET}")
             return
 
+        start_tts_preload(config)
         run_scrape_phase(config, db)
         run_audio_phase(config, db, dev_mode=args.dev)
         print_summary(config, db)
@@ -68,3 +99,5 @@ def main():
     finally:
         save_config(config_file, config)
         db.close()
+        if replicator:
+            replicator.replicate()
@@ -3,10 +3,17 @@
 Pipeline code emits events through a PipelineContext instead of printing
 GUI-targeted output. The CLI passes no context (NULL_CONTEXT), making all
 emits no-ops and cancellation impossible — CLI behavior is unchanged.
+
+Timing spans (per-phase wall time with audio/chunk/retry counts) are
+recorded on the context too, so file work on the finalizer thread can add
+spans; processing persists each chapter's spans to the ChapterDB timings
+table from the job thread. Transient spans (HTTP requests, DB queries) are
+only emitted — they feed the /metrics registry and are never stored.
 """
 
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -22,12 +29,13 @@ class EventType(str, Enum):
     JOB_CANCELLED = "job_cancelled"
     PHASE_STARTED = "phase_started"          # message: 'scrape' | 'audio'
     SERIES_STARTED = "series_started"        # index/total for [i/n] display
-    SERIES_FINISHED = "series_finished"
+    SERIES_FINISHED = "series_finished"      # message: phase; a resume checkpoint
     CHAPTER_STARTED = "chapter_started"
     CHUNK_PROGRESS = "chunk_progress"        # chars_done/chars_total
     CHAPTER_DONE = "chapter_done"
     CHAPTER_FAILED = "chapter_failed"
     CHAPTER_SKIPPED = "chapter_skipped"
+    SPAN = "span"                            # span: a finished timing Span
     LOG = "log"
 
 
@@ -45,6 +53,39 @@ class PipelineEvent:
     total: int = 0
     message: str = ""
     error: str | None = None
+    span: "Span | None" = None
+
+
+TRANSIENT_SPANS = frozenset({'http', 'db'})
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed pipeline phase.
+
+    name is the phase: 'chapter' (end to end), 'clean', 'generate',
+    'validate', 'postproc', 'assemble', 'mp3', 'move' (per chapter), or
+    'batch' / 'retry' (one TTS generate call, possibly spanning chapters —
+    raw_path is None then). The TRANSIENT_SPANS 'http' (one scraper request,
+    detail = host) and 'db' (one ChapterDB call, detail = method name) are
+    emitted but never stored or persisted.
+    """
+    name: str
+    wall_s: float
+    raw_path: str | None = None
+    series: str | None = None
+    narrator: str | None = None     # series narrator; the batch's voice for batch/retry
+    audio_s: float | None = None
+    chars: int | None = None
+    chunks: int | None = None
+    retries: int | None = None
+    detail: str | None = None
+    ts: float = field(default_factory=time.time)
+
+    @property
+    def rtf(self):
+        """Realtime factor: wall seconds per second of audio (None without audio)."""
+        return self.wall_s / self.audio_s if self.audio_s else None
 
 
 class PipelineContext:
@@ -54,10 +95,15 @@ class PipelineContext:
     site — including the CLI — works unchanged.
     """
 
-    def __init__(self, sink=None, cancel_event=None, job_id=None):
+    def __init__(self, sink=None, cancel_event=None, job_id=None, yield_to=None,
+                 resume=None):
         self._sink = sink
         self.cancel_event = cancel_event or threading.Event()
         self.job_id = job_id
+        self._yield_to = yield_to   # callback(prepare) running waiting higher-priority jobs
+        self.resume = resume or {}  # checkpoint of an interrupted earlier run of this job
+        self._spans = []
+        self._spans_lock = threading.Lock()
 
     def emit(self, type, **fields):
         if self._sink is None:
@@ -71,5 +117,54 @@ class PipelineContext:
         if self.cancel_event.is_set():
             raise JobCancelled()
 
+    def phase_done(self, phase):
+        """Whether an interrupted earlier run of this job got past `phase`.
+
+        The checkpoint lists phases in the order they started, so any phase
+        started after `phase` means `phase` completed.
+        """
+        phases = self.resume.get('phases', [])
+        return phase in phases and phases[-1] != phase
+
+    def series_done(self, phase, series):
+        """Whether an interrupted earlier run of this job finished `series` in `phase`."""
+        return series in self.resume.get('series_done', {}).get(phase, [])
+
+    def yield_point(self, prepare=None):
+        """Safe boundary (between chapter windows or series) for cooperative preemption.
+
+        When a higher-priority job is waiting, the queue runs it to completion
+        before this returns — the caller then carries on where it stopped.
+        `prepare()` is called first, only if something actually preempts (e.g.
+        to drain in-flight chapter encodes). No-op without a queue (CLI).
+        """
+        if self._yield_to is not None:
+            self._yield_to(prepare)
+        self.check_cancelled()
+
+    def record_span(self, name, wall_s, **fields):
+        """Record a finished Span (thread-safe) and emit it as a SPAN event."""
+        span = Span(name=name, wall_s=wall_s, **fields)
+        if name not in TRANSIENT_SPANS:
+            with self._spans_lock:
+                self._spans.append(span)
+        self.emit(EventType.SPAN, series=span.series, raw_path=span.raw_path, span=span)
+        return span
+
+    @contextmanager
+    def span(self, name, **fields):
+        """Time the block as a Span; the yielded dict may add fields (e.g. audio_s)."""
+        extra = {}
+        t0 = time.perf_counter()
+        yield extra
+        self.record_span(name, time.perf_counter() - t0, **{**fields, **extra})
+
+    def take_spans(self, raw_path=None):
+        """Remove and return the spans recorded for `raw_path` (None: chapterless spans)."""
+        with self._spans_lock:
+            taken = [s for s in self._spans if s.raw_path == raw_path]
+            self._spans = [s for s in self._spans if s.raw_path != raw_path]
+        return taken
+
 
 NULL_CONTEXT = PipelineContext()
@@ -2,6 +2,7 @@
 
 import glob
 import os
+import threading
 import warnings
 from .events import NULL_CONTEXT, EventType
 from .scrapers.royalroad import RoyalRoadScraper
@@ -70,11 +71,52 @@ def _build_series_cfg(config, series_cfg):
         merged['tts_batch_size'] = tts_batch_size
     if config['config'].get('tts_verbose'):
         merged['tts_verbose'] = True
+    if config['config'].get('audio_postproc'):
+        merged['audio_postproc'] = config['config']['audio_postproc']
+    for key in ('tts_batch_tokens', 'tts_max_vram_gb', 'synthetic_rtf'):
+        if config['config'].get(key):
+            merged[key] = config['config'][key]
+    if config['config'].get('chunk_cache_gb') is not None:
+        merged['chunk_cache_gb'] = config['config']['chunk_cache_gb']
+    if config['config'].get('tts_chapter_window'):
+        merged['tts_chapter_window'] = config['config']['tts_chapter_window']
+    if 'tts_pipelined' in config['config']:
+        merged['tts_pipelined'] = bool(config['config']['tts_pipelined'])
     return merged
 
 
+def start_tts_preload(config):
+    """Load the configured TTS engine on a background thread.
+
+    Called when a job that will generate audio starts, so the model load
+    overlaps the network-bound scrape phase instead of following it. The
+    singletons serialize loading, so the first TTSProcessor simply waits for
+    (or reuses) this load. Returns the thread, or None if `tts_preload` is off.
+    """
+    if not config['config'].get('tts_preload', True):
+        return None
+    engine = config['config'].get('tts_engine', 'qwen')
+
+    def load():
+        try:
+            from .processors.engines import load_engine
+            load_engine(engine)
+        except Exception as e:
+            print(f"{YELLOW}TTS preload failed, loading on first chapter instead: {e}{RESET}")
+
+    # 'job-' prefix: output is captured into the GUI log like the worker's
+    thread = threading.Thread(target=load, daemon=True, name='job-tts-preload')
+    thread.start()
+    return thread
+
+
 def _delete_chapter_outputs(raw_path, output_base, series_name):
-    """Delete all output/temp files for a chapter to prepare for regeneration."""
+    """Delete all output/temp files for a chapter to prepare for regeneration.
+
+    Chunk audio survives in the chunk cache, so after a text edit or rescrape
+    unchanged chunks are restored rather than re-synthesized (an explicit
+    regenerate bypasses the cache, see regenerate_chapter).
+    """
     base = os.path.splitext(os.path.basename(raw_path))[0]
     series_out = os.path.join(output_base, series_name)
 
@@ -87,7 +129,9 @@ def _delete_chapter_outputs(raw_path, output_base, series_name):
     if os.path.exists(cleaned):
         os.remove(cleaned)
 
-    for f in glob.glob(os.path.join('tmp', f"{base}_part*")):
+    # Chunk buffer (resume checkpoint), plus per-chunk WAVs from older versions
+    for f in glob.glob(os.path.join('tmp', f"{base}.chunks")) + \
+            glob.glob(os.path.join('tmp', f"{base}_part*")):
         os.remove(f)
 
 
@@ -121,7 +165,9 @@ def run_scrape_phase(config, db, ctx=NULL_CONTEXT):
 
     new_chapter_found = False
     for idx, series in enumerate(series_to_scrape):
-        ctx.check_cancelled()
+        ctx.yield_point()
+        if ctx.series_done('scrape', series.get('name')):
+            continue   # resumed job: already scraped before the interruption
         url = series.get('url', '')
 
         if is_local_source(url):
@@ -137,7 +183,7 @@ def run_scrape_phase(config, db, ctx=NULL_CONTEXT):
             continue
 
         output_dir = os.path.join(config['config']['output_dir'], series.get('name'), raws_subdir)
-        scraper = scraper_cls(series, output_dir, db=db)
+        scraper = scraper_cls(series, output_dir, db=db, ctx=ctx)
         ctx.emit(EventType.SERIES_STARTED, series=series.get('name', 'Unnamed'),
                  index=idx + 1, total=total)
         try:
@@ -145,9 +191,11 @@ def run_scrape_phase(config, db, ctx=NULL_CONTEXT):
                 f"{GREEN}[{idx+1}/{total}] "
                 f"Scraping {PURPLE}{series.get('name', 'Unnamed')}{RESET}"
             )
-            series['latest'], found = scraper.scrape_chapters()
+            with scraper.batch_registrations():
+                series['latest'], found = scraper.scrape_chapters()
             if found:
                 new_chapter_found = True
+            ctx.emit(EventType.SERIES_FINISHED, series=series.get('name'), message='scrape')
         except HTTPError as e:
             if e.response.status_code == 429:
                 print(
@@ -178,19 +226,19 @@ def run_audio_phase(config, db, dev_mode=False, ctx=NULL_CONTEXT):
         os.makedirs(tmp, exist_ok=True)
         os.makedirs(out, exist_ok=True)
 
-        tts_engine = config['config'].get('tts_engine', 'qwen')
-        narrators_config = config['config'].get('narrators', {})
         series_to_process = get_enabled_series(config)
         total = len(series_to_process)
 
         for idx, series in enumerate(series_to_process):
-            ctx.check_cancelled()
+            ctx.yield_point()
             series_name = series.get('name', 'Unnamed')
+            if ctx.series_done('audio', series_name):
+                continue   # resumed job: finished before the interruption
             raws_dir = os.path.join(out, series_name, raws_subdir)
             series_out = os.path.join(out, series_name)
             db.sync_filesystem(series_name, raws_dir, series_out)
 
-            series_cfg = {**series, 'tts_engine': tts_engine, 'narrators': narrators_config}
+            series_cfg = _build_series_cfg(config, series)
             ctx.emit(EventType.SERIES_STARTED, series=series_name,
                      index=idx + 1, total=total)
             print_status(
@@ -204,6 +252,7 @@ def run_audio_phase(config, db, dev_mode=False, ctx=NULL_CONTEXT):
                 print(f"\n{RED}Network share lost — aborting audio generation: {e}{RESET}")
                 ctx.emit(EventType.LOG, message=f'Network share lost — aborting: {e}')
                 return
+            ctx.emit(EventType.SERIES_FINISHED, series=series_name, message='audio')
     print()
 
 
@@ -252,11 +301,12 @@ def run_scrape_single_series(config, db, series_name, ctx=NULL_CONTEXT):
         return False
 
     output_dir = os.path.join(config['config']['output_dir'], series_name, "raws")
-    scraper = scraper_cls(series_cfg, output_dir, db=db)
+    scraper = scraper_cls(series_cfg, output_dir, db=db, ctx=ctx)
 
     try:
         print_status(f"{GREEN}Scraping {PURPLE}{series_name}{RESET}")
-        series_cfg['latest'], found = scraper.scrape_chapters()
+        with scraper.batch_registrations():
+            series_cfg['latest'], found = scraper.scrape_chapters()
         if not found:
             print_status(f"{GREEN}No new chapters for {PURPLE}{series_name}{RESET}")
         print()
@@ -300,7 +350,11 @@ def run_audio_single_series(config, db, series_name, dev_mode=False, ctx=NULL_CO
 
 
 def regenerate_chapter(config, db, series_name, chapter_id, dev_mode=False, ctx=NULL_CONTEXT):
-    """Delete output for a chapter and re-run TTS."""
+    """Delete output for a chapter and re-run TTS.
+
+    Every chunk is synthesized afresh: the text is usually unchanged, so the
+    chunk cache would otherwise restore the very audio being regenerated.
+    """
     chapter = db.get_chapter_by_id(chapter_id)
     if not chapter:
         print(f"{RED}Chapter not found{RESET}")
@@ -321,19 +375,20 @@ def regenerate_chapter(config, db, series_name, chapter_id, dev_mode=False, ctx=
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=FutureWarning)
         os.makedirs('tmp', exist_ok=True)
-        process_chapter(raw_path, full_cfg, out, 'tmp', db=db, dev_mode=dev_mode, ctx=ctx)
+        process_chapter(raw_path, full_cfg, out, 'tmp', db=db, dev_mode=dev_mode, ctx=ctx,
+                        refresh_cache=True)
 
 
 def rescrape_chapter(config, db, series_name, chapter_id, ctx=NULL_CONTEXT):
     """Re-fetch a chapter from source, overwrite raw text, and reset for processing."""
     ctx.check_cancelled()
-    old_text, new_text, _url = fetch_rescrape(config, db, series_name, chapter_id)
+    old_text, new_text, _url = fetch_rescrape(config, db, series_name, chapter_id, ctx=ctx)
     chapter = db.get_chapter_by_id(chapter_id)
     apply_rescrape(config, db, series_name, chapter_id, new_text)
     print(f"{GREEN}Re-scraped: {PURPLE}{chapter['title']}{RESET}")
 
 
-def fetch_rescrape(config, db, series_name, chapter_id):
+def fetch_rescrape(config, db, series_name, chapter_id, ctx=NULL_CONTEXT):
     """Fetch fresh chapter content without writing. Returns (old_text, new_text, source_url)."""
     chapter = db.get_chapter_by_id(chapter_id)
     if not chapter:
@@ -351,7 +406,7 @@ def fetch_rescrape(config, db, series_name, chapter_id):
         raise ValueError(f"Could not determine scraper for URL: {url}")
 
     raws_dir = os.path.dirname(chapter['raw_path'])
-    scraper = scraper_cls(series_cfg, raws_dir, db=db)
+    scraper = scraper_cls(series_cfg, raws_dir, db=db, ctx=ctx)
 
     source_url = chapter.get('source_url')
     if not source_url:
@@ -0,0 +1,208 @@
+"""Streaming chapter assembly: one append-only PCM buffer per chapter.
+
+Validated chunk audio is appended to a single local file as it is generated
+(in generation order, which batching reorders), each record tagged with the
+chunk's slot (its position in the chapter) and a digest of what produced it.
+The file doubles as the resume checkpoint — after a crash, records whose
+digest still matches are reused — and replaces hundreds of per-chunk WAVs and
+an ffmpeg concat.
+
+StreamingEncoder pipes the same records straight into one MP3 encoder per
+chapter as soon as they are final and in order, so no merged WAV is written
+and little encoding is left once the last chunk is generated.
+"""
+
+import os
+import struct
+import subprocess
+
+import numpy as np
+
+from ..utils.audio import open_mp3_encoder
+
+MAGIC = b'ABC1'
+# magic, slot, sample rate, sample count, digest (16 bytes of the chunk key)
+HEADER = struct.Struct('<4sIII16s')
+SAMPLE_WIDTH = 2   # int16 PCM, the format the chunk WAVs were written in
+
+
+def _to_pcm16(wav):
+    wav = np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0)
+    return (wav * 32767.0).astype('<i2')
+
+
+class ChapterBuffer:
+    """Append-only chunk PCM store for one chapter (see module docstring).
+
+    Args:
+        path: Buffer file, normally tmp/<chapter>.chunks. An existing file is
+            scanned and its intact records indexed; a torn final record from
+            an interrupted write is truncated away.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._index = {}   # slot -> (data offset, sample count, sample rate, digest)
+        self._fh = None
+        self._reader = None
+        if os.path.exists(path):
+            self._scan()
+
+    def _scan(self):
+        size = os.path.getsize(self.path)
+        good = 0
+        with open(self.path, 'rb') as f:
+            while good + HEADER.size <= size:
+                f.seek(good)
+                magic, slot, sr, n, digest = HEADER.unpack(f.read(HEADER.size))
+                end = good + HEADER.size + n * SAMPLE_WIDTH
+                if magic != MAGIC or end > size:
+                    break
+                self._index[slot] = (good + HEADER.size, n, sr, digest)
+                good = end
+        if good < size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(good)
+
+    @staticmethod
+    def digest(key):
+        """16-byte record digest from a hex chunk key."""
+        return bytes.fromhex(key[:32])
+
+    def has(self, slot, key):
+        """True if `slot` holds audio produced from the same chunk key."""
+        entry = self._index.get(slot)
+        return entry is not None and entry[3] == self.digest(key)
+
+    def append(self, slot, key, wav, sr):
+        """Append one validated chunk; a later record for a slot supersedes earlier ones."""
+        if self._fh is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._fh = open(self.path, 'ab')
+        pcm = _to_pcm16(wav)
+        offset = self._fh.tell()
+        self._fh.write(HEADER.pack(MAGIC, slot, int(sr), len(pcm), self.digest(key)))
+        self._fh.write(pcm.tobytes())
+        self._fh.flush()
+        self._index[slot] = (offset + HEADER.size, len(pcm), int(sr), self.digest(key))
+
+    def close(self):
+        """Close file handles (the file and its index stay usable)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def read_pcm(self, slot):
+        """Return (sr, int16 bytes) of one slot's record."""
+        offset, n, sr, _ = self._index[slot]
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        self._reader.seek(offset)
+        return sr, self._reader.read(n * SAMPLE_WIDTH)
+
+    def slots(self):
+        return sorted(self._index)
+
+    def seconds(self, slots=None):
+        """Audio duration of the given slots (default: all)."""
+        return sum(self._index[s][1] / self._index[s][2] for s in self._order(slots))
+
+    def _order(self, slots):
+        return [s for s in (self.slots() if slots is None else slots) if s in self._index]
+
+    def remove(self):
+        self.close()
+        self._index.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class StreamingEncoder:
+    """Feeds a chapter's buffered chunks, in slot order, into one MP3 encoder.
+
+    advance() encodes every slot that is ready and contiguous with what was
+    already sent; finish() sends the rest (skipping slots whose generation
+    failed outright) and waits for the encoder.
+    A write failure marks the stream broken and finish() re-encodes the
+    whole buffer with a fresh encoder.
+
+    Args:
+        buffer: The chapter's ChapterBuffer.
+        mp3_path: Local destination MP3.
+    """
+
+    def __init__(self, buffer, mp3_path):
+        self.buffer = buffer
+        self.mp3_path = mp3_path
+        self.next_slot = 0
+        self.broken = False
+        self._proc = None
+        self._rate = None
+
+    def _write(self, slot):
+        sr, pcm = self.buffer.read_pcm(slot)
+        if self._proc is None:
+            self._proc = open_mp3_encoder(self.mp3_path, sr)
+            self._rate = sr
+        elif sr != self._rate:
+            raise ValueError(f"chunk sample rate {sr} != chapter rate {self._rate}")
+        self._proc.stdin.write(pcm)
+
+    def advance(self, slot_keys):
+        """Encode the ready run of slots starting at next_slot."""
+        if self.broken:
+            return
+        try:
+            while (self.next_slot < len(slot_keys)
+                   and self.buffer.has(self.next_slot, slot_keys[self.next_slot])):
+                self._write(self.next_slot)
+                self.next_slot += 1
+        except (OSError, ValueError):
+            self.broken = True
+            self._kill()
+
+    def finish(self, slot_keys, timeout=None):
+        """Encode the remaining slots and wait for the MP3. Returns slots encoded."""
+        if self.broken:
+            self.abort()
+            self.next_slot = 0
+            self.broken = False
+        remaining = [slot for slot in range(self.next_slot, len(slot_keys))
+                     if self.buffer.has(slot, slot_keys[slot])]
+        if self._proc is None and not remaining:
+            raise ValueError("no chunk audio to encode")
+        for slot in remaining:
+            self._write(slot)
+        proc, self._proc = self._proc, None
+        proc.stdin.close()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, proc.args)
+        sent = self.next_slot + len(remaining)
+        self.next_slot = len(slot_keys)
+        return sent
+
+    def _kill(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        proc.kill()
+        proc.wait()
+
+    def abort(self):
+        """Stop the encoder and drop its partial MP3 (the buffer is kept)."""
+        self._kill()
+        if os.path.exists(self.mp3_path):
+            os.remove(self.mp3_path)
@@ -0,0 +1,72 @@
+"""Batch formation for TTS generate calls: fixed-size or codec-token budget.
+
+A batch decodes until its longest member finishes, so its real cost is
+``len(batch) * max(member tokens)``. With a token budget, batches are packed
+against that padded cost: many short chunks or a few long ones per call.
+"""
+
+MAX_DYNAMIC_BATCH = 32    # member cap in token-budget mode (API bound for tts_batch_size)
+VRAM_BACKOFF = 0.8        # budget multiplier after a batch overran the VRAM ceiling
+VRAM_RECOVER = 1.1        # budget multiplier after a batch stayed well under it
+VRAM_HEADROOM = 0.85      # "well under" = peak below this fraction of the ceiling
+
+
+class TokenBatcher:
+    """Forms generate-call batches from length-sorted chunk items.
+
+    With ``max_tokens`` unset, batches are fixed ``batch_size`` slices (the
+    tts_batch_size behavior). With it set, each batch is the longest run of
+    items whose padded cost fits the budget. An optional VRAM ceiling adapts
+    the budget from the peak memory reported after each batch (observe()):
+    shrink on overrun, recover towards the configured budget when there is
+    headroom.
+
+    Args:
+        estimate: fn(text) -> expected codec tokens for a chunk.
+        batch_size: Fixed batch size (fixed mode).
+        max_tokens: Padded codec-token budget per batch (token mode), or None.
+        max_vram_gb: Optional peak-VRAM ceiling in GiB (token mode only).
+    """
+
+    def __init__(self, estimate, batch_size, max_tokens=None, max_vram_gb=None):
+        self.estimate = estimate
+        self.batch_size = max(1, int(batch_size))
+        self.max_tokens = int(max_tokens) if max_tokens else None
+        self.budget = self.max_tokens
+        self.max_vram_gb = float(max_vram_gb) if max_vram_gb else None
+
+    def iter_batches(self, items):
+        """Yield batches from `items` (already sorted longest-first).
+
+        Packed lazily, so a budget change from observe() applies to the next batch.
+        """
+        i = 0
+        while i < len(items):
+            if self.budget is None:
+                n = self.batch_size
+            else:
+                longest = self.estimate(items[i]['text'])
+                n = 1
+                while (i + n < len(items) and n < MAX_DYNAMIC_BATCH
+                       and (n + 1) * longest <= self.budget):
+                    n += 1
+            yield items[i:i + n]
+            i += n
+
+    def padding_waste(self, batch):
+        """Fraction of the batch's padded token cost spent on padding."""
+        tokens = [self.estimate(it['text']) for it in batch]
+        padded = len(tokens) * max(tokens)
+        return 1 - sum(tokens) / padded if padded else 0.0
+
+    def padded_tokens(self, batch):
+        return len(batch) * max(self.estimate(it['text']) for it in batch)
+
+    def observe(self, peak_vram_gb):
+        """Adapt the token budget to the peak VRAM the last batch used."""
+        if self.budget is None or self.max_vram_gb is None or peak_vram_gb is None:
+            return
+        if peak_vram_gb > self.max_vram_gb:
+            self.budget = max(1, int(self.budget * VRAM_BACKOFF))
+        elif peak_vram_gb < self.max_vram_gb * VRAM_HEADROOM:
+            self.budget = min(self.max_tokens, int(self.budget * VRAM_RECOVER) + 1)
@@ -0,0 +1,144 @@
+"""Content-addressed cache of finished chunk WAVs, evicted LRU to a disk budget.
+
+A chunk's audio is fully determined by its text, the speaker reference files,
+the engine/model, the pause, and the post-processing applied to it, so a
+hash of those names a reusable WAV. Regenerating a chapter after a small
+text edit (or a rescrape that changed nothing) then re-synthesizes only the
+chunks whose text actually changed.
+
+Entries are 16-bit WAVs (the format chapters are assembled in).
+"""
+
+import hashlib
+import json
+import os
+
+CACHE_DIR = os.path.join('cache', 'chunks')
+DEFAULT_BUDGET_GB = 5.0
+
+_caches = {}
+
+
+def _file_sig(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def chunk_key(text, speaker_file, engine, pause, effects):
+    """Hash of everything that determines a chunk's audio.
+
+    The speaker WAV and its transcript are identified by stat signature:
+    replacing either invalidates that speaker's entries.
+    """
+    ref_text = os.path.splitext(speaker_file)[0] + '.txt'
+    payload = json.dumps({
+        'text': text,
+        'speaker': [speaker_file, _file_sig(speaker_file), _file_sig(ref_text)],
+        'engine': engine,
+        'pause': pause,
+        'effects': effects,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChunkCache:
+    """Directory of `<key>.wav` entries; recency is tracked by file mtime.
+
+    Args:
+        root: Cache directory.
+        max_bytes: Disk budget; least recently used entries are evicted past it.
+    """
+
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._size = None   # bytes on disk, scanned lazily on first store
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.wav")
+
+    def fetch(self, key):
+        """Return (wav, sr) for `key`, or None on a miss."""
+        import soundfile as sf
+        path = self._path(key)
+        try:
+            wav, sr = sf.read(path, dtype='float32')
+        except Exception:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return wav, sr
+
+    def store(self, key, wav, sr, replace=False):
+        """Add a finished chunk under `key`, then evict down to the budget.
+
+        An existing entry is kept unless `replace` (a forced re-synthesis:
+        the cached audio was the thing being regenerated).
+        """
+        import soundfile as sf
+        path = self._path(key)
+        old_size = 0
+        if os.path.exists(path):
+            if not replace:
+                return
+            old_size = os.path.getsize(path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.part'
+            sf.write(tmp_path, wav, sr, format='WAV', subtype='PCM_16')
+            os.replace(tmp_path, path)
+        except Exception:
+            return
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        else:
+            self._size += os.path.getsize(path) - old_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self):
+        """[(mtime, path, size)] for every cache entry."""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.wav'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.path, st.st_size))
+        return entries
+
+    def _evict(self):
+        """Drop least recently used entries until under 90% of the budget."""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for _, path, size in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+
+def get_chunk_cache(budget_gb=None):
+    """Shared ChunkCache for CACHE_DIR, or None when disabled (budget 0)."""
+    if budget_gb is None:
+        budget_gb = DEFAULT_BUDGET_GB
+    if float(budget_gb) <= 0:
+        return None
+    max_bytes = int(float(budget_gb) * 2**30)
+    cache = _caches.get(CACHE_DIR)
+    if cache is None:
+        cache = _caches[CACHE_DIR] = ChunkCache(CACHE_DIR, max_bytes)
+    cache.max_bytes = max_bytes
+    return cache
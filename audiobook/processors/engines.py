@@ -0,0 +1,129 @@
+"""TTS engine registry: config ``tts_engine`` name -> engine singleton class.
+
+Every engine subclasses TTSEngine: a process-wide singleton (one model per
+process, loaded on first instantiation, thread-safe so a preload thread and
+the job thread can race) that declares what it supports through capability
+flags. TTSProcessor branches on those flags instead of on engine classes.
+
+Engine modules are imported lazily, so selecting one engine never imports
+another's (GPU) dependencies.
+"""
+
+import importlib
+import sys
+import threading
+import time
+
+DEFAULT_ENGINE = 'qwen'
+
+# name -> (module, class name)
+_ENGINES = {
+    'qwen': ('audiobook.processors.tts_qwen', 'QwenTTSInstance'),
+    'coqui': ('audiobook.processors.tts_instance', 'TTSInstance'),
+    'synthetic': ('audiobook.processors.tts_synthetic', 'SyntheticTTSInstance'),
+}
+
+
+class TTSEngine:
+    """Base class and interface for TTS engine singletons.
+
+    Subclasses implement ``_init(*args)`` (load the model), ``_release()``
+    (free it) and ``tts_to_file(text, speaker_wav, file_path, language,
+    pause, ...)``, and set the flags below:
+
+        BATCHED:       tts_batch_to_files() synthesizes several texts per call.
+        IN_MEMORY:     synthesize_batch() returns (wavs, sr) without files, and
+                       accepts per-text ``postprocess`` and ``max_seconds``.
+        TOKEN_BUDGET:  estimate_tokens(text) sizes batches by a token budget.
+        REQUIRES_GPU:  loading needs CUDA.
+        CHUNK_SIZE:    default max characters per chunk.
+    """
+
+    BATCHED = False
+    IN_MEMORY = False
+    TOKEN_BUDGET = False
+    REQUIRES_GPU = True
+    CHUNK_SIZE = 250
+
+    model_id = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._inst = None
+        cls._lock = threading.Lock()
+        cls.last_load_s = None   # wall time of the most recent load (survives unload)
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            if not cls._inst:
+                t0 = time.perf_counter()
+                inst = super().__new__(cls)
+                inst._init(*args, **kwargs)
+                cls._inst = inst
+                cls.last_load_s = time.perf_counter() - t0
+            return cls._inst
+
+    def _init(self):
+        pass
+
+    def _release(self):
+        pass
+
+    @classmethod
+    def unload(cls):
+        """Free the model (and its GPU memory) if loaded."""
+        with cls._lock:
+            if cls._inst:
+                cls._inst._release()
+                cls._inst = None
+
+    def configure(self, config):
+        """Apply per-job engine options from the (series-merged) config."""
+
+    def peak_vram_gb(self):
+        """Peak VRAM (GiB) since the previous call, or None if not tracked."""
+        return None
+
+    def tts_batch_to_files(self, texts, speaker_wav, file_paths, language="en", pause=None,
+                           batch_size=5, postprocess=None, max_seconds=None):
+        """Synthesize several texts to files (one call each unless BATCHED)."""
+        for text, path in zip(texts, file_paths):
+            self.tts_to_file(text=text, speaker_wav=speaker_wav, file_path=path,
+                             language=language, pause=pause)
+
+
+def engine_names():
+    return list(_ENGINES)
+
+
+def register_engine(name, module, class_name):
+    """Make a TTSEngine subclass selectable as config ``tts_engine: <name>``."""
+    _ENGINES[name] = (module, class_name)
+
+
+def engine_class(name):
+    """Import and return the engine class for `name` (default engine if empty)."""
+    name = name or DEFAULT_ENGINE
+    if name not in _ENGINES:
+        raise ValueError(f"Unknown tts_engine '{name}'. "
+                         f"Available: {', '.join(_ENGINES)}")
+    module, class_name = _ENGINES[name]
+    return getattr(importlib.import_module(module), class_name)
+
+
+def load_engine(name, config=None):
+    """Return the loaded singleton for `name`, configured from `config`."""
+    engine = engine_class(name)()
+    if config is not None:
+        engine.configure(config)
+    return engine
+
+
+def imported_engines():
+    """Engine classes whose modules are already imported (only those can be loaded)."""
+    classes = []
+    for module, class_name in _ENGINES.values():
+        mod = sys.modules.get(module)
+        if mod is not None and hasattr(mod, class_name):
+            classes.append(getattr(mod, class_name))
+    return classes
@@ -4,9 +4,10 @@ import os
 import shutil
 import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from .tts_processor import TTSProcessor, GarbledAudioError
 from ..events import NULL_CONTEXT, EventType, JobCancelled
-from ..utils.audio import convert_to_mp3
 from ..utils.colors import PURPLE, RED, RESET
 
 
@@ -50,21 +51,152 @@ def _safe_mark_failed(db, raw_path, error):
 
 
 DEV_MAX_CHARS = 1500  # In dev mode, truncate chapters to ~2 TTS chunks
-CONVERT_TIMEOUT_S = 600  # ffmpeg WAV->MP3 encode — cap against a hang
+CONVERT_TIMEOUT_S = 600  # ffmpeg MP3 encode tail — cap against a hang
 
 
-def process_chapter(raw_path, series_cfg, output_base, tmp_dir, db=None, dev_mode=False,
-                    ctx=NULL_CONTEXT):
-    """Process a single chapter through TTS: validate, synthesize, and convert to MP3.
+def _save_spans(db, ctx, raw_path):
+    """Persist and drop the timing spans recorded for a chapter.
 
-    Args:
-        raw_path: Path to the raw chapter .txt file.
-        series_cfg: Series configuration dict (with tts_engine, pause, etc. merged in).
-        output_base: Base output directory for generated audio.
-        tmp_dir: Temporary directory for intermediate WAV chunks.
-        db: Optional ChapterDB instance for status tracking.
-        dev_mode: When True, truncate chapter to first few lines for faster runs.
-        ctx: PipelineContext for event emission and cancellation.
+    raw_path None saves the batch spans shared by several chapters. Timing is
+    best-effort: a failed write never fails the chapter.
+    """
+    spans = ctx.take_spans(raw_path)
+    if not db or not spans:
+        return
+    try:
+        db.record_timings(spans, job_id=ctx.job_id)
+    except Exception as e:
+        print(f"\t{RED}Warning: Could not record timings: {e}{RESET}")
+
+
+def _chapter_title(raw_path):
+    """Pretty chapter title from a raw path: basename sans extension and date prefix."""
+    pretty = os.path.splitext(os.path.basename(raw_path))[0]
+    return pretty.split('_', 1)[-1] if '_' in pretty else pretty
+
+
+def _handle_chapter_error(e, db, raw_path, series_name, ctx):
+    """Report a chapter failure: emit CHAPTER_FAILED and record it in the DB.
+
+    Raises NetworkError when the failure (or recording it) points at a lost
+    network share, so the caller aborts the series.
+    """
+    fname = os.path.basename(raw_path)
+    pretty = _chapter_title(raw_path)
+    _save_spans(db, ctx, raw_path)
+    if isinstance(e, GarbledAudioError):
+        ctx.emit(EventType.CHAPTER_FAILED, series=series_name, chapter=pretty,
+                 raw_path=raw_path, error=str(e))
+        if not _safe_mark_failed(db, raw_path, e):
+            raise NetworkError(f"Network share unreachable while recording failure for {fname}") from e
+        return
+    print(f"\t{RED}Error on {raw_path}: {e}{RESET}")
+    traceback.print_exc()
+    ctx.emit(EventType.CHAPTER_FAILED, series=series_name, chapter=pretty,
+             raw_path=raw_path, error=str(e))
+    db_ok = _safe_mark_failed(db, raw_path, e)
+    if _is_network_error(e) or not db_ok:
+        raise NetworkError(f"Network share unreachable: {e}") from e
+
+
+def _finalize_chapter(processor, tmp_dir, verbose, ctx=NULL_CONTEXT):
+    """Finish a synthesized chapter's streamed MP3 and move it to the share.
+
+    Most of the MP3 was already encoded while the chapter generated; this
+    sends the remaining chunks and waits for the encoder. Pure file work (no
+    DB, no events), so ChapterFinalizer can run it off the job thread.
+    Encoding happens locally and only the final file is moved to the output
+    dir (network share); cancellation checks + timeouts bound each step so a
+    stalled share write can't hang the job the way an in-place convert did.
+    """
+    t_start = time.perf_counter()
+    local_mp3 = processor.encode_mp3(timeout=CONVERT_TIMEOUT_S)
+    t_mp3 = time.perf_counter()
+    ctx.check_cancelled()
+    shutil.move(local_mp3, processor.output_path_mp3)
+    t_end = time.perf_counter()
+    processor.record_span('move', t_end - t_mp3)
+    processor.record_chapter_span()
+    if verbose:
+        print(f"\t[t] {processor.base_output_file} finalize {t_end - t_start:.0f}s: "
+              f"mp3 tail {t_mp3 - t_start:.1f}s | move-to-share {t_end - t_mp3:.1f}s")
+
+
+class ChapterFinalizer:
+    """Overlaps each chapter's merge/MP3/move tail with the next chapter's generation.
+
+    The file work runs on one background thread while the job thread keeps the
+    GPU busy. DB writes and CHAPTER_DONE/FAILED events are applied back on the
+    job thread when results are collected (SQLite connections are bound to
+    their thread), strictly in submission order, so progress events stay ordered.
+    """
+
+    MAX_PENDING = 2  # chapters waiting on the finalizer before generation blocks
+
+    def __init__(self, db=None, ctx=NULL_CONTEXT):
+        self.db = db
+        self.ctx = ctx
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job-finalize')
+        self._pending = deque()   # (future, processor, raw_path, series_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, processor, raw_path, series_name, tmp_dir, verbose):
+        """Queue a synthesized chapter for finalization (blocks if MAX_PENDING are queued)."""
+        while len(self._pending) >= self.MAX_PENDING:
+            self._collect_one()
+        future = self._pool.submit(_finalize_chapter, processor, tmp_dir, verbose)
+        self._pending.append((future, processor, raw_path, series_name))
+
+    def collect(self):
+        """Apply results of finalizations that already finished, oldest first."""
+        while self._pending and self._pending[0][0].done():
+            self._collect_one()
+
+    def drain(self):
+        """Wait for and apply every outstanding finalization."""
+        while self._pending:
+            self._collect_one()
+
+    def close(self):
+        try:
+            self.drain()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def _collect_one(self):
+        """Apply the oldest finalization's result.
+
+        Errors — the encode/move, or marking the chapter done — are recorded
+        against that chapter here. collect() runs inside the next chapter's
+        try block, where an escaping exception would fail the wrong chapter
+        and leave this one 'processing'. Only NetworkError propagates.
+        """
+        future, processor, raw_path, series_name = self._pending.popleft()
+        try:
+            future.result()
+            if self.db:
+                self.db.mark_done(raw_path, output_path=processor.output_path_mp3)
+        except Exception as e:
+            _handle_chapter_error(e, self.db, raw_path, series_name, self.ctx)
+            return
+        _save_spans(self.db, self.ctx, raw_path)
+        self.ctx.emit(EventType.CHAPTER_DONE, series=series_name,
+                      chapter=_chapter_title(raw_path), raw_path=raw_path)
+
+
+def _begin_chapter(raw_path, series_cfg, output_base, tmp_dir, db=None, dev_mode=False,
+                   ctx=NULL_CONTEXT, refresh_cache=False):
+    """Set up a chapter for synthesis: mark it processing and clean its text.
+
+    Returns the TTSProcessor, or None when the chapter's audio already exists
+    (marked done and skipped) or a remote worker holds a lease on it. Failures
+    while cleaning are reported through _handle_chapter_error and also return None.
+    `refresh_cache` bypasses the chunk cache (see TTSProcessor).
     """
     series_name = series_cfg.get('name', '')
     series_out = os.path.join(output_base, series_name)
@@ -72,92 +204,176 @@ def process_chapter(raw_path, series_cfg, output_base, tmp_dir, db=None, dev_mod
     os.makedirs(tmp_dir, exist_ok=True)
 
     processor = TTSProcessor(raw_path, series_cfg, output_dir=series_out, tmp_dir=tmp_dir,
-                             ctx=ctx)
-    fname = os.path.basename(raw_path)
-    pretty = os.path.splitext(fname)[0]
-    pretty = pretty.split('_', 1)[-1] if '_' in pretty else pretty
+                             ctx=ctx, refresh_cache=refresh_cache)
+    processor.enable_mp3_stream()
+    pretty = _chapter_title(raw_path)
 
     if processor.check_already_exists():
         if db:
             db.mark_done(raw_path)
         ctx.emit(EventType.CHAPTER_SKIPPED, series=series_name, chapter=pretty,
                  raw_path=raw_path)
-        return
+        return None
+
+    if db and not db.mark_processing(raw_path, processor.output_path):
+        # A remote worker leased it after this series' chapter list was read
+        print(f"\t{pretty}: leased to a remote worker, skipping")
+        processor.clean_up()
+        return None
 
     print(f"\n\t{PURPLE}{pretty}{RESET}")
     ctx.emit(EventType.CHAPTER_STARTED, series=series_name, chapter=pretty,
              raw_path=raw_path)
 
-    if db:
-        db.mark_processing(raw_path, processor.output_path)
     try:
-        processor.validate_file(series_cfg.get('replacements', {}))
+        with ctx.span('clean', raw_path=raw_path, series=series_name,
+                      narrator=processor.narrator):
+            processor.validate_file(series_cfg.get('replacements', {}))
         if dev_mode and processor.cleaned_file_name:
             with open(processor.cleaned_file_name, 'r', encoding='utf-8') as f:
                 text = f.read()
             if len(text) > DEV_MAX_CHARS:
                 with open(processor.cleaned_file_name, 'w', encoding='utf-8') as f:
                     f.write(text[:DEV_MAX_CHARS])
-        verbose = bool(series_cfg.get('tts_verbose'))
+    except Exception as e:
+        processor.clean_up()
+        _handle_chapter_error(e, db, raw_path, series_name, ctx)
+        return None
+    return processor
+
+
+def _complete_chapter(processor, series_cfg, tmp_dir, db=None, ctx=NULL_CONTEXT,
+                      finalizer=None):
+    """Finalize a synthesized chapter inline, or hand it to the finalizer."""
+    raw_path = processor.file_name
+    series_name = series_cfg.get('name', '')
+    verbose = bool(series_cfg.get('tts_verbose'))
+    if finalizer:
+        finalizer.submit(processor, raw_path, series_name, tmp_dir, verbose)
+        return
+    ctx.check_cancelled()
+    _finalize_chapter(processor, tmp_dir, verbose, ctx=ctx)
+    if db:
+        db.mark_done(raw_path, output_path=processor.output_path_mp3)
+    _save_spans(db, ctx, raw_path)
+    ctx.emit(EventType.CHAPTER_DONE, series=series_name, chapter=_chapter_title(raw_path),
+             raw_path=raw_path)
+
+
+def _reset_cancelled(db, raw_paths, ctx=NULL_CONTEXT):
+    """Put chapters interrupted by a cancel back to pending.
+
+    Chapter chunk buffers (tmp/<chapter>.chunks) are intentionally kept — they
+    are the resume checkpoint. Their partial timing spans are dropped.
+    """
+    for raw_path in raw_paths:
+        ctx.take_spans(raw_path)
+    if not db:
+        return
+    for raw_path in raw_paths:
+        try:
+            db.reset_chapter(raw_path)
+        except Exception:
+            pass  # worker's reset_all_processing() is the backstop
+
+
+def process_chapter(raw_path, series_cfg, output_base, tmp_dir, db=None, dev_mode=False,
+                    ctx=NULL_CONTEXT, finalizer=None, refresh_cache=False):
+    """Process a single chapter through TTS: validate, synthesize, and convert to MP3.
+
+    Args:
+        raw_path: Path to the raw chapter .txt file.
+        series_cfg: Series configuration dict (with tts_engine, pause, etc. merged in).
+        output_base: Base output directory for generated audio.
+        tmp_dir: Temporary directory for chapter chunk buffers and local MP3s.
+        db: Optional ChapterDB instance for status tracking.
+        dev_mode: When True, truncate chapter to first few lines for faster runs.
+        ctx: PipelineContext for event emission and cancellation.
+        finalizer: Optional ChapterFinalizer; when given, merge/MP3/move are handed
+            off to it and the chapter is marked done when it is collected.
+        refresh_cache: Re-synthesize every chunk instead of restoring it from the
+            chunk cache (explicit regenerate, retry of a failed chapter).
+    """
+    processor = _begin_chapter(raw_path, series_cfg, output_base, tmp_dir, db=db,
+                               dev_mode=dev_mode, ctx=ctx, refresh_cache=refresh_cache)
+    if processor is None:
+        return
+    series_name = series_cfg.get('name', '')
+    try:
         t_start = time.perf_counter()
-        processor.convert_text_to_speech()
-        t_tts = time.perf_counter()
-        # Encode the merged WAV to MP3 locally, then move only the final file to the
-        # output dir (network share). Cancellation checks + a timeout bound the step
-        # so a stalled share write can't hang the job the way an in-place convert did.
-        ctx.check_cancelled()
-        local_mp3 = os.path.join(tmp_dir, f"{processor.base_output_file}.mp3")
-        convert_to_mp3(processor.merged_wav_path, local_mp3, timeout=CONVERT_TIMEOUT_S)
-        t_mp3 = time.perf_counter()
-        ctx.check_cancelled()
-        shutil.move(local_mp3, processor.output_path_mp3)
-        if verbose:
-            t_end = time.perf_counter()
-            print(f"\t[t] chapter total {t_end - t_start:.0f}s: "
-                  f"tts {t_tts - t_start:.0f}s | mp3 {t_mp3 - t_tts:.1f}s "
-                  f"| move-to-share {t_end - t_mp3:.1f}s")
-        if db:
-            db.mark_done(raw_path, output_path=processor.output_path_mp3)
-        ctx.emit(EventType.CHAPTER_DONE, series=series_name, chapter=pretty,
-                 raw_path=raw_path)
+        processor.synthesize_chunks()
+        if series_cfg.get('tts_verbose'):
+            print(f"\t[t] chapter tts {time.perf_counter() - t_start:.0f}s")
+        _complete_chapter(processor, series_cfg, tmp_dir, db=db, ctx=ctx,
+                          finalizer=finalizer)
     except JobCancelled:
         # Must precede all other handlers: the bare `except Exception` below
-        # would otherwise mark a cancelled chapter as failed. Temp chunk WAVs
-        # in tmp/ are intentionally kept — they are the resume mechanism.
-        if db:
-            try:
-                db.reset_chapter(raw_path)
-            except Exception:
-                pass  # worker's reset_all_processing() is the backstop
+        # would otherwise mark a cancelled chapter as failed.
+        _reset_cancelled(db, [raw_path], ctx)
         raise
-    except GarbledAudioError as e:
-        ctx.emit(EventType.CHAPTER_FAILED, series=series_name, chapter=pretty,
-                 raw_path=raw_path, error=str(e))
-        if not _safe_mark_failed(db, raw_path, e):
-            raise NetworkError(f"Network share unreachable while recording failure for {fname}") from e
     except NetworkError:
         raise
     except Exception as e:
-        print(f"\t{RED}Error on {raw_path}: {e}{RESET}")
-        traceback.print_exc()
-        ctx.emit(EventType.CHAPTER_FAILED, series=series_name, chapter=pretty,
-                 raw_path=raw_path, error=str(e))
-        db_ok = _safe_mark_failed(db, raw_path, e)
-        if _is_network_error(e) or not db_ok:
-            raise NetworkError(f"Network share unreachable: {e}") from e
+        _handle_chapter_error(e, db, raw_path, series_name, ctx)
     finally:
         processor.clean_up()
 
 
+def _process_window(window, series_cfg, tmp_dir, db=None, ctx=NULL_CONTEXT, finalizer=None):
+    """Synthesize a window of begun chapters with shared batches, then complete each."""
+    series_name = series_cfg.get('name', '')
+    try:
+        t_start = time.perf_counter()
+        results = TTSProcessor.synthesize_chapters(window)
+        if series_cfg.get('tts_verbose'):
+            print(f"\t[t] {len(window)} chapter(s) tts {time.perf_counter() - t_start:.0f}s")
+        for processor, error in results:
+            if error:
+                _handle_chapter_error(error, db, processor.file_name, series_name, ctx)
+                continue
+            try:
+                _complete_chapter(processor, series_cfg, tmp_dir, db=db, ctx=ctx,
+                                  finalizer=finalizer)
+            except (JobCancelled, NetworkError):
+                raise
+            except Exception as e:
+                _handle_chapter_error(e, db, processor.file_name, series_name, ctx)
+    except JobCancelled:
+        _reset_cancelled(db, [p.file_name for p in window], ctx)
+        raise
+    except NetworkError:
+        raise
+    except Exception as e:
+        for processor in window:
+            _handle_chapter_error(e, db, processor.file_name, series_name, ctx)
+    finally:
+        for processor in window:
+            processor.clean_up()
+        _save_spans(db, ctx, None)
+
+
+DEFAULT_CHAPTER_WINDOW = 8   # max chapters pooled into one cross-chapter batch window
+WINDOW_MIN_BATCHES = 4       # a window closes once it holds this many full batches
+
+
 def process_series(input_dir, series_cfg, output_base, tmp_dir, db=None, dev_mode=False,
                    ctx=NULL_CONTEXT):
     """Process all chapter .txt files in a series directory through the TTS pipeline.
 
+    Short chapters are synthesized in windows (config ``tts_chapter_window``,
+    default 8; 1 disables): their chunks are pooled per speaker so batches
+    stay full across chapter boundaries. A window closes early once it holds
+    WINDOW_MIN_BATCHES full batches, so long chapters still go one at a time.
+
+    Generation is pipelined: while the next window synthesizes on the job
+    thread, finished chapters merge and encode on a ChapterFinalizer thread
+    (config ``tts_pipelined: false`` runs each chapter end-to-end instead).
+
     Args:
         input_dir: Directory containing raw chapter .txt files.
         series_cfg: Series configuration dict from config.yml.
         output_base: Base output directory for generated audio.
-        tmp_dir: Temporary directory for intermediate WAV chunks.
+        tmp_dir: Temporary directory for chapter chunk buffers and local MP3s.
         db: Optional ChapterDB instance for status tracking.
         dev_mode: When True, truncate chapters to first few lines for faster runs.
         ctx: PipelineContext for event emission and cancellation.
@@ -165,9 +381,11 @@ def process_series(input_dir, series_cfg, output_base, tmp_dir, db=None, dev_mod
     series_name = series_cfg.get('name', '')
 
     # Build the list of chapters to process
+    failed = set()   # retried chapters bypass the chunk cache
     if db:
         actionable = db.get_actionable(series_name)
         chapters = [ch['raw_path'] for ch in actionable]
+        failed = {ch['raw_path'] for ch in actionable if ch['status'] == 'failed'}
     else:
         chapters = []
         for root, _, files in os.walk(input_dir):
@@ -175,11 +393,49 @@ def process_series(input_dir, series_cfg, output_base, tmp_dir, db=None, dev_mod
                 if fname.endswith('.txt') and not fname.endswith('_cleaned.txt'):
                     chapters.append(os.path.join(root, fname))
 
-    for path in chapters:
-        ctx.check_cancelled()
-        try:
-            process_chapter(path, series_cfg, output_base, tmp_dir, db=db, dev_mode=dev_mode,
-                            ctx=ctx)
-        except NetworkError:
-            print(f"\n\t{RED}Aborting series '{series_name}' — network share unreachable{RESET}")
-            raise
+    max_window = max(1, int(series_cfg.get('tts_chapter_window') or DEFAULT_CHAPTER_WINDOW))
+    batch_size = int(series_cfg.get('tts_batch_size') or TTSProcessor.DEFAULT_BATCH_SIZE)
+    finalizer = (ChapterFinalizer(db=db, ctx=ctx)
+                 if series_cfg.get('tts_pipelined', True) else None)
+    window = []
+    window_chunks = 0
+    try:
+        for i, path in enumerate(chapters):
+            if not window:
+                # Chapter boundary: an interactive job (e.g. a chapter regenerate)
+                # may run here. Finished chapters are encoded first so it never
+                # races the finalizer on the same files.
+                ctx.yield_point(prepare=finalizer.drain if finalizer else None)
+            ctx.check_cancelled()
+            try:
+                processor = _begin_chapter(path, series_cfg, output_base, tmp_dir, db=db,
+                                           dev_mode=dev_mode, ctx=ctx,
+                                           refresh_cache=path in failed)
+                if processor is not None:
+                    window.append(processor)
+                    window_chunks += processor.count_pending_chunks()
+                full = window_chunks >= batch_size * WINDOW_MIN_BATCHES
+                if window and (full or len(window) >= max_window or i == len(chapters) - 1):
+                    batch, window, window_chunks = window, [], 0
+                    _process_window(batch, series_cfg, tmp_dir, db=db, ctx=ctx,
+                                    finalizer=finalizer)
+                if finalizer:
+                    finalizer.collect()
+            except JobCancelled:
+                _reset_cancelled(db, [p.file_name for p in window], ctx)
+                raise
+            except NetworkError:
+                print(f"\n\t{RED}Aborting series '{series_name}' — network share unreachable{RESET}")
+                raise
+    except BaseException:
+        # Chapters already synthesized are finished even on cancel — their
+        # audio is complete, only the encode remains. A failure doing so is
+        # logged so it does not replace the exception being raised.
+        if finalizer:
+            try:
+                finalizer.close()
+            except Exception as e:
+                print(f"\t{RED}Finishing synthesized chapters of '{series_name}' failed: {e}{RESET}")
+        raise
+    if finalizer:
+        finalizer.close()
@@ -2,9 +2,7 @@
 
 import re
 import os
-import shutil
 import time
-import wave
 import traceback
 from tqdm import tqdm
 
@@ -12,7 +10,12 @@ import nltk
 from nltk.tokenize import sent_tokenize
 from ..events import NULL_CONTEXT, EventType, JobCancelled
 from ..validators.validate_file import validate
-from ..utils.audio import adjust_volume, change_playback_speed, merge_audio, modulate_audio
+from ..utils.audio import adjust_volume, change_playback_speed, modulate_audio
+from ..utils.effects import build_chain, process_file
+from .assembly import ChapterBuffer, StreamingEncoder
+from .batching import TokenBatcher
+from .chunk_cache import chunk_key, get_chunk_cache
+from .engines import load_engine
 from ..utils.colors import RED, YELLOW, GREEN, RESET
 
 
@@ -20,34 +23,34 @@ class GarbledAudioError(Exception):
     """Raised when TTS produces garbled/abnormally long audio after retries."""
 
 
+def load_tts_engine(engine, config=None):
+    """Return the TTS singleton for config `tts_engine`, loading it on first use.
+
+    Returns (instance, default max chunk size).
+    """
+    tts = load_engine(engine, config)
+    return tts, tts.CHUNK_SIZE
+
+
 class TTSProcessor:
     """Converts a chapter text file to audio using TTS with speaker-tagged voice cloning."""
 
     DEFAULT_NARRATOR = 'onyx'
 
-    CHUNK_SIZE_COQUI = 250
-    CHUNK_SIZE_QWEN = 750
     DEFAULT_BATCH_SIZE = 5   # chunks per TTS generate call (config: tts_batch_size)
     MAX_DURATION_PER_CHAR = 0.3  # seconds per character — ~3 chars/sec is extremely slow speech
     MIN_CHUNK_DURATION = 15      # seconds — floor for very short texts
     MAX_CHUNK_RETRIES = 10
-    MERGE_TIMEOUT_S = 600        # ffmpeg concat of local chunk WAVs — cap against a hang
 
     def __init__(self, file_name, config, output_dir, tmp_dir, max_chunk_size=None,
-                 ctx=NULL_CONTEXT):
+                 ctx=NULL_CONTEXT, refresh_cache=False):
         self._ensure_nltk_data()
         self.ctx = ctx
         self.file_name = file_name
+        self.series_name = config.get('name')
         self.narrator = config.get('narrator', TTSProcessor.DEFAULT_NARRATOR)
         self.cleaned_file_name = None
-        if config.get('tts_engine') == 'qwen':
-            from .tts_qwen import QwenTTSInstance
-            self.tts = QwenTTSInstance()
-            default_chunk_size = TTSProcessor.CHUNK_SIZE_QWEN
-        else:
-            from .tts_instance import TTSInstance
-            self.tts = TTSInstance()
-            default_chunk_size = TTSProcessor.CHUNK_SIZE_COQUI
+        self.tts, default_chunk_size = load_tts_engine(config.get('tts_engine'), config)
         self.output_dir = output_dir
         self.tmp_dir = tmp_dir
         self.max_chunk_size = max_chunk_size or default_chunk_size
@@ -58,20 +61,62 @@ class TTSProcessor:
         self.will_modulate_system = self.system.get('modulate', True)
         self.batch_size = int(config.get('tts_batch_size')
                               or TTSProcessor.DEFAULT_BATCH_SIZE)
+        # Optional codec-token budget per generate call (replaces the fixed
+        # batch size) and peak-VRAM ceiling the budget adapts to
+        self.batch_tokens = config.get('tts_batch_tokens')
+        self.max_vram_gb = config.get('tts_max_vram_gb')
         self.verbose = bool(config.get('tts_verbose'))
+        # 'numpy': effects applied in memory before each chunk's single write;
+        # 'ffmpeg': legacy per-chunk ffmpeg passes (reference/fallback)
+        self.postproc_backend = config.get('audio_postproc') or 'numpy'
+        # Finished chunk WAVs reused across regenerations (None when disabled)
+        self.chunk_cache = get_chunk_cache(config.get('chunk_cache_gb'))
+        # Regenerate / failed retry: synthesize every chunk afresh and replace
+        # the cached audio, which may be what was wrong
+        self.refresh_cache = refresh_cache
+        self.engine_id = self.tts.model_id or type(self.tts).__name__
+        self._postproc_wall = 0.0
+        self._reset_timings()
+        self._t_begin = time.perf_counter()   # 'chapter' span start
+        self.audio_s = None      # chapter duration, known once assembled/encoded
+        self._slot_keys = []     # chunk key per slot (output position)
+        self._failed = None
+        self._groups = None
+        self._progress = None
+        self._chars_done = self._chars_total = 0
 
         self.base_output_file = os.path.splitext(os.path.basename(self.file_name))[0]
         self.output_path = os.path.join(self.output_dir, f"{self.base_output_file}.wav")
         self.output_path_mp3 = os.path.join(self.output_dir, f"{self.base_output_file}.mp3")
-        # Merged WAV is written locally (in tmp_dir); only the final MP3 is moved to
-        # output_dir, so a large WAV is never written/read over the network share.
-        self.merged_wav_path = os.path.join(self.tmp_dir, f"{self.base_output_file}.merged.wav")
+        # Validated chunk PCM, appended as generated; also the resume checkpoint
+        self.buffer = ChapterBuffer(os.path.join(self.tmp_dir, f"{self.base_output_file}.chunks"))
+        # Local MP3 fed chunk by chunk when streaming (see enable_mp3_stream); only
+        # the finished file is moved to output_dir, never written over the share
+        self.local_mp3_path = os.path.join(self.tmp_dir, f"{self.base_output_file}.mp3")
+        self.encoder = None
+        self._synthesized = False
 
     def _vlog(self, msg):
         """Phase-timing log line, only when config tts_verbose is set."""
         if self.verbose:
             print(f"\t[t] {msg}")
 
+    def _reset_timings(self):
+        # This chapter's share of generate calls (pooled batches are split by audio)
+        self._gen_wall = self._gen_audio = self._validate_wall = 0.0
+        self._gen_chunks = self._gen_chars = self._retries = 0
+
+    def record_span(self, name, wall_s, **fields):
+        """Record a timing span for this chapter on the pipeline context."""
+        return self.ctx.record_span(name, wall_s, raw_path=self.file_name,
+                                    series=self.series_name, narrator=self.narrator, **fields)
+
+    def record_chapter_span(self):
+        """Record the end-to-end 'chapter' span, from setup to finished audio."""
+        self.record_span('chapter', time.perf_counter() - self._t_begin, audio_s=self.audio_s,
+                         chars=self._chars_total, chunks=len(self._slot_keys),
+                         retries=self._retries)
+
     def _get_narrator_setting(self, speaker_name, key, fallback=None):
         """Look up a narrator setting, falling back to 'default' then fallback."""
         narrator_cfg = self.narrators_config.get(speaker_name, {})
@@ -80,6 +125,161 @@ class TTSProcessor:
         default_cfg = self.narrators_config.get('default', {})
         return default_cfg.get(key, fallback)
 
+    def _postprocess_chain(self, name, is_system):
+        """In-memory effect chain for one chunk (numpy backend), or None.
+
+        Returns (chain, speed): speed is the tempo factor baked into the chunk's
+        audio (by either backend), which duration validation must undo.
+        """
+        speed = self.system.get('speed', 1.0) if is_system else 1.0
+        if self.postproc_backend == 'ffmpeg':
+            return None, speed or 1.0
+        chain = build_chain(
+            volume=self._get_narrator_setting(name, 'volume'),
+            speed=speed,
+            modulate_system=is_system and self.will_modulate_system,
+        )
+        if chain is None:
+            return None, 1.0
+
+        def timed(wav, sr):
+            t0 = time.perf_counter()
+            try:
+                return chain(wav, sr)
+            finally:
+                self._postproc_wall += time.perf_counter() - t0
+        return timed, speed or 1.0
+
+    def _chunk_key(self, text, speaker_file, name, pause, is_system):
+        """Key of everything that determines one chunk's audio.
+
+        Names the chunk in the chunk cache and tags its record in the chapter
+        buffer, so a resumed chapter only reuses audio for unchanged text.
+        """
+        effects = {
+            'backend': self.postproc_backend,
+            'volume': self._get_narrator_setting(name, 'volume'),
+            'speed': self.system.get('speed', 1.0) if is_system else 1.0,
+            'modulate': bool(is_system and self.will_modulate_system),
+        }
+        return chunk_key(text, speaker_file, self.engine_id, pause, effects)
+
+    def _accept(self, it, wav, sr):
+        """Append a validated chunk to this chapter's buffer (and the chunk cache)."""
+        self.buffer.append(it['slot'], it['key'], wav, sr)
+        self._gen_audio += len(wav) / sr
+        self._gen_chunks += 1
+        self._gen_chars += it['chars']
+        if self.chunk_cache is not None:
+            self.chunk_cache.store(it['key'], wav, sr, replace=self.refresh_cache)
+        if self.encoder is not None:
+            self.encoder.advance(self._slot_keys)
+
+    def enable_mp3_stream(self):
+        """Encode to local_mp3_path while generating (required before encode_mp3).
+
+        Chunks are piped to a per-chapter encoder as soon as they and every
+        chunk before them are final; encode_mp3() sends the remainder.
+        """
+        self.encoder = StreamingEncoder(self.buffer, self.local_mp3_path)
+
+    def encode_mp3(self, timeout=None):
+        """Finish the streamed MP3 of a synthesized chapter (see enable_mp3_stream).
+
+        Touches no GPU, DB, or pipeline context, so it is safe off the job
+        thread.
+        """
+        e0 = time.perf_counter()
+        try:
+            sent = self.encoder.finish(self._slot_keys, timeout=timeout)
+        except Exception:
+            self.encoder.abort()
+            raise
+        self.audio_s = self.buffer.seconds(
+            [slot for slot, key in enumerate(self._slot_keys) if self.buffer.has(slot, key)])
+        self.buffer.remove()
+        e_wall = time.perf_counter() - e0
+        self.record_span('mp3', e_wall, audio_s=self.audio_s, chunks=sent)
+        self._vlog(f"encode tail {e_wall:.1f}s ({sent} chunks streamed)")
+        print(f"\t{GREEN}Saved!{RESET}")
+        return self.local_mp3_path
+
+    def _synthesize(self, batch, speaker_file, pause):
+        """Generate audio for chunk items, effects applied. Returns (wavs, sr).
+
+        Engines with an in-memory API return arrays directly; file-only engines
+        and the ffmpeg effects backend go through scratch WAVs in tmp_dir that
+        are read back and removed.
+        """
+        texts = [it['text'] for it in batch]
+        # Batched engines cap generation at the validation budget, so a looping
+        # member stops there (and fails validation) instead of running on until
+        # the model's token limit. The cap is per generate call — the batch's
+        # longest budget — and each member's audio is cut to its own afterwards.
+        budgets = [self._max_duration_for_text(t) for t in texts]
+        if self.tts.IN_MEMORY and self.postproc_backend != 'ffmpeg':
+            return self.tts.synthesize_batch(
+                texts=texts, speaker_wav=speaker_file, language="en", pause=pause,
+                batch_size=len(batch), postprocess=[it['postprocess'] for it in batch],
+                max_seconds=budgets)
+
+        import soundfile as sf
+        paths = [os.path.join(self.tmp_dir,
+                              f"{it['owner'].base_output_file}_scratch{it['slot']}.wav")
+                 for it in batch]
+        try:
+            if self.tts.BATCHED:
+                self.tts.tts_batch_to_files(
+                    texts=texts, speaker_wav=speaker_file, file_paths=paths, language="en",
+                    pause=pause, batch_size=len(batch),
+                    postprocess=[it['postprocess'] for it in batch], max_seconds=budgets)
+            else:
+                for it, path in zip(batch, paths):
+                    self.tts.tts_to_file(text=it['text'], speaker_wav=speaker_file,
+                                         file_path=path, language="en", pause=pause)
+                    # One in-place read/write for the whole numpy chain
+                    process_file(path, it['postprocess'])
+            wavs, sr = [], None
+            for it, path in zip(batch, paths):
+                if self.postproc_backend == 'ffmpeg':
+                    self._ffmpeg_postprocess(it, path)
+                wav, sr = sf.read(path, dtype='float32')
+                wavs.append(wav.mean(axis=1) if wav.ndim > 1 else wav)
+            return wavs, sr
+        finally:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _ffmpeg_postprocess(self, it, path):
+        """Legacy per-chunk ffmpeg effects (config audio_postproc: ffmpeg)."""
+        p0 = time.perf_counter()
+        if it['is_system']:
+            if self.will_modulate_system:
+                modulate_audio(path, self.tmp_dir)
+            if self.system.get('speed', 1.0) != 1.0:
+                change_playback_speed(path, self.system['speed'])
+        volume = self._get_narrator_setting(it['name'], 'volume')
+        if volume is not None and volume != 1.0:
+            adjust_volume(path, volume)
+        it['owner']._postproc_wall += time.perf_counter() - p0
+
+    def _batched(self):
+        return self.tts.BATCHED
+
+    def _iter_batches(self, batcher, items):
+        """Batches of `items` for one generate call each (singles if unbatched)."""
+        if self._batched():
+            return batcher.iter_batches(items)
+        return ([it] for it in items)
+
+    def _make_batcher(self):
+        """TokenBatcher for this engine: token budget if configured and supported."""
+        if not self.tts.TOKEN_BUDGET:
+            return TokenBatcher(len, self.batch_size)
+        return TokenBatcher(self.tts.estimate_tokens, self.batch_size, max_tokens=self.batch_tokens,
+                            max_vram_gb=self.max_vram_gb)
+
     def _ensure_nltk_data(self):
         try:
             nltk.data.find('tokenizers/punkt_tab')
@@ -104,18 +304,69 @@ class TTSProcessor:
         """Return True if the output WAV or MP3 already exists."""
         return os.path.exists(self.output_path) or os.path.exists(self.output_path_mp3)
 
-    def convert_text_to_speech(self):
-        """Parse speaker tags, generate TTS audio per chunk, and merge into a single WAV.
+    def synthesize_chunks(self):
+        """Generate, validate, and post-process every chunk of the chapter into its buffer.
 
-        Chunks are grouped by resolved speaker across all parts so batches stay
-        full: an alternating narrator/system chapter would otherwise degrade
-        into single-chunk batch calls at every speaker switch. Output order is
-        unaffected — the part/chunk-indexed filenames define the merge order.
+        The GPU-bound half of a chapter; encode_mp3() is the CPU/disk-bound
+        half and may run on another thread (see processing.ChapterFinalizer)
+        while the next chapter generates.
         """
-        temp_files = []
-        if self.check_already_exists():
-            return
+        self._generate_groups(self.pending_groups())
+        self.finish_synthesis()
 
+    @classmethod
+    def synthesize_chapters(cls, processors):
+        """Synthesize several chapters together so batches stay full across them.
+
+        Pending chunks of all chapters are pooled per resolved speaker before
+        batching, so short chapters and each speaker group's tail batch fill
+        up with other chapters' chunks instead of producing under-filled
+        generate calls. Each chapter keeps its own slot-indexed chunk buffer for
+        its own merge.
+
+        Returns a list of (processor, error) — error is None on success, or the
+        GarbledAudioError that failed that chapter alone.
+        """
+        groups = {}
+        for proc in processors:
+            for name, group in proc.pending_groups().items():
+                pooled = groups.setdefault(name, {**group, 'items': []})
+                pooled['items'].extend(group['items'])
+        lead = processors[0]
+        lead._generate_groups(groups, label=f"{len(processors)} chapters")
+        results = []
+        for proc in processors:
+            try:
+                proc.finish_synthesis()
+                results.append((proc, None))
+            except GarbledAudioError as e:
+                results.append((proc, e))
+        return results
+
+    def pending_groups(self):
+        """collect_chunks() for this chapter, computed once."""
+        if self._groups is None:
+            self._groups = self.collect_chunks()
+        return self._groups
+
+    def count_pending_chunks(self):
+        """Number of chunks this chapter still needs generated."""
+        return sum(len(g['items']) for g in self.pending_groups().values())
+
+    def collect_chunks(self):
+        """Split the cleaned text into chunks, grouped per resolved speaker.
+
+        Returns name -> {'speaker_file', 'pause', 'items': [...]} holding only
+        chunks that still need generating; chunks already in the chapter
+        buffer from an interrupted run are kept as-is (resume), and chunks
+        whose audio is in the chunk cache are restored from it. Sets up this
+        chapter's progress accounting.
+        """
+        self._slot_keys = []
+        self._failed = None
+        self._synthesized = False
+        self._postproc_wall = 0.0
+        self._reset_timings()
         with open(self.cleaned_file_name, 'r', encoding='utf-8') as f:
             text = f.read()
 
@@ -129,17 +380,13 @@ class TTSProcessor:
             total_chars += len(m.group(1)) if m else len(p)
 
         gui_mode = os.environ.get('AUDIOBOOK_GUI') == '1'
-        progress = tqdm(total=total_chars, desc=f"{GREEN}Progress{RESET}", unit="char",
-                        disable=gui_mode)
-        chars_done = 0
-
-        def emit_progress():
-            self.ctx.emit(EventType.CHUNK_PROGRESS, chapter=self.base_output_file,
-                          raw_path=self.file_name,
-                          chars_done=chars_done, chars_total=total_chars)
+        self._progress = tqdm(total=total_chars, desc=f"{GREEN}Progress{RESET}", unit="char",
+                              disable=gui_mode)
+        self._chars_total = total_chars
+        self._chars_done = 0
 
         # ── Collect chunks in output order, grouping work per resolved speaker ──
-        # name -> {'speaker_file', 'pause', 'items': [{'text','path','chars','is_system'}]}
+        # name -> {'speaker_file', 'pause', 'items': [{'text','path','chars','is_system',...}]}
         # is_system is per-item (not per-group): the system voice may also be a
         # regular narrator/mapping voice, and only system parts get modulated.
         groups = {}
@@ -160,37 +407,108 @@ class TTSProcessor:
                 name = self.character_speaker_mappings[name]
 
             speaker_file = os.path.join('speakers', f"{name}.wav")
+            pause = self._get_narrator_setting(name, 'pause')
 
             for cidx, chunk in enumerate(self._split_text(content)):
                 if not chunk.strip():
-                    chars_done += len(chunk)
-                    progress.update(len(chunk))
+                    self._advance(len(chunk), emit=False)
                     continue
 
-                out_wave_name = f'{self.base_output_file}_part{idx}_{name}_{cidx}.wav'
-                out_wav_path = os.path.join(self.tmp_dir, out_wave_name)
-                temp_files.append(out_wav_path)
-                if os.path.exists(out_wav_path):
+                text_in = chunk.strip('<>').strip()
+                key = self._chunk_key(text_in, speaker_file, name, pause, is_system)
+                slot = len(self._slot_keys)
+                self._slot_keys.append(key)
+                if self.buffer.has(slot, key):
                     # Resume: chunk already generated (and post-processed) earlier
-                    chars_done += len(chunk)
-                    progress.update(len(chunk))
+                    self._advance(len(chunk), emit=False)
+                    continue
+                cached = (self.chunk_cache.fetch(key)
+                          if self.chunk_cache and not self.refresh_cache else None)
+                if cached is not None:
+                    # Unchanged chunk from an earlier generation of this text
+                    self.buffer.append(slot, key, *cached)
+                    self._advance(len(chunk), emit=False)
                     continue
 
                 group = groups.setdefault(name, {
                     'speaker_file': speaker_file,
-                    'pause': self._get_narrator_setting(name, 'pause'),
+                    'pause': pause,
                     'items': [],
                 })
+                postprocess, speed = self._postprocess_chain(name, is_system)
                 group['items'].append({
-                    'text': chunk.strip('<>').strip(),
-                    'path': out_wav_path,
+                    'text': text_in,
+                    'slot': slot,
+                    'key': key,
+                    'name': name,
                     'chars': len(chunk),
                     'is_system': is_system,
+                    'postprocess': postprocess,
+                    'speed': speed,
+                    'owner': self,
                 })
+        if self.encoder is not None:
+            self.encoder.advance(self._slot_keys)   # resumed / cached leading chunks
+        return groups
+
+    def _advance(self, chars, emit=True):
+        """Credit generated (or skipped) chars to this chapter's progress."""
+        self._chars_done += chars
+        self._progress.update(chars)
+        if emit:
+            self.ctx.emit(EventType.CHUNK_PROGRESS, chapter=self.base_output_file,
+                          raw_path=self.file_name,
+                          chars_done=self._chars_done, chars_total=self._chars_total)
 
-        # ── Generate per speaker: full batches instead of per-part fragments ──
-        batch_size = self.batch_size
-        gen_wall = gen_audio = validate_wall = postproc_wall = 0.0
+    def _fail_garbled(self, text):
+        """Record that this chapter's TTS stayed garbled after all retries.
+
+        Drops its chunk buffer; the error is raised from finish_synthesis() so
+        other chapters sharing the batches can complete.
+        """
+        preview = text[:200] + ("..." if len(text) > 200 else "")
+        msg = (
+            f"TTS produced garbled audio after {self.MAX_CHUNK_RETRIES} retries. "
+            f"Problem text: {preview}"
+        )
+        self._progress.write(
+            f"\t{RED}Skipping chapter '{self.base_output_file}' — "
+            f"TTS produced garbled audio after {self.MAX_CHUNK_RETRIES} retries.{RESET}\n"
+            f"\t{YELLOW}Problem text: {preview}{RESET}")
+        if self.encoder is not None:
+            self.encoder.abort()
+        self.buffer.remove()
+        self._failed = GarbledAudioError(msg)
+
+    def finish_synthesis(self):
+        """Close this chapter's progress and record its generation spans.
+
+        Raises the chapter's GarbledAudioError, if any.
+        """
+        self._progress.close()
+        self.buffer.close()
+        if self._gen_wall:
+            self.record_span('generate', self._gen_wall, audio_s=self._gen_audio,
+                             chars=self._gen_chars, chunks=self._gen_chunks,
+                             retries=self._retries)
+            self.record_span('validate', self._validate_wall)
+            self.record_span('postproc', self._postproc_wall)
+        if self._failed:
+            raise self._failed
+        self._synthesized = True
+
+    def _generate_groups(self, groups, label=None):
+        """Generate, validate, and buffer grouped chunk items.
+
+        Items may belong to several chapters ('owner'); progress, failures, and
+        buffered audio are attributed to each item's owner. Each batch is
+        validated as soon as it is generated, so only one batch of audio is
+        held in memory. A chapter that fails validation drops out of the
+        remaining batches.
+        """
+        batcher = self._make_batcher()
+        batched = self._batched()
+        gen_wall = gen_audio = validate_wall = 0.0
         for name, group in groups.items():
             self.ctx.check_cancelled()
             speaker_file = group['speaker_file']
@@ -198,106 +516,71 @@ class TTSProcessor:
             # Similar-length chunks batch together: a batch decodes until its
             # longest member finishes, so homogeneous batches waste less time.
             # Descending, so the under-filled tail batch (worst amortization)
-            # gets the shortest, cheapest chunks.
-            items = sorted(group['items'], key=lambda it: len(it['text']), reverse=True)
+            # gets the shortest, cheapest chunks — and in token-budget mode
+            # each batch is sized by its longest (first) member.
+            items = sorted((it for it in group['items'] if not it['owner']._failed),
+                           key=lambda it: len(it['text']), reverse=True)
+            if not items:
+                continue
 
             try:
-                if hasattr(self.tts, 'tts_batch_to_files'):
-                    for i in range(0, len(items), batch_size):
-                        self.ctx.check_cancelled()
-                        batch = items[i:i + batch_size]
-                        b0 = time.perf_counter()
-                        self.tts.tts_batch_to_files(
-                            texts=[it['text'] for it in batch], speaker_wav=speaker_file,
-                            file_paths=[it['path'] for it in batch], language="en", pause=pause,
-                            batch_size=batch_size)
-                        b_wall = time.perf_counter() - b0
-                        b_audio = sum(self._get_wav_duration(it['path']) for it in batch)
-                        gen_wall += b_wall
-                        gen_audio += b_audio
-                        if b_audio:
-                            self._vlog(f"gen {name} n={len(batch)}: {b_audio:.0f}s audio "
-                                       f"/ {b_wall:.1f}s wall (RT {b_wall/b_audio:.2f})")
-                        done = sum(it['chars'] for it in batch)
-                        chars_done += done
-                        progress.update(done)
-                        emit_progress()
-                else:
-                    for it in items:
-                        self.ctx.check_cancelled()
-                        self.tts.tts_to_file(text=it['text'], speaker_wav=speaker_file,
-                                             file_path=it['path'], language="en", pause=pause)
-                        chars_done += it['chars']
-                        progress.update(it['chars'])
-                        emit_progress()
+                garbled = []
+                for batch in self._iter_batches(batcher, items):
+                    self.ctx.check_cancelled()
+                    batch = [it for it in batch if not it['owner']._failed]
+                    if not batch:
+                        continue
+                    b0 = time.perf_counter()
+                    wavs, sr = self._synthesize(batch, speaker_file, pause)
+                    b_wall = time.perf_counter() - b0
+                    peak = self.tts.peak_vram_gb()
+                    batcher.observe(peak)
+                    b_audio = sum(len(w) for w in wavs) / sr if sr else 0.0
+                    gen_wall += b_wall
+                    gen_audio += b_audio
+                    if b_audio and batched:
+                        extra = ""
+                        if self.tts.TOKEN_BUDGET:
+                            extra += (f" | ~{batcher.padded_tokens(batch)} tok "
+                                      f"pad {batcher.padding_waste(batch):.0%}")
+                        if peak is not None:
+                            extra += f" | vram {peak:.1f}GB"
+                        self._vlog(f"gen {name} n={len(batch)}: {b_audio:.0f}s audio "
+                                   f"/ {b_wall:.1f}s wall (RT {b_wall/b_audio:.2f}){extra}")
+
+                    # Validate chunk durations; abnormally long ones are
+                    # retried together once the group's batches are done
+                    v0 = time.perf_counter()
+                    garbled += self._validate_chunk_durations(batch, wavs, sr)
+                    v_wall = time.perf_counter() - v0
+                    validate_wall += v_wall
+                    self._record_batch('batch', batch, wavs, sr, b_wall, v_wall)
+                    for it in batch:
+                        it['owner']._advance(it['chars'])
+                v0 = time.perf_counter()
+                self._retry_garbled(garbled, batcher, speaker_file, pause)
+                validate_wall += time.perf_counter() - v0
             except JobCancelled:
                 # Re-raise before the generic handler below can swallow it
-                progress.close()
+                for owner in {it['owner'] for it in group['items']}:
+                    owner._progress.close()
+                    if owner.encoder is not None:
+                        owner.encoder.abort()
+                    owner.buffer.close()
                 raise
             except Exception as e:
-                progress.write(f"\t{RED}Error on TTS: {e}{RESET}")
+                # Chunks that failed are simply missing from their buffers;
+                # continue with other speakers
+                self._progress.write(f"\t{RED}Error on TTS: {e}{RESET}")
                 traceback.print_exc()
-                # Remove paths for chunks that failed; continue with other speakers
-                missing = {it['path'] for it in items if not os.path.exists(it['path'])}
-                temp_files = [f for f in temp_files if f not in missing]
                 continue
-
-            # Validate chunk durations — retry abnormally long ones
-            v0 = time.perf_counter()
-            failed_text = self._validate_chunk_durations(
-                [it['text'] for it in items], [it['path'] for it in items],
-                speaker_file, pause)
-            validate_wall += time.perf_counter() - v0
-            if failed_text:
-                preview = failed_text[:200] + ("..." if len(failed_text) > 200 else "")
-                progress.close()
-                msg = (
-                    f"TTS produced garbled audio after {self.MAX_CHUNK_RETRIES} retries. "
-                    f"Problem text: {preview}"
-                )
-                print(
-                    f"\t{RED}Skipping chapter '{self.base_output_file}' — "
-                    f"TTS produced garbled audio after {self.MAX_CHUNK_RETRIES} retries.{RESET}\n"
-                    f"\t{YELLOW}Problem text: {preview}{RESET}")
-                for f in temp_files:
-                    if os.path.exists(f):
-                        os.remove(f)
-                raise GarbledAudioError(msg)
-
-            # Post-process chunks (system modulation + per-narrator volume)
-            p0 = time.perf_counter()
-            volume = self._get_narrator_setting(name, 'volume')
-            for it in items:
-                if not os.path.exists(it['path']):
-                    continue
-                if it['is_system']:
-                    if self.will_modulate_system:
-                        modulate_audio(it['path'], self.tmp_dir)
-                    if self.system.get('speed', 1.0) != 1.0:
-                        change_playback_speed(it['path'], self.system['speed'])
-                if volume is not None and volume != 1.0:
-                    adjust_volume(it['path'], volume)
-            postproc_wall += time.perf_counter() - p0
-        progress.close()
-
         self.ctx.check_cancelled()
-        # Merge into the local tmp WAV; process_chapter encodes it to MP3 locally
-        # and moves only that final file to the (network) output dir.
-        m0 = time.perf_counter()
-        if len(temp_files) > 1 and merge_audio(temp_files, self.merged_wav_path,
-                                               timeout=self.MERGE_TIMEOUT_S):
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-        else:
-            shutil.move(temp_files[0], self.merged_wav_path)
-        merge_wall = time.perf_counter() - m0
         if gen_audio:
-            self._vlog(f"chapter: gen {gen_wall:.0f}s for {gen_audio:.0f}s audio "
+            owners = {it['owner'] for g in groups.values() for it in g['items']}
+            postproc_wall = sum(o._postproc_wall for o in owners)
+            self._vlog(f"{label or 'chapter'}: gen {gen_wall:.0f}s for {gen_audio:.0f}s audio "
                        f"(RT {gen_wall/gen_audio:.2f}) | validate {validate_wall:.1f}s "
-                       f"| postproc {postproc_wall:.1f}s "
-                       f"| merge {len(temp_files)} chunks {merge_wall:.1f}s")
-        print(f"\t{GREEN}Saved!{RESET}")
+                       f"| postproc {postproc_wall:.1f}s")
 
     def _split_text(self, text):
       """Split text into chunks up to max_chunk_size, breaking on sentence boundaries."""
@@ -340,53 +623,98 @@ class TTSProcessor:
       return chunks
 
 
-    def _get_wav_duration(self, path):
-        """Return the duration of a WAV file in seconds, or 0 on error."""
-        try:
-            with wave.open(path, 'r') as w:
-                return w.getnframes() / w.getframerate()
-        except Exception:
-            return 0
-
     def _max_duration_for_text(self, text):
         """Return the maximum plausible audio duration for a chunk of text."""
         return max(self.MIN_CHUNK_DURATION, len(text) * self.MAX_DURATION_PER_CHAR)
 
-    def _validate_chunk_durations(self, pending_texts, pending_paths, speaker_file, pause):
-        """Retry chunks whose audio is abnormally long (model hallucination).
-        Returns the failed text on first unrecoverable failure, or None if all OK."""
-        for text, path in zip(pending_texts, pending_paths):
-            if not os.path.exists(path):
-                continue
-            duration = self._get_wav_duration(path)
-            max_dur = self._max_duration_for_text(text)
-            if duration <= max_dur:
+    def _validate_chunk_durations(self, batch, wavs, sr):
+        """Append chunks of plausible duration to their chapter's buffer.
+
+        Returns the items whose audio is abnormally long (model hallucination),
+        for _retry_garbled(). Durations are measured at the model's tempo: a
+        chunk whose effect chain already time-stretched it is scaled back by
+        its 'speed'.
+        """
+        garbled = []
+        for it, wav in zip(batch, wavs):
+            if it['owner']._failed:
                 continue
+            duration = len(wav) / sr * it['speed']
+            max_dur = self._max_duration_for_text(it['text'])
+            if duration > max_dur:
+                tqdm.write(f"\t{YELLOW}Chunk too long ({duration:.1f}s, "
+                           f"expected <{max_dur:.0f}s){RESET}")
+                garbled.append(it)
+            else:
+                it['owner']._accept(it, wav, sr)
+        return garbled
 
-            ok = False
-            for attempt in range(1, self.MAX_CHUNK_RETRIES + 1):
-                tqdm.write(
-                    f"\t{YELLOW}Chunk too long ({duration:.1f}s, expected <{max_dur:.0f}s), "
-                    f"retrying ({attempt}/{self.MAX_CHUNK_RETRIES})...{RESET}")
-                os.remove(path)
+    def _record_batch(self, name, batch, wavs, sr, wall, validate_wall):
+        """Record one generate call as a 'batch'/'retry' span and split its cost.
+
+        Each member's chapter is charged a share of the wall and validation
+        time proportional to its audio, so chapters pooled into one batch
+        each get their own 'generate' timing.
+        """
+        audio = [len(w) / sr if sr else 0.0 for w in wavs]
+        total = sum(audio)
+        for it, seconds in zip(batch, audio):
+            share = seconds / total if total else 1 / len(batch)
+            owner = it['owner']
+            owner._gen_wall += wall * share
+            owner._validate_wall += validate_wall * share
+            if name == 'retry':
+                owner._retries += 1
+        owners = {it['owner'] for it in batch}
+        self.ctx.record_span(
+            name, wall, raw_path=batch[0]['owner'].file_name if len(owners) == 1 else None,
+            series=self.series_name, narrator=batch[0]['name'], audio_s=total,
+            chars=sum(it['chars'] for it in batch), chunks=len(batch),
+            retries=len(batch) if name == 'retry' else 0)
+
+    def _retry_garbled(self, items, batcher, speaker_file, pause):
+        """Re-synthesize garbled chunks together, up to MAX_CHUNK_RETRIES rounds.
+
+        Each round batches only the chunks that are still failing, so a chapter
+        with a few hallucinating chunks costs a couple of extra batch calls
+        rather than one call per chunk per attempt. A chunk still garbled after
+        the last round fails its chapter (the rest of a failed chapter is not
+        worth retrying).
+        """
+        pending = items
+        for attempt in range(1, self.MAX_CHUNK_RETRIES + 1):
+            pending = [it for it in pending if not it['owner']._failed]
+            if not pending:
+                return
+            tqdm.write(f"\t{YELLOW}Retrying {len(pending)} garbled chunk(s) "
+                       f"({attempt}/{self.MAX_CHUNK_RETRIES})...{RESET}")
+            still = []
+            pending.sort(key=lambda it: len(it['text']), reverse=True)
+            for batch in self._iter_batches(batcher, pending):
+                self.ctx.check_cancelled()
+                b0 = time.perf_counter()
                 try:
-                    self.tts.tts_to_file(
-                        text=text, speaker_wav=speaker_file,
-                        file_path=path, language="en", pause=pause)
+                    wavs, sr = self._synthesize(batch, speaker_file, pause)
+                except JobCancelled:
+                    raise
                 except Exception:
-                    break
-                duration = self._get_wav_duration(path)
-                if duration <= max_dur:
-                    ok = True
-                    break
-
-            if not ok:
-                if os.path.exists(path):
-                    os.remove(path)
-                return text
-        return None
+                    # Retry call itself failed: give up on these chunks
+                    for it in batch:
+                        if not it['owner']._failed:
+                            it['owner']._fail_garbled(it['text'])
+                    continue
+                b_wall = time.perf_counter() - b0
+                v0 = time.perf_counter()
+                still += self._validate_chunk_durations(batch, wavs, sr)
+                self._record_batch('retry', batch, wavs, sr, b_wall, time.perf_counter() - v0)
+            pending = still
+        for it in pending:
+            if not it['owner']._failed:
+                it['owner']._fail_garbled(it['text'])
 
     def clean_up(self):
-        """Remove the temporary cleaned text file if it exists."""
+        """Remove the temporary cleaned text file; stop an encode nothing will finish."""
         if self.cleaned_file_name and os.path.exists(self.cleaned_file_name):
-            os.remove(self.cleaned_file_name)
\ No newline at end of file
+            os.remove(self.cleaned_file_name)
+        if self.encoder is not None and not self._synthesized:
+            self.encoder.abort()
\ No newline at end of file
@@ -1,10 +1,13 @@
 """Singleton wrapper around the Qwen3 TTS Base model for GPU-accelerated voice-cloned speech synthesis."""
 
+import hashlib
 import os
+import re
 import numpy as np
 import torch
 import soundfile as sf
 from ..utils.colors import YELLOW, RESET
+from .engines import TTSEngine
 
 LANGUAGE_MAP = {
     "en": "English",
@@ -20,17 +23,23 @@ LANGUAGE_MAP = {
 }
 
 
-class QwenTTSInstance:
+MODEL_ID = "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
+DEVICE = "cuda:0"
+PROMPT_CACHE_DIR = os.path.join('cache', 'voice_prompts')
+PROMPT_KEY_LEN = 24   # hex digits of the prompt key in cache file names
+
+
+class QwenTTSInstance(TTSEngine):
     """Singleton Qwen3 TTS model loaded once on GPU and shared across all processing."""
 
-    _inst = None
+    BATCHED = True
+    IN_MEMORY = True
+    TOKEN_BUDGET = True
+    CHUNK_SIZE = 750
+    model_id = MODEL_ID
     CODEC_FPS = 12  # 12Hz model: 12 codec tokens per second of audio
-
-    def __new__(cls):
-        if not cls._inst:
-            cls._inst = super().__new__(cls)
-            cls._inst._init()
-        return cls._inst
+    TYPICAL_SEC_PER_CHAR = 0.07  # ~14 chars/sec: normal narration pace
+    CAP_MARGIN_S = 1.0           # generation cap past the caller's duration budget
 
     def _init(self):
         import contextlib, io, os as _os
@@ -44,8 +53,8 @@ class QwenTTSInstance:
             with contextlib.redirect_stderr(io.StringIO()), contextlib.redirect_stdout(io.StringIO()):
                 from qwen_tts import Qwen3TTSModel
                 self.model = Qwen3TTSModel.from_pretrained(
-                    "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
-                    device_map="cuda:0",
+                    MODEL_ID,
+                    device_map=DEVICE,
                     dtype=torch.bfloat16,
                 )
         finally:
@@ -55,27 +64,93 @@ class QwenTTSInstance:
         gen_cfg = self.model.model.generation_config
         if gen_cfg.pad_token_id is None and gen_cfg.eos_token_id is not None:
             gen_cfg.pad_token_id = gen_cfg.eos_token_id
-        self._prompt_cache = {}
+        self._prompt_cache = {}     # content key -> prompt
+        self._prompt_keys = {}      # speaker_wav -> (file stat signature, content key)
 
-    @classmethod
-    def unload(cls):
+    def _release(self):
         """Free the model and release GPU memory."""
-        if cls._inst:
-            del cls._inst.model
-            cls._inst._prompt_cache.clear()
-            cls._inst = None
-            torch.cuda.empty_cache()
+        del self.model
+        self._prompt_cache.clear()    # on-disk PROMPT_CACHE_DIR survives
+        torch.cuda.empty_cache()
+
+    @staticmethod
+    def _stat_sig(path):
+        try:
+            st = os.stat(path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _prompt_key(self, speaker_wav, ref_text_path):
+        """Content hash of the speaker WAV + transcript (+ model), memoized per stat.
+
+        Editing or replacing either file changes the key, which invalidates
+        both the in-memory and the on-disk prompt.
+        """
+        sig = (self._stat_sig(speaker_wav), self._stat_sig(ref_text_path))
+        cached = self._prompt_keys.get(speaker_wav)
+        if cached and cached[0] == sig:
+            return cached[1]
+        h = hashlib.sha256(MODEL_ID.encode())
+        for path in (speaker_wav, ref_text_path):
+            h.update(b'\0')
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+        key = h.hexdigest()[:PROMPT_KEY_LEN]
+        self._prompt_keys[speaker_wav] = (sig, key)
+        return key
+
+    def _prompt_cache_path(self, speaker_wav, key):
+        name = os.path.splitext(os.path.basename(speaker_wav))[0]
+        return os.path.join(PROMPT_CACHE_DIR, f"{name}-{key}.pt")
+
+    def _load_cached_prompt(self, path):
+        """Load a serialized prompt from disk, or None if absent/unreadable."""
+        if not os.path.isfile(path):
+            return None
+        try:
+            return torch.load(path, map_location=DEVICE, weights_only=False)
+        except Exception:
+            return None  # corrupt/incompatible entry: recompute and overwrite
+
+    def _save_cached_prompt(self, path, prompt):
+        """Persist a prompt atomically, replacing stale entries for the same speaker."""
+        try:
+            os.makedirs(PROMPT_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.part'
+            torch.save(prompt, tmp_path)
+            os.replace(tmp_path, path)
+            # Exactly `{stem}-{key}.pt`: a prefix glob would also match (and
+            # delete) another speaker's prompts, e.g. 'bob-old-…' for 'bob'
+            stem = os.path.basename(path).rsplit('-', 1)[0]
+            own = re.compile(re.escape(stem) + r'-[0-9a-f]{%d}\.pt' % PROMPT_KEY_LEN)
+            for name in os.listdir(PROMPT_CACHE_DIR):
+                old = os.path.join(PROMPT_CACHE_DIR, name)
+                if own.fullmatch(name) and old != path:
+                    os.remove(old)
+        except OSError as e:
+            print(f"\t{YELLOW}Warning: could not cache voice prompt: {e}{RESET}")
 
     def _get_voice_clone_prompt(self, speaker_wav):
         """Build or retrieve a cached voice clone prompt for the given speaker WAV.
 
         Uses reference text transcript if available, otherwise falls back to
-        x-vector-only mode (lower quality).
+        x-vector-only mode (lower quality). Prompts persist in PROMPT_CACHE_DIR
+        keyed by the WAV + transcript contents, so a freshly loaded model (every
+        new job after an unload) skips re-encoding unchanged speakers.
         """
-        if speaker_wav in self._prompt_cache:
-            return self._prompt_cache[speaker_wav]
-
         ref_text_path = os.path.splitext(speaker_wav)[0] + ".txt"
+        key = self._prompt_key(speaker_wav, ref_text_path)
+        if key in self._prompt_cache:
+            return self._prompt_cache[key]
+
+        cache_path = self._prompt_cache_path(speaker_wav, key)
+        prompt = self._load_cached_prompt(cache_path)
+        if prompt is not None:
+            self._prompt_cache[key] = prompt
+            return prompt
+
         if os.path.isfile(ref_text_path):
             with open(ref_text_path, "r", encoding="utf-8") as f:
                 ref_text = f.read().strip()
@@ -94,7 +169,8 @@ class QwenTTSInstance:
                 x_vector_only_mode=True,
             )
 
-        self._prompt_cache[speaker_wav] = prompt
+        self._prompt_cache[key] = prompt
+        self._save_cached_prompt(cache_path, prompt)
         return prompt
 
     def _estimate_max_tokens(self, text):
@@ -102,47 +178,111 @@ class QwenTTSInstance:
 
         The 12Hz model's default max_new_tokens (8192) allows ~682s of audio,
         which lets the model loop endlessly on short inputs. This caps generation
-        proportionally as a backstop; the actual garbled-audio detection in
-        TTSProcessor uses a tighter per-chunk duration threshold.
+        proportionally as a backstop for callers that pass no duration budget.
         """
         max_seconds = max(60, len(text) * 0.3)
         return int(max_seconds * self.CODEC_FPS)
 
+    def _max_tokens(self, text, max_seconds=None):
+        """Generation cap for one text: its duration budget, else the backstop.
+
+        The cap sits CAP_MARGIN_S past the budget, so a member cut off by it
+        comes back just over budget and the caller's duration check flags it
+        for retry — instead of decoding up to a minute of looping audio that
+        would be thrown away anyway.
+        """
+        if max_seconds is None:
+            return self._estimate_max_tokens(text)
+        return int((max_seconds + self.CAP_MARGIN_S) * self.CODEC_FPS)
+
+    def estimate_tokens(self, text):
+        """Expected codec tokens for `text` at a normal narration pace.
+
+        Same CODEC_FPS model as _estimate_max_tokens, but the typical length
+        rather than the hallucination cap — what TokenBatcher packs against.
+        """
+        return max(1, int(len(text) * self.TYPICAL_SEC_PER_CHAR * self.CODEC_FPS))
+
+    def peak_vram_gb(self):
+        """Peak allocated VRAM (GiB) since the previous call, then reset the counter."""
+        peak = torch.cuda.max_memory_allocated() / 2**30
+        torch.cuda.reset_peak_memory_stats()
+        return peak
+
     def _pad_silence(self, wav, sr, pause):
         """Append silence of `pause` seconds to the waveform, if specified."""
         if pause:
             return np.concatenate([wav, np.zeros(int(sr * pause), dtype=wav.dtype)])
         return wav
 
-    def tts_to_file(self, text, speaker_wav, file_path, language="en", pause=None, **kwargs):
-        """Synthesize a single text string and write the result to a WAV file."""
-        lang = LANGUAGE_MAP.get(language, language)
-        prompt = self._get_voice_clone_prompt(speaker_wav)
+    def _finish(self, wav, sr, pause, postprocess):
+        """Pad trailing silence, then run the in-memory post-processing chain."""
+        wav = self._pad_silence(wav, sr, pause)
+        return postprocess(wav, sr) if postprocess else wav
 
-        wavs, sr = self.model.generate_voice_clone(
-            text=text,
-            language=lang,
-            voice_clone_prompt=prompt,
-            max_new_tokens=self._estimate_max_tokens(text),
-        )
-        sf.write(file_path, self._pad_silence(wavs[0], sr, pause), sr)
+    def synthesize(self, text, speaker_wav, language="en", pause=None, postprocess=None,
+                   max_seconds=None):
+        """Synthesize a single text string. Returns (wav, sr).
 
-    def tts_batch_to_files(self, texts, speaker_wav, file_paths, language="en", pause=None, batch_size=5):
-        """Synthesize multiple texts in batches and write each result to its corresponding WAV file."""
+        `postprocess` is an optional fn(wav, sr) -> wav applied to the result;
+        `max_seconds` an optional duration budget capping generation.
+        """
+        wavs, sr = self.synthesize_batch([text], speaker_wav, language=language, pause=pause,
+                                         batch_size=1,
+                                         postprocess=[postprocess] if postprocess else None,
+                                         max_seconds=[max_seconds] if max_seconds else None)
+        return wavs[0], sr
+
+    def synthesize_batch(self, texts, speaker_wav, language="en", pause=None, batch_size=5,
+                         postprocess=None, max_seconds=None):
+        """Synthesize multiple texts in batches. Returns (list of wavs, sr).
+
+        `postprocess` is an optional per-text list of fn(wav, sr) -> wav (or None).
+        `max_seconds` is an optional per-text list of duration budgets (model
+        tempo, before pause/effects); each generate call is capped at its
+        members' largest budget (see _max_tokens). qwen_tts does not forward
+        stopping criteria to the talker, so a member cannot be stopped at its
+        own budget mid-batch; instead its audio is cut to that cap afterwards,
+        so every member comes back at most CAP_MARGIN_S over its own budget
+        (and is flagged for retry) whatever its siblings' budgets.
+        """
         lang = LANGUAGE_MAP.get(language, language)
         prompt = self._get_voice_clone_prompt(speaker_wav)
 
+        results = []
+        sr = None
         for i in range(0, len(texts), batch_size):
             batch_texts = texts[i:i + batch_size]
-            batch_paths = file_paths[i:i + batch_size]
+            batch_post = postprocess[i:i + batch_size] if postprocess else [None] * len(batch_texts)
+            batch_budget = (max_seconds[i:i + batch_size] if max_seconds
+                            else [None] * len(batch_texts))
             langs = [lang] * len(batch_texts)
 
-            max_tokens = max(self._estimate_max_tokens(t) for t in batch_texts)
+            max_tokens = max(self._max_tokens(t, b) for t, b in zip(batch_texts, batch_budget))
             wavs, sr = self.model.generate_voice_clone(
-                text=batch_texts,
-                language=langs,
+                text=batch_texts if len(batch_texts) > 1 else batch_texts[0],
+                language=langs if len(batch_texts) > 1 else lang,
                 voice_clone_prompt=prompt,
                 max_new_tokens=max_tokens,
             )
-            for wav, path in zip(wavs, batch_paths):
-                sf.write(path, self._pad_silence(wav, sr, pause), sr)
+            for wav, post, budget in zip(wavs, batch_post, batch_budget):
+                if budget is not None:
+                    wav = wav[:int(self._max_tokens(None, budget) / self.CODEC_FPS * sr)]
+                results.append(self._finish(wav, sr, pause, post))
+        return results, sr
+
+    def tts_to_file(self, text, speaker_wav, file_path, language="en", pause=None,
+                    postprocess=None, max_seconds=None, **kwargs):
+        """Synthesize a single text string and write the result to a WAV file."""
+        wav, sr = self.synthesize(text, speaker_wav, language=language, pause=pause,
+                                  postprocess=postprocess, max_seconds=max_seconds)
+        sf.write(file_path, wav, sr)
+
+    def tts_batch_to_files(self, texts, speaker_wav, file_paths, language="en", pause=None, batch_size=5,
+                           postprocess=None, max_seconds=None):
+        """Synthesize multiple texts in batches and write each result to its corresponding WAV file."""
+        wavs, sr = self.synthesize_batch(texts, speaker_wav, language=language, pause=pause,
+                                         batch_size=batch_size, postprocess=postprocess,
+                                         max_seconds=max_seconds)
+        for wav, path in zip(wavs, file_paths):
+            sf.write(path, wav, sr)
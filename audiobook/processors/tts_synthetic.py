@@ -0,0 +1,98 @@
+"""Deterministic CPU stand-in TTS engine for load tests, profiling, and benchmarks.
+
+Produces a voiced tone with a little noise whose pitch depends on the speaker
+and whose length follows the text at a normal narration pace, so everything
+around the model — scraping, cleaning, chunking, batching, validation,
+assembly, and encoding — can be exercised without a GPU. Output for a given
+(text, speaker) is identical across runs.
+
+Config (under ``config:``, with ``tts_engine: synthetic``):
+    synthetic_rtf: Seconds of wall time per second of audio to simulate
+        (default 0: as fast as possible). A batch sleeps for its longest
+        member, like a batched decode.
+"""
+
+import hashlib
+import os
+import time
+
+import numpy as np
+import soundfile as sf
+
+from .engines import TTSEngine
+
+SAMPLE_RATE = 24000
+
+
+def _seed(*parts):
+    return int.from_bytes(hashlib.sha256('\0'.join(parts).encode('utf-8')).digest()[:8],
+                          'little')
+
+
+class SyntheticTTSInstance(TTSEngine):
+    """Singleton synthetic engine (CPU only; see module docstring)."""
+
+    BATCHED = True
+    IN_MEMORY = True
+    TOKEN_BUDGET = True
+    REQUIRES_GPU = False
+    CHUNK_SIZE = 750
+    CODEC_FPS = 12               # token model shared with the Qwen engine
+    TYPICAL_SEC_PER_CHAR = 0.07
+    model_id = 'synthetic-v1'
+
+    def _init(self):
+        self.rtf = 0.0
+
+    def configure(self, config):
+        self.rtf = float(config.get('synthetic_rtf') or 0.0)
+
+    def estimate_tokens(self, text):
+        return max(1, int(len(text) * self.TYPICAL_SEC_PER_CHAR * self.CODEC_FPS))
+
+    def _voice(self, text, speaker_wav, max_seconds=None):
+        """Tone + noise for `text`; pitch from the speaker, length from the text."""
+        seconds = len(text) * self.TYPICAL_SEC_PER_CHAR
+        if max_seconds is not None:
+            seconds = min(seconds, max_seconds)
+        n = max(1, int(seconds * SAMPLE_RATE))
+        speaker = os.path.splitext(os.path.basename(speaker_wav or ''))[0]
+        rng = np.random.default_rng(_seed(speaker, text))
+        pitch = 90 + _seed(speaker) % 120
+        t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+        # Syllable-rate amplitude envelope so the audio is not a flat tone
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * t) ** 2
+        wav = 0.2 * envelope * np.sin(2 * np.pi * pitch * t)
+        wav += 0.01 * rng.standard_normal(n)
+        return wav.astype(np.float32)
+
+    def synthesize_batch(self, texts, speaker_wav, language="en", pause=None, batch_size=5,
+                         postprocess=None, max_seconds=None):
+        """Synthesize texts. Returns (list of wavs, sr); see TTSEngine.IN_MEMORY."""
+        results = []
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+            budgets = max_seconds[i:i + batch_size] if max_seconds else [None] * len(batch)
+            post = postprocess[i:i + batch_size] if postprocess else [None] * len(batch)
+            wavs = [self._voice(t, speaker_wav, b) for t, b in zip(batch, budgets)]
+            if self.rtf:
+                time.sleep(self.rtf * max(len(w) for w in wavs) / SAMPLE_RATE)
+            for wav, fn in zip(wavs, post):
+                if pause:
+                    wav = np.concatenate([wav, np.zeros(int(SAMPLE_RATE * pause), np.float32)])
+                results.append(fn(wav, SAMPLE_RATE) if fn else wav)
+        return results, SAMPLE_RATE
+
+    def tts_to_file(self, text, speaker_wav, file_path, language="en", pause=None,
+                    postprocess=None, max_seconds=None, **kwargs):
+        wavs, sr = self.synthesize_batch([text], speaker_wav, pause=pause,
+                                         postprocess=[postprocess] if postprocess else None,
+                                         max_seconds=[max_seconds] if max_seconds else None)
+        sf.write(file_path, wavs[0], sr)
+
+    def tts_batch_to_files(self, texts, speaker_wav, file_paths, language="en", pause=None,
+                           batch_size=5, postprocess=None, max_seconds=None):
+        wavs, sr = self.synthesize_batch(texts, speaker_wav, pause=pause, batch_size=batch_size,
+                                         postprocess=postprocess, max_seconds=max_seconds)
+        for wav, path in zip(wavs, file_paths):
+            sf.write(path, wav, sr)
@@ -0,0 +1,215 @@
+"""Local-first database: the live audiobook.db on local disk, replicated to the share.
+
+SQLite in WAL mode over SMB is slow and fragile (every commit is an fsync
+round-trip, and WAL's shared memory is not safe across network clients).
+With config ``local_db`` set, the pipeline opens that local file instead, and
+DBReplicator copies it to ``{output_dir}/audiobook.db`` with SQLite's online
+backup API — on a timer while the server runs and once more at shutdown. The
+share copy stays a complete, consistent database for backups, other
+machines, and a later run without ``local_db``.
+"""
+
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+
+DEFAULT_INTERVAL_S = 60
+
+# Tables whose newest row timestamp tells which copy saw the latest write
+_STAMP_COLUMNS = (('chapters', 'updated_at'), ('series', 'updated_at'),
+                  ('timings', 'created_at'))
+
+
+def data_stamp(path):
+    """Newest row timestamp in a pipeline database ('' if missing or empty).
+
+    Every chapter and series write sets updated_at and every timing row has
+    created_at, so the copy with the larger stamp saw the most recent write.
+    Tables the file does not have (a database from before they were added)
+    are skipped. Raises sqlite3.Error when the file exists but cannot be read
+    — an unreadable copy must never count as the older one.
+    """
+    if not os.path.exists(path):
+        return ''
+    conn = sqlite3.connect(pathlib.Path(path).absolute().as_uri() + '?mode=ro', uri=True)
+    try:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        stamps = [conn.execute(f"SELECT MAX({column}) FROM {table}").fetchone()[0]
+                  for table, column in _STAMP_COLUMNS if table in tables]
+    finally:
+        conn.close()
+    return max((stamp for stamp in stamps if stamp), default='')
+
+
+def copy_database(src_path, dst_path):
+    """Copy a live SQLite database with the online backup API.
+
+    The copy reads one consistent snapshot of the source (concurrent writers
+    are not blocked in WAL mode) and is written as a single transaction on
+    the destination, so readers of the destination never see a partial copy.
+    The destination is left in rollback-journal mode — no WAL on a share.
+    """
+    os.makedirs(os.path.dirname(dst_path) or ".", exist_ok=True)
+    src = sqlite3.connect(src_path)
+    try:
+        dst = sqlite3.connect(dst_path)
+        try:
+            src.backup(dst)
+            try:
+                dst.execute("PRAGMA journal_mode=DELETE")
+            except sqlite3.OperationalError:
+                pass   # another connection holds it open; stays WAL until next time
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+class ReplicationConflict(Exception):
+    """The share copy has rows the local copy does not; replicating would lose them."""
+
+
+class DBReplicator:
+    """Keeps the share copy of a local-first database current.
+
+    Args:
+        local_path: The live database (config ``local_db``).
+        share_path: The replica on the share (``{output_dir}/audiobook.db``).
+        interval_s: Seconds between replication checks (config ``db_replicate_s``).
+    """
+
+    def __init__(self, local_path, share_path, interval_s=DEFAULT_INTERVAL_S):
+        self.local_path = local_path
+        self.share_path = share_path
+        self.interval_s = interval_s
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._replicated_version = None   # local file version last copied to the share
+        self._last_ok_at = None
+        self._started_at = time.time()
+        self._error = None
+
+    def reconcile(self):
+        """Startup: make the local copy the newer of the two.
+
+        A share copy with newer rows (another machine, or a run without
+        ``local_db``) replaces the local one, as it does whenever the local
+        copy is missing or has no rows; otherwise the local copy is kept and
+        reaches the share on the next replication. Returns 'share' or 'local'
+        for the copy chosen. Raises sqlite3.Error when either copy exists but
+        cannot be read, rather than risk replicating over the share.
+        """
+        share = data_stamp(self.share_path)
+        local = data_stamp(self.local_path)
+        if os.path.exists(self.share_path) and (not local or share > local):
+            print(f"[replica] share database is newer ({share or 'no rows'} > "
+                  f"{local or 'none'}), copying it to {self.local_path}")
+            self._remove_local()
+            copy_database(self.share_path, self.local_path)
+            self._replicated_version = self._local_version()
+            self._last_ok_at = time.time()
+            return 'share'
+        return 'local'
+
+    def _remove_local(self):
+        for suffix in ('', '-wal', '-shm'):
+            path = self.local_path + suffix
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _local_version(self):
+        """(mtime, size) of the database and its WAL: any commit changes one of them."""
+        version = []
+        for suffix in ('', '-wal'):
+            try:
+                st = os.stat(self.local_path + suffix)
+                version.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                version.append(None)
+        return tuple(version)
+
+    def replicate(self, force=False):
+        """Copy the local database to the share if it changed. Returns True if copied."""
+        with self._lock:
+            version = self._local_version()
+            if not force and version == self._replicated_version:
+                return False
+            try:
+                self._check_share_older()
+                copy_database(self.local_path, self.share_path)
+            except (sqlite3.Error, OSError, ReplicationConflict) as e:
+                if self._error is None:
+                    print(f"[replica] copy to {self.share_path} failed: {e}")
+                self._error = str(e)
+                return False
+            # Version read before the copy: a write during it is picked up next time
+            self._replicated_version = version
+            self._last_ok_at = time.time()
+            if self._error is not None:
+                print("[replica] share copy current again")
+            self._error = None
+            return True
+
+    def _check_share_older(self):
+        """Refuse to overwrite a share copy that is unreadable or has newer rows.
+
+        All writes go to the local copy, so a newer share means another
+        writer; replicating would discard its rows.
+        """
+        share, local = data_stamp(self.share_path), data_stamp(self.local_path)
+        if share > local:
+            raise ReplicationConflict(
+                f"share copy has newer rows ({share} > {local or 'none'}); not overwriting it")
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='db-replicator', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.replicate()
+
+    def stop(self):
+        """Stop the timer and make a final copy (shutdown)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.replicate()
+
+    def status(self):
+        """Health fields: replication lag and the last error.
+
+        ``replication_lag_s`` is 0 when the share copy is current; otherwise
+        the time since the last successful copy — an upper bound on how long
+        the oldest unreplicated write has waited.
+        """
+        # No lock: a copy in progress must not stall the health poll
+        current = self._local_version() == self._replicated_version
+        since = self._last_ok_at or self._started_at
+        status = {'replication_lag_s': 0.0 if current else time.time() - since}
+        if self._error:
+            status['replication_error'] = self._error
+        return status
+
+
+def open_local_first(config, background=True):
+    """Resolve the pipeline's database path from config.
+
+    Returns (db_path, replicator). Without ``local_db`` that is the share's
+    ``{output_dir}/audiobook.db`` and no replicator; with it, the local path
+    and a reconciled DBReplicator, already running when `background`.
+    """
+    share_path = os.path.join(config['config']['output_dir'], 'audiobook.db')
+    local_path = config['config'].get('local_db')
+    if not local_path:
+        return share_path, None
+    replicator = DBReplicator(local_path, share_path,
+                              interval_s=config['config'].get('db_replicate_s')
+                              or DEFAULT_INTERVAL_S)
+    replicator.reconcile()
+    if background:
+        replicator.start()
+    return local_path, replicator
@@ -2,11 +2,22 @@
 
 import os
 import re
+import threading
 import time
 import requests
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from urllib.parse import urlparse
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from ..events import NULL_CONTEXT
+
+# Next permitted request start per host, shared by every scraper instance so
+# concurrent scrape jobs (several queue workers) stay polite to one site.
+_NEXT_REQUEST_AT = {}
+_NEXT_REQUEST_LOCK = threading.Lock()
+
+REGISTER_BATCH = 25   # chapters buffered by batch_registrations() before a flush
 
 class ChapterUnavailableError(Exception):
     """Raised when a chapter page indicates the content has been deleted or drafted."""
@@ -125,9 +136,9 @@ class BaseScraper(ABC):
     ]
 
     REQUEST_TIMEOUT = 30   # seconds — a dead connection must not hang a scrape
-    POLITE_DELAY = 1.0     # minimum seconds between requests
+    POLITE_DELAY = 1.0     # minimum seconds between requests to one host
 
-    def __init__(self, config, output_dir='inputs', db=None):
+    def __init__(self, config, output_dir='inputs', db=None, ctx=NULL_CONTEXT):
         self.current_chapter_url = config['latest']
         self.series_url = config.get('url', '')
         self.session = requests.Session()
@@ -140,11 +151,12 @@ class BaseScraper(ABC):
         # drop this adapter — mounting over CloudFlare-bypass adapters breaks them.
         self.session.mount('https://', HTTPAdapter(max_retries=retry))
         self.session.mount('http://', HTTPAdapter(max_retries=retry))
-        self._last_request_ts = 0.0
         self.series_name = config['name']
         self.system_types = config.get('system', {}).get('type', [])
         self.output_dir = output_dir
         self.db = db
+        self.ctx = ctx
+        self._unregistered = None   # chapter dicts buffered by batch_registrations()
         os.makedirs(self.output_dir, exist_ok=True)
 
     @staticmethod
@@ -159,15 +171,31 @@ class BaseScraper(ABC):
         return int(m.group(1)) if m else None
 
     def _get(self, url, **kwargs):
-        """Rate-limited session GET with a default timeout."""
-        wait = self.POLITE_DELAY - (time.monotonic() - self._last_request_ts)
-        if wait > 0:
-            time.sleep(wait)
+        """Session GET with a default timeout, rate-limited per host.
+
+        The request's latency (retries included, polite delay excluded) is
+        emitted as an 'http' span for /metrics.
+        """
+        host = urlparse(url).hostname
+        with _NEXT_REQUEST_LOCK:
+            # Reserve the next slot for this host before sleeping, so two
+            # threads never wake for the same one.
+            now = time.monotonic()
+            start = max(now, _NEXT_REQUEST_AT.get(host, 0.0))
+            _NEXT_REQUEST_AT[host] = start + self.POLITE_DELAY
+        if start > now:
+            time.sleep(start - now)
         kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        t0 = time.perf_counter()
         try:
             return self.session.get(url, **kwargs)
         finally:
-            self._last_request_ts = time.monotonic()
+            wall_s = time.perf_counter() - t0
+            with _NEXT_REQUEST_LOCK:
+                # A slow response pushes the next request back (delay counts from the end)
+                _NEXT_REQUEST_AT[host] = max(_NEXT_REQUEST_AT[host],
+                                             time.monotonic() + self.POLITE_DELAY)
+            self.ctx.record_span('http', wall_s, series=self.series_name, detail=host)
 
     def clean_chapter_title(self, title):
         """Normalize Unicode characters in a chapter title to ASCII-safe equivalents."""
@@ -241,15 +269,38 @@ class BaseScraper(ABC):
             f.write(content)
 
         if self.db:
-            self.db.register(
-                self.series_name, title, file_path,
-                published_date=published_date,
-                source_url=source_url,
-                chapter_index=chapter_index,
-            )
+            chapter = {'title': title, 'raw_path': file_path, 'published_date': published_date,
+                       'source_url': source_url, 'chapter_index': chapter_index}
+            if self._unregistered is None:
+                self.db.register(self.series_name, **chapter)
+            else:
+                self._unregistered.append(chapter)
+                if len(self._unregistered) >= REGISTER_BATCH:
+                    self._flush_registrations()
 
         return True
 
+    @contextmanager
+    def batch_registrations(self):
+        """Register chapters saved inside the block with register_many, not one commit each.
+
+        Flushed every REGISTER_BATCH chapters and when the block exits (also on
+        error), so a long scrape never holds a write transaction open across
+        network fetches. Files saved but never registered (a crash mid-batch)
+        are picked up by the next sync_filesystem, minus source URL and index.
+        """
+        self._unregistered = []
+        try:
+            yield
+        finally:
+            self._flush_registrations()
+            self._unregistered = None
+
+    def _flush_registrations(self):
+        if self._unregistered:
+            self.db.register_many(self.series_name, self._unregistered)
+            self._unregistered = []
+
     def resolve_chapter_url(self, chapter_title):
         """Look up a chapter URL by title from the series TOC. Override in subclasses."""
         return None
@@ -98,7 +98,11 @@ class RoyalRoadScraper(BaseScraper):
         response = self._get(chapter_url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
+        title, content, published_date = self._parse_chapter(soup, chapter_url)
+        return title, content, published_date, soup
 
+    def _parse_chapter(self, soup, chapter_url=''):
+        """Extract (title, content_text, published_date) from a chapter page soup."""
         title_tag = soup.find('title')
         title = self._extract_title(title_tag.get_text(strip=True)) if title_tag else "Title not found"
         title = self.clean_chapter_title(title)
@@ -114,7 +118,7 @@ class RoyalRoadScraper(BaseScraper):
             if 'drafted or deleted' in page_text:
                 raise ChapterUnavailableError(
                     f"Chapter has been deleted or drafted: {chapter_url}")
-            return title, "Content not found", published_date, soup
+            return title, "Content not found", published_date
 
         # Clean and format system messages
         content_div = self.clean_chapter_content(content_div)
@@ -148,7 +152,7 @@ class RoyalRoadScraper(BaseScraper):
             seen_paragraphs.add(normalized)
             lines.append(normalized)
 
-        return title, '\n'.join(lines), published_date, soup
+        return title, '\n'.join(lines), published_date
 
     def _extract_title(self, raw_title):
         """Extract the chapter title from a RoyalRoad <title> tag.
@@ -6,6 +6,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import cloudscraper
 from .base import BaseScraper, ChapterUnavailableError
+from ..events import NULL_CONTEXT
 from ..utils.colors import PURPLE, YELLOW, RESET
 
 
@@ -18,8 +19,8 @@ class ScribbleHubScraper(BaseScraper):
 
     MAX_TOC_PAGES = 100
 
-    def __init__(self, config, output_dir='inputs', db=None):
-        super().__init__(config, output_dir, db=db)
+    def __init__(self, config, output_dir='inputs', db=None, ctx=NULL_CONTEXT):
+        super().__init__(config, output_dir, db=db, ctx=ctx)
         # Replaces the base session (and its retry adapter) — mounting a retry
         # adapter over cloudscraper's own would break the CloudFlare bypass.
         self.session = cloudscraper.create_scraper(
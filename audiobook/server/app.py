@@ -5,7 +5,8 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
-from .routers import chapters, config, jobs, media, series, speakers, system
+from .routers import (chapters, config, jobs, media, prometheus, series, speakers, system,
+                      workers)
 from .spa import mount_spa
 
 
@@ -28,7 +29,7 @@ def create_app(runner):
         # (e.g. "Cannot rescrape a local series")
         return JSONResponse(status_code=400, content={'detail': str(exc)})
 
-    for r in (system, jobs, series, chapters, speakers, config, media):
+    for r in (system, jobs, series, chapters, speakers, config, media, prometheus, workers):
         app.include_router(r.router)
 
     mount_spa(app)  # must be last: catch-all static mount at /
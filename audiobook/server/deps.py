@@ -1,8 +1,11 @@
 """FastAPI dependencies and shared request-scope helpers."""
 
+import hashlib
+import sqlite3
 from contextlib import contextmanager
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 
 
 def get_runner(request: Request):
@@ -12,23 +15,44 @@ def get_runner(request: Request):
 
 @contextmanager
 def open_db(runner):
-    """Yield a fresh ChapterDB, closing it afterwards.
+    """Yield a ChapterDB from the runner's connection pool, returning it afterwards.
 
-    The DB is SQLite on an SMB share — constructor failure (share down)
-    surfaces as 503 so the SPA can show the health state instead of a
-    silent empty table.
+    The DB is SQLite on an SMB share — failure to open a connection (share
+    down) surfaces as 503 so the SPA can show the health state instead of a
+    silent empty table. A connection that hit a DB or I/O error is dropped
+    rather than pooled, so a dead share handle is not reused.
     """
     try:
-        db = runner.get_db()
+        db = runner.db_pool.acquire()
     except Exception:
         raise HTTPException(status_code=503, detail='share unreachable')
+    broken = False
     try:
         yield db
+    except (sqlite3.Error, OSError):
+        broken = True
+        raise
     finally:
-        db.close()
+        runner.db_pool.release(db, broken=broken)
 
 
 def require_idle(runner):
     """409 for interactive flows that bypass the job queue while it's busy."""
     if runner.is_busy:
         raise HTTPException(status_code=409, detail='Pipeline is busy')
+
+
+def etag_response(request: Request, content):
+    """JSON response with an ETag of its body; 304 when the client already has it.
+
+    For endpoints the SPA polls: the browser revalidates with If-None-Match
+    (``no-cache`` forces that on every request) and reuses its cached body
+    on 304, so an unchanged payload costs neither transfer nor re-render.
+    """
+    response = JSONResponse(content)
+    etag = '"' + hashlib.sha1(response.body).hexdigest() + '"'
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if etag in request.headers.get('if-none-match', ''):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
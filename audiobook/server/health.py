@@ -19,9 +19,16 @@ def _exists_with_timeout(path, timeout=3.0):
     return bool(result and result[0])
 
 
-def check_health(output_dir, db_path):
-    """Gather health indicators. Runs on a threadpool."""
+def check_health(output_dir, db_path, model=None, replication=None):
+    """Gather health indicators. Runs on a threadpool.
+
+    `model` is the job queue's TTS residency (JobQueue.model_status()); without
+    it only a loaded Qwen model is detected. `replication` is the local-first
+    DB's DBReplicator.status() (lag and last error), when ``local_db`` is set.
+    """
     health = {'share_ok': _exists_with_timeout(output_dir)}
+    if replication:
+        health.update(replication)
 
     if health['share_ok']:
         try:
@@ -45,9 +52,12 @@ def check_health(output_dir, db_path):
     except Exception:
         pass
 
+    if model is not None:
+        health.update(model)
+        return health
     try:
-        from ..processors.tts_qwen import QwenTTSInstance
-        health['model_loaded'] = QwenTTSInstance._inst is not None
+        from ..processors.engines import imported_engines
+        health['model_loaded'] = any(cls._inst is not None for cls in imported_engines())
     except Exception:
         health['model_loaded'] = False
 
@@ -5,12 +5,15 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
+from ...processors.engines import engine_names
 from ...speakers import list_speakers
+from ...web.jobs import UNLOAD_POLICIES
 from ..deps import get_runner
 
 router = APIRouter(prefix='/api/config', tags=['config'])
 
 SYSTEM_TYPES = ['bold', 'italic', 'bracket', 'angle', 'blockquote', 'table', 'center']
+AUDIO_POSTPROC_BACKENDS = ['numpy', 'ffmpeg']
 
 
 @router.get('')
@@ -26,12 +29,20 @@ def get_meta():
         'speakers': list_speakers(),
         'system_types': SYSTEM_TYPES,
         'sources': list(SCRAPER_MAP),
+        'tts_engines': engine_names(),
     }
 
 
 class TtsSettingsBody(BaseModel):
+    tts_engine: Optional[str] = None
     tts_batch_size: Optional[int] = None
     tts_verbose: Optional[bool] = None
+    audio_postproc: Optional[str] = None
+    tts_batch_tokens: Optional[int] = None     # 0 clears (back to tts_batch_size)
+    tts_max_vram_gb: Optional[float] = None    # 0 clears
+    chunk_cache_gb: Optional[float] = None     # 0 disables the chunk cache
+    tts_unload: Optional[str] = None           # idle | immediate | never
+    tts_idle_unload_min: Optional[float] = None
 
 
 @router.put('/tts')
@@ -40,13 +51,47 @@ def put_tts_settings(body: TtsSettingsBody, runner=Depends(get_runner)):
     if body.tts_batch_size is not None and not 1 <= body.tts_batch_size <= 32:
         raise HTTPException(status_code=400,
                             detail='tts_batch_size must be between 1 and 32')
+    if body.tts_batch_tokens is not None and body.tts_batch_tokens < 0:
+        raise HTTPException(status_code=400, detail='tts_batch_tokens must be >= 0')
+    if body.tts_max_vram_gb is not None and body.tts_max_vram_gb < 0:
+        raise HTTPException(status_code=400, detail='tts_max_vram_gb must be >= 0')
+    if body.chunk_cache_gb is not None and body.chunk_cache_gb < 0:
+        raise HTTPException(status_code=400, detail='chunk_cache_gb must be >= 0')
+    if body.tts_idle_unload_min is not None and body.tts_idle_unload_min < 0:
+        raise HTTPException(status_code=400, detail='tts_idle_unload_min must be >= 0')
+    if body.tts_unload is not None and body.tts_unload not in UNLOAD_POLICIES:
+        raise HTTPException(status_code=400,
+                            detail=f"tts_unload must be one of: {', '.join(UNLOAD_POLICIES)}")
+    if body.tts_engine is not None and body.tts_engine not in engine_names():
+        raise HTTPException(status_code=400,
+                            detail=f"tts_engine must be one of: {', '.join(engine_names())}")
+    if body.audio_postproc is not None and body.audio_postproc not in AUDIO_POSTPROC_BACKENDS:
+        raise HTTPException(status_code=400,
+                            detail=f"audio_postproc must be one of: "
+                                   f"{', '.join(AUDIO_POSTPROC_BACKENDS)}")
 
     def mutate(cfg):
         c = cfg.setdefault('config', {})
+        if body.tts_engine is not None:
+            c['tts_engine'] = body.tts_engine
         if body.tts_batch_size is not None:
             c['tts_batch_size'] = body.tts_batch_size
         if body.tts_verbose is not None:
             c['tts_verbose'] = body.tts_verbose
+        if body.audio_postproc is not None:
+            c['audio_postproc'] = body.audio_postproc
+        for key in ('tts_batch_tokens', 'tts_max_vram_gb'):
+            value = getattr(body, key)
+            if value:
+                c[key] = value
+            elif value is not None:
+                c.pop(key, None)
+        if body.chunk_cache_gb is not None:
+            c['chunk_cache_gb'] = body.chunk_cache_gb
+        if body.tts_unload is not None:
+            c['tts_unload'] = body.tts_unload
+        if body.tts_idle_unload_min is not None:
+            c['tts_idle_unload_min'] = body.tts_idle_unload_min
 
     runner.update_config(mutate)
     return {'ok': True}
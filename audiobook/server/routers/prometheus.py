@@ -0,0 +1,15 @@
+"""Prometheus scrape endpoint (unprefixed /metrics, the exporter convention)."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from ...web.metrics import CONTENT_TYPE
+from ..deps import get_runner
+
+router = APIRouter(tags=['system'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+async def get_prometheus_metrics(runner=Depends(get_runner)):
+    # In-memory registry and queue snapshot — safe on the event loop.
+    return PlainTextResponse(runner.queue.metrics_text(), media_type=CONTENT_TYPE)
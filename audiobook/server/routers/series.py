@@ -7,10 +7,10 @@ keeping SMB-backed SQLite reads and config-lock writes off the event loop.
 import os
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
-from ..deps import get_runner, open_db, require_idle
+from ..deps import etag_response, get_runner, open_db, require_idle
 from ..util import natural_key
 from .jobs import submit_response
 
@@ -21,28 +21,31 @@ router = APIRouter(prefix='/api/series', tags=['series'])
 
 
 @router.get('')
-def list_series(runner=Depends(get_runner)):
-    """Dashboard data: per-series status counts + generation stats."""
+def list_series(request: Request, runner=Depends(get_runner)):
+    """Dashboard data: per-series status counts + generation stats.
+
+    Polled every 2 seconds, so the payload carries an ETag (a hash of the
+    body) and an unchanged dashboard is answered with 304 and no body.
+    """
     config = runner.get_config()
     enabled = [s for s in config.get('series', []) if s.get('enabled', True)]
 
     with open_db(runner) as db:
-        rows = []
-        for series in enabled:
-            name = series.get('name', 'Unnamed')
-            s = db.summary(name)
-            series_info = db.get_series(name)
-            rows.append({
-                'name': name,
-                'done': s['done'],
-                'pending': s['pending'],
-                'processing': s['processing'],
-                'failed': s['failed'],
-                'narrator': (series_info.get('narrator') if series_info else None)
-                            or series.get('narrator', ''),
-                'url': series.get('url', ''),
-            })
-        return {'series': rows, 'stats': db.stats()}
+        dashboard = db.dashboard()
+    rows = []
+    for series in enabled:
+        name = series.get('name', 'Unnamed')
+        s = dashboard['series'].get(name) or {}
+        rows.append({
+            'name': name,
+            'done': s.get('done', 0),
+            'pending': s.get('pending', 0),
+            'processing': s.get('processing', 0),
+            'failed': s.get('failed', 0),
+            'narrator': s.get('narrator') or series.get('narrator', ''),
+            'url': series.get('url', ''),
+        })
+    return etag_response(request, {'series': rows, 'stats': dashboard['stats']})
 
 
 def _register_series_from_config(runner, db, series_name):
@@ -105,14 +108,17 @@ def get_chapters(name: str, runner=Depends(get_runner)):
     # the DB returns rows sorted lexically by raw_path.
     rows.sort(key=lambda r: natural_key(r['title']))
 
-    # Fold the live generation pct into the row currently being processed.
+    # Fold the live generation pct into the rows currently being processed
+    # (a cross-chapter batch window has several in flight).
     cur = runner.queue_snapshot()['current']
     if cur:
         prog = cur.get('progress', {})
+        pcts = dict(prog.get('chapter_pcts') or {})
         if prog.get('raw_path') and prog.get('pct') is not None:
-            for r in rows:
-                if r['raw_path'] == prog['raw_path'] and r['status'] == 'processing':
-                    r['pct'] = prog['pct']
+            pcts[prog['raw_path']] = prog['pct']
+        for r in rows:
+            if r['raw_path'] in pcts and r['status'] == 'processing':
+                r['pct'] = pcts[r['raw_path']]
 
     return rows
 
@@ -1,9 +1,10 @@
-"""Status bundle, health, log, and filesystem-sync endpoints."""
+"""Status bundle, health, metrics, log, and filesystem-sync endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
-from ..deps import get_runner, require_idle
+from ..deps import get_runner, open_db
 from ..health import check_health
+from .jobs import submit_response
 
 router = APIRouter(prefix='/api', tags=['system'])
 
@@ -31,7 +32,19 @@ async def get_status(log_since: int = 0, runner=Depends(get_runner)):
 def get_health(runner=Depends(get_runner)):
     # Sync def → threadpool: probes the SMB share (has its own UNC timeout guard).
     output_dir = runner.get_config()['config']['output_dir']
-    return check_health(output_dir, runner._db_path)
+    return check_health(output_dir, runner._db_path, model=runner.queue.model_status(),
+                        replication=runner.replication_status())
+
+
+@router.get('/metrics')
+def get_metrics(days: int = 56, bucket: str = 'week', runner=Depends(get_runner)):
+    """Throughput trends per series and narrator from recorded timing spans."""
+    if bucket not in ('day', 'week'):
+        raise HTTPException(status_code=400, detail="bucket must be 'day' or 'week'")
+    if not 1 <= days <= 3650:
+        raise HTTPException(status_code=400, detail='days must be between 1 and 3650')
+    with open_db(runner) as db:
+        return db.timing_summary(days=days, bucket=bucket)
 
 
 @router.post('/log/clear')
@@ -41,8 +54,7 @@ async def clear_log(runner=Depends(get_runner)):
 
 
 @router.post('/sync')
-def sync_filesystem(runner=Depends(get_runner)):
-    # Sync def → threadpool: walks the share and writes to the DB.
-    require_idle(runner)
-    runner.sync_all()
-    return {'ok': True}
+async def sync_filesystem(runner=Depends(get_runner)):
+    # Queued on the maintenance lane, which holds it until no job is running
+    # on the series it reconciles (it resets their 'processing' rows).
+    return {'ok': True, **submit_response(runner.start_sync())}
@@ -0,0 +1,183 @@
+"""Remote generation workers: lease chapters, renew, upload the MP3, report failure.
+
+The server stays the coordinator — it owns the job queue, the DB, and the
+share. A worker (``audiobook --worker URL``, see audiobook/worker.py) leases
+one chapter at a time, synthesizes it on its own GPU, and uploads the
+finished MP3, which is written to the series' output directory like a
+locally generated chapter. A lease that is not renewed expires and the
+chapter becomes leasable again, so a worker that dies mid-chapter costs
+only the lease time.
+"""
+
+import os
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from ...state import LEASE_MAX_RETRIES
+from ..deps import get_runner, open_db
+
+router = APIRouter(prefix='/api/workers', tags=['workers'])
+
+DEFAULT_LEASE_S = 300
+
+
+def _lease_s(runner):
+    return int(runner.get_config()['config'].get('worker_lease_s') or DEFAULT_LEASE_S)
+
+
+def _held_chapter(db, chapter_id, worker):
+    """The chapter row, or 409 when `worker` no longer holds its lease."""
+    chapter = db.get_chapter_by_id(chapter_id)
+    if not chapter:
+        raise HTTPException(status_code=404, detail='Chapter not found')
+    if chapter['status'] != 'processing' or chapter.get('lease_owner') != worker:
+        raise HTTPException(status_code=409, detail='Lease lost')
+    return chapter
+
+
+class LeaseBody(BaseModel):
+    worker: str
+    series: Optional[list[str]] = None
+
+
+@router.post('/lease')
+def lease_chapter(body: LeaseBody, runner=Depends(get_runner)):
+    """Lease the next chapter to generate; 204 when there is nothing to do.
+
+    The response carries the raw chapter text and the merged series config;
+    the worker cleans and synthesizes it with the same code path as a local
+    generation, so replacements and voices behave identically.
+    """
+    from ...pipeline import _build_series_cfg, get_enabled_series
+    config = runner.get_config()
+    enabled = {s.get('name'): s for s in get_enabled_series(config)}
+    names = [n for n in (body.series or enabled) if n in enabled]
+    lease_s = _lease_s(runner)
+    max_retries = config['config'].get('worker_max_retries', LEASE_MAX_RETRIES)
+    with open_db(runner) as db:
+        chapter = db.lease_chapter(body.worker, lease_s, names, max_retries=max_retries)
+        if chapter is None:
+            return Response(status_code=204)
+        try:
+            with open(chapter['raw_path'], 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError as e:
+            db.mark_failed(chapter['raw_path'], f'raw text unreadable: {e}')
+            raise HTTPException(status_code=503, detail='Chapter text unreadable')
+    print(f"[workers] {body.worker} leased {chapter['series_name']}: {chapter['title']}")
+    return {
+        'id': chapter['id'],
+        'series': chapter['series_name'],
+        'title': chapter['title'],
+        'filename': os.path.basename(chapter['raw_path']),
+        'text': text,
+        'series_cfg': _build_series_cfg(config, enabled[chapter['series_name']]),
+        'lease_s': lease_s,
+        # A chapter that failed before is re-synthesized, not restored from cache
+        'refresh_cache': bool(chapter.get('retry_count')),
+        'lease_expires_at': chapter['lease_expires_at'],
+    }
+
+
+class WorkerBody(BaseModel):
+    worker: str
+
+
+@router.post('/chapters/{chapter_id}/renew')
+def renew_lease(chapter_id: int, body: WorkerBody, runner=Depends(get_runner)):
+    with open_db(runner) as db:
+        if not db.renew_lease(chapter_id, body.worker, _lease_s(runner)):
+            raise HTTPException(status_code=409, detail='Lease lost')
+    return {'ok': True}
+
+
+def _check_lease(runner, chapter_id, worker):
+    with open_db(runner) as db:
+        return _held_chapter(db, chapter_id, worker)
+
+
+def _store_upload(runner, chapter, chapter_id, worker, part, mp3):
+    """Move a complete upload into place and mark the chapter done, if still leased."""
+    with open_db(runner) as db:
+        _held_chapter(db, chapter_id, worker)   # still ours after the upload?
+        os.replace(part, mp3)
+        db.mark_done(chapter['raw_path'], output_path=mp3)
+
+
+def _discard(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+@router.put('/chapters/{chapter_id}/audio')
+async def upload_audio(chapter_id: int, worker: str, request: Request,
+                       runner=Depends(get_runner)):
+    """Store a finished chapter's MP3 (the raw request body) and mark it done.
+
+    async only to stream the body; every file and DB call (SMB-backed) runs
+    on the threadpool, like the sync handlers, to keep the event loop free.
+    """
+    chapter = await run_in_threadpool(_check_lease, runner, chapter_id, worker)
+    # Raws live in {output_dir}/{series}/raws; audio goes to {output_dir}/{series}
+    series_out = os.path.dirname(os.path.dirname(chapter['raw_path']))
+    base = os.path.splitext(os.path.basename(chapter['raw_path']))[0]
+    mp3 = os.path.join(series_out, f'{base}.mp3')
+    part = f'{mp3}.{uuid.uuid4().hex[:8]}.part'
+    await run_in_threadpool(os.makedirs, series_out, exist_ok=True)
+    size = 0
+    try:
+        f = await run_in_threadpool(open, part, 'wb')
+        try:
+            async for block in request.stream():
+                await run_in_threadpool(f.write, block)
+                size += len(block)
+        finally:
+            await run_in_threadpool(f.close)
+        if not size:
+            raise HTTPException(status_code=400, detail='Empty upload')
+        await run_in_threadpool(_store_upload, runner, chapter, chapter_id, worker, part, mp3)
+    finally:
+        await run_in_threadpool(_discard, part)
+    print(f"[workers] {worker} finished {chapter['title']}")
+    return {'ok': True, 'bytes': size}
+
+
+class FailBody(BaseModel):
+    worker: str
+    error: str
+
+
+@router.post('/chapters/{chapter_id}/fail')
+def fail_chapter(chapter_id: int, body: FailBody, runner=Depends(get_runner)):
+    with open_db(runner) as db:
+        chapter = _held_chapter(db, chapter_id, body.worker)
+        db.mark_failed(chapter['raw_path'], body.error)
+    print(f"[workers] {body.worker} failed {chapter['title']}: {body.error}")
+    return {'ok': True}
+
+
+@router.post('/chapters/{chapter_id}/release')
+def release_chapter(chapter_id: int, body: WorkerBody, runner=Depends(get_runner)):
+    """Hand an unfinished chapter back (worker shutting down)."""
+    with open_db(runner) as db:
+        chapter = _held_chapter(db, chapter_id, body.worker)
+        db.reset_chapter(chapter['raw_path'])
+    return {'ok': True}
+
+
+@router.get('')
+def list_leases(runner=Depends(get_runner)):
+    """Chapters currently leased to remote workers."""
+    with open_db(runner) as db:
+        leases = db.get_leases()
+    return [{
+        'id': ch['id'],
+        'series': ch['series_name'],
+        'title': ch['title'],
+        'worker': ch['lease_owner'],
+        'lease_expires_at': ch['lease_expires_at'],
+    } for ch in leases]
@@ -1,8 +1,35 @@
 """SQLite-backed chapter status tracking for the audiobook pipeline."""
 
+import functools
+import json
 import os
 import sqlite3
-from datetime import datetime, timezone
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+
+MANIFEST_SLACK_S = 2.0   # see ChapterDB._listing
+LEASE_MAX_RETRIES = 3    # failed attempts before a chapter is no longer leased
+
+
+def _same_dir(a, b):
+    return os.path.normcase(os.path.normpath(a)) == os.path.normcase(os.path.normpath(b))
+
+
+def _timed(method):
+    """Report each call's wall time to ``ChapterDB.on_query(name, seconds)`` when set."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.on_query is None:
+            return method(self, *args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.on_query(method.__name__, time.perf_counter() - t0)
+    return wrapper
 
 
 class ChapterDB:
@@ -21,6 +48,9 @@ class ChapterDB:
             db.mark_done("/path/to/raw.txt")
     """
 
+    # WHERE clause (one `now` parameter): no remote worker holds a live lease
+    _UNLEASED = "(lease_expires_at IS NULL OR lease_expires_at < ?)"
+
     _SCHEMA = """
     CREATE TABLE IF NOT EXISTS series (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -55,24 +85,73 @@ class ChapterDB:
 
     CREATE INDEX IF NOT EXISTS idx_chapters_series_status
         ON chapters(series_id, status);
+
+    CREATE TABLE IF NOT EXISTS timings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        chapter_id INTEGER REFERENCES chapters(id) ON DELETE SET NULL,
+        job_id TEXT,
+        series TEXT,
+        narrator TEXT,
+        span TEXT NOT NULL,
+        wall_s REAL NOT NULL,
+        audio_s REAL,
+        rtf REAL,
+        chars INTEGER,
+        chunks INTEGER,
+        retries INTEGER,
+        created_at TEXT NOT NULL DEFAULT (datetime('now'))
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_timings_span_created
+        ON timings(span, created_at);
+
+    -- Last listing of each directory sync_filesystem scanned; reused while
+    -- the directory's mtime is unchanged (NULL mtime: rescan next time).
+    -- seen_mtime_ns/seen_at: directory mtime and local time of the first scan
+    -- that found this listing, until a later scan confirms it (see _listing)
+    CREATE TABLE IF NOT EXISTS dir_manifest (
+        path TEXT PRIMARY KEY,
+        mtime_ns INTEGER,
+        names TEXT NOT NULL,
+        seen_mtime_ns INTEGER,
+        seen_at REAL
+    );
     """
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, on_query=None, setup=True, shared=False):
+        """Open `db_path`.
+
+        `setup` creates and migrates the schema and switches the file to WAL
+        (both persist in the file — ChapterDBPool does it once per process).
+        `shared` lets the connection move between threads, one at a time.
+        """
         self._db_path = db_path
+        self.on_query = on_query    # callback(method_name, wall_s) per public call
+        self._tx_depth = 0          # open transaction() blocks
+        self._series_ids = {}       # series name -> id (series rows are never deleted)
         os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-        self._conn = sqlite3.connect(db_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=not shared)
         self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
-        self._conn.executescript(self._SCHEMA)
-        self._migrate()
-        self._conn.commit()
+        if setup:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self._SCHEMA)
+            self._migrate()
+            self._conn.commit()
 
     def _migrate(self):
         """Additive schema migrations for existing production databases."""
         cols = {r["name"] for r in self._conn.execute("PRAGMA table_info(chapters)")}
         if "duration_s" not in cols:
             self._conn.execute("ALTER TABLE chapters ADD COLUMN duration_s REAL")
+        if "lease_owner" not in cols:
+            # Remote generation workers (audiobook/worker.py) lease chapters
+            self._conn.execute("ALTER TABLE chapters ADD COLUMN lease_owner TEXT")
+            self._conn.execute("ALTER TABLE chapters ADD COLUMN lease_expires_at TEXT")
+        cols = {r["name"] for r in self._conn.execute("PRAGMA table_info(dir_manifest)")}
+        if "seen_at" not in cols:
+            self._conn.execute("ALTER TABLE dir_manifest ADD COLUMN seen_mtime_ns INTEGER")
+            self._conn.execute("ALTER TABLE dir_manifest ADD COLUMN seen_at REAL")
 
     def close(self):
         if self._conn:
@@ -85,11 +164,38 @@ class ChapterDB:
     def __exit__(self, *exc):
         self.close()
 
-    def _now(self):
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    @contextmanager
+    def transaction(self):
+        """Unit of work: writes inside the block share one commit.
+
+        Every write method commits on its own — one fsync round-trip each on
+        the share. Inside ``with db.transaction():`` they defer to a single
+        commit at the end of the block (rolled back if it raises). Nested
+        blocks join the outermost one.
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth -= 1
+            if not self._tx_depth:
+                self._conn.rollback()
+            raise
+        self._tx_depth -= 1
+        if not self._tx_depth:
+            self._conn.commit()
+
+    def _commit(self):
+        if not self._tx_depth:
+            self._conn.commit()
+
+    def _now(self, offset_s=0):
+        when = datetime.now(timezone.utc) + timedelta(seconds=offset_s)
+        return when.strftime("%Y-%m-%d %H:%M:%S")
 
     # ── Series ──────────────────────────────────────────────────────
 
+    @_timed
     def upsert_series(self, name, url=None, source=None, narrator=None, latest_url=None):
         """Insert or update a series by name. Returns the series id."""
         now = self._now()
@@ -107,7 +213,8 @@ class ChapterDB:
                    WHERE id = ?""",
                 (url, source, narrator, latest_url, now, now, row["id"]),
             )
-            self._conn.commit()
+            self._commit()
+            self._series_ids[name] = row["id"]
             return row["id"]
         else:
             cur = self._conn.execute(
@@ -116,9 +223,11 @@ class ChapterDB:
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
                 (name, url, source, narrator, latest_url, now, now, now),
             )
-            self._conn.commit()
+            self._commit()
+            self._series_ids[name] = cur.lastrowid
             return cur.lastrowid
 
+    @_timed
     def get_series(self, name):
         """Return a series row as a dict, or None."""
         cur = self._conn.execute("SELECT * FROM series WHERE name = ?", (name,))
@@ -127,14 +236,20 @@ class ChapterDB:
 
     # ── Chapter registration ────────────────────────────────────────
 
+    def _series_id(self, series_name):
+        """Id of a series, created if missing; cached per connection."""
+        series_id = self._series_ids.get(series_name)
+        if series_id is None:
+            series = self.get_series(series_name)
+            series_id = series["id"] if series else self.upsert_series(series_name)
+            self._series_ids[series_name] = series_id
+        return series_id
+
+    @_timed
     def register(self, series_name, title, raw_path, published_date=None,
                  source_url=None, chapter_index=None):
         """Idempotent chapter registration. Returns the chapter id."""
-        series = self.get_series(series_name)
-        if not series:
-            series_id = self.upsert_series(series_name)
-        else:
-            series_id = series["id"]
+        series_id = self._series_id(series_name)
 
         now = self._now()
         cur = self._conn.execute("SELECT id FROM chapters WHERE raw_path = ?", (raw_path,))
@@ -150,19 +265,55 @@ class ChapterDB:
             (series_id, title, published_date, source_url,
              chapter_index, raw_path, now, now, now),
         )
-        self._conn.commit()
+        self._commit()
         return cur.lastrowid
 
+    @_timed
+    def register_many(self, series_name, chapters):
+        """Register several chapters of one series with a single statement and commit.
+
+        `chapters` are dicts with 'title' and 'raw_path' and optionally
+        'published_date', 'source_url' and 'chapter_index'. Already-tracked
+        raw paths are left alone, as with register(). Returns the number of
+        chapters newly registered.
+        """
+        series_id = self._series_id(series_name)
+        now = self._now()
+        rows = [(series_id, ch['title'], ch.get('published_date'), ch.get('source_url'),
+                 ch.get('chapter_index'), ch['raw_path'], now, now, now)
+                for ch in chapters]
+        if not rows:
+            return 0
+        cur = self._conn.executemany(
+            """INSERT OR IGNORE INTO chapters
+                   (series_id, title, published_date, source_url,
+                    chapter_index, raw_path, scraped_at, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
+
     # ── Status transitions ──────────────────────────────────────────
 
+    @_timed
     def mark_processing(self, raw_path, output_path):
+        """Claim a chapter for local generation.
+
+        Returns False (and changes nothing) while a remote worker holds an
+        unexpired lease on it.
+        """
         now = self._now()
-        self._conn.execute(
-            "UPDATE chapters SET status='processing', output_path=?, updated_at=? WHERE raw_path=?",
-            (output_path, now, raw_path),
+        cur = self._conn.execute(
+            """UPDATE chapters SET status='processing', output_path=?, lease_owner=NULL,
+                   lease_expires_at=NULL, updated_at=?
+               WHERE raw_path=? AND """ + self._UNLEASED,
+            (output_path, now, raw_path, now),
         )
-        self._conn.commit()
+        self._commit()
+        return cur.rowcount > 0
 
+    @_timed
     def mark_done(self, raw_path, output_path=None):
         now = self._now()
         if output_path:
@@ -174,34 +325,60 @@ class ChapterDB:
                 pass
             self._conn.execute(
                 """UPDATE chapters SET status='done', error=NULL, output_path=?,
-                   duration_s=COALESCE(?, duration_s), updated_at=? WHERE raw_path=?""",
+                   duration_s=COALESCE(?, duration_s), lease_owner=NULL,
+                   lease_expires_at=NULL, updated_at=? WHERE raw_path=?""",
                 (output_path, duration, now, raw_path),
             )
         else:
             self._conn.execute(
-                "UPDATE chapters SET status='done', error=NULL, updated_at=? WHERE raw_path=?",
+                """UPDATE chapters SET status='done', error=NULL, lease_owner=NULL,
+                   lease_expires_at=NULL, updated_at=? WHERE raw_path=?""",
                 (now, raw_path),
             )
-        self._conn.commit()
+        self._commit()
 
+    @_timed
+    def mark_done_many(self, chapters):
+        """Mark several chapters done in one statement and commit.
+
+        `chapters` are (raw_path, output_path) pairs; a None output_path
+        keeps the stored one. Unlike mark_done(), durations are not probed —
+        that is one ffprobe per file.
+        """
+        now = self._now()
+        rows = [(output_path, now, raw_path) for raw_path, output_path in chapters]
+        if not rows:
+            return
+        self._conn.executemany(
+            """UPDATE chapters SET status='done', error=NULL,
+                   output_path=COALESCE(?, output_path), lease_owner=NULL,
+                   lease_expires_at=NULL, updated_at=? WHERE raw_path=?""",
+            rows,
+        )
+        self._commit()
+
+    @_timed
     def mark_failed(self, raw_path, error):
         now = self._now()
         self._conn.execute(
             """UPDATE chapters
-               SET status='failed', error=?, retry_count=retry_count+1, updated_at=?
+               SET status='failed', error=?, retry_count=retry_count+1, lease_owner=NULL,
+                   lease_expires_at=NULL, updated_at=?
                WHERE raw_path=?""",
             (str(error), now, raw_path),
         )
-        self._conn.commit()
+        self._commit()
 
+    @_timed
     def mark_checked(self, raw_path):
         now = self._now()
         self._conn.execute(
             "UPDATE chapters SET checked_at=?, updated_at=? WHERE raw_path=?",
             (now, now, raw_path),
         )
-        self._conn.commit()
+        self._commit()
 
+    @_timed
     def update_source_url(self, chapter_id, source_url):
         """Set the source_url on a chapter row."""
         now = self._now()
@@ -209,38 +386,126 @@ class ChapterDB:
             "UPDATE chapters SET source_url=?, updated_at=? WHERE id=?",
             (source_url, now, chapter_id),
         )
-        self._conn.commit()
+        self._commit()
 
+    @_timed
     def reset_chapter(self, raw_path):
         """Reset a chapter to pending status for reprocessing."""
         now = self._now()
         self._conn.execute(
-            "UPDATE chapters SET status='pending', error=NULL, output_path=NULL, updated_at=? WHERE raw_path=?",
+            """UPDATE chapters SET status='pending', error=NULL, output_path=NULL,
+                   lease_owner=NULL, lease_expires_at=NULL, updated_at=? WHERE raw_path=?""",
             (now, raw_path),
         )
-        self._conn.commit()
+        self._commit()
 
+    @_timed
     def reset_all_processing(self):
         """Reset all 'processing' chapters to 'pending' (shutdown/crash recovery).
 
-        Returns the number of chapters reset.
+        Chapters leased to a remote worker are left alone until the lease
+        expires. Returns the number of chapters reset.
         """
         now = self._now()
         cur = self._conn.execute(
-            "UPDATE chapters SET status='pending', updated_at=? WHERE status='processing'",
-            (now,),
+            """UPDATE chapters SET status='pending', lease_owner=NULL, lease_expires_at=NULL,
+                   updated_at=?
+               WHERE status='processing' AND """ + self._UNLEASED,
+            (now, now),
         )
-        self._conn.commit()
+        self._commit()
         return cur.rowcount
 
+    # ── Remote worker leases ────────────────────────────────────────
+
+    @_timed
+    def lease_chapter(self, worker, lease_s, series_names, max_retries=LEASE_MAX_RETRIES):
+        """Lease the next actionable chapter of `series_names` to a remote worker.
+
+        Pending chapters are leasable, as are 'processing' chapters whose lease
+        has expired (a worker that died mid-chapter), and — after all of those —
+        failed chapters that have failed fewer than `max_retries` times. A
+        chapter that keeps failing stays failed until it is reset explicitly,
+        so it cannot loop through the workers forever. The chapter moves to
+        'processing' with `worker` as lease owner until `lease_s` seconds from
+        now. Returns the chapter row (plus 'series_name'), or None when there
+        is nothing to do.
+        """
+        if not series_names:
+            return None
+        marks = ', '.join('?' * len(series_names))
+        while True:
+            now = self._now()
+            row = self._conn.execute(
+                f"""SELECT chapters.id FROM chapters
+                    JOIN series ON series.id = chapters.series_id
+                    WHERE series.name IN ({marks})
+                      AND (chapters.status = 'pending'
+                           OR (chapters.status = 'failed' AND chapters.retry_count < ?)
+                           OR (chapters.status = 'processing'
+                               AND chapters.lease_expires_at < ?))
+                    ORDER BY chapters.status = 'failed', series.name,
+                             COALESCE(chapters.chapter_index, 999999),
+                             chapters.published_date, chapters.raw_path
+                    LIMIT 1""",
+                (*series_names, max_retries, now),
+            ).fetchone()
+            if not row:
+                return None
+            # Conditional on the row still being leasable: another request may
+            # have taken it between the SELECT and here.
+            cur = self._conn.execute(
+                """UPDATE chapters SET status='processing', lease_owner=?,
+                       lease_expires_at=?, updated_at=?
+                   WHERE id=? AND (status = 'pending'
+                                   OR (status = 'failed' AND retry_count < ?)
+                                   OR (status = 'processing' AND lease_expires_at < ?))""",
+                (worker, self._now(lease_s), now, row["id"], max_retries, now),
+            )
+            self._commit()
+            if cur.rowcount:
+                break
+        leased = self._conn.execute(
+            """SELECT chapters.*, series.name AS series_name
+               FROM chapters JOIN series ON series.id = chapters.series_id
+               WHERE chapters.id = ?""",
+            (row["id"],),
+        ).fetchone()
+        return dict(leased)
+
+    @_timed
+    def renew_lease(self, chapter_id, worker, lease_s):
+        """Extend `worker`'s lease on a chapter. False if the worker no longer holds it."""
+        now = self._now()
+        cur = self._conn.execute(
+            """UPDATE chapters SET lease_expires_at=?, updated_at=?
+               WHERE id=? AND status='processing' AND lease_owner=?""",
+            (self._now(lease_s), now, chapter_id, worker),
+        )
+        self._commit()
+        return cur.rowcount > 0
+
+    @_timed
+    def get_leases(self):
+        """Chapters currently leased to remote workers, with their series name."""
+        cur = self._conn.execute(
+            """SELECT chapters.*, series.name AS series_name
+               FROM chapters JOIN series ON series.id = chapters.series_id
+               WHERE chapters.status = 'processing' AND chapters.lease_owner IS NOT NULL
+               ORDER BY chapters.lease_expires_at"""
+        )
+        return [dict(r) for r in cur.fetchall()]
+
     # ── Queries ─────────────────────────────────────────────────────
 
+    @_timed
     def get_chapter_by_id(self, chapter_id):
         """Return a chapter row as a dict, or None."""
         cur = self._conn.execute("SELECT * FROM chapters WHERE id = ?", (chapter_id,))
         row = cur.fetchone()
         return dict(row) if row else None
 
+    @_timed
     def get_actionable(self, series_name):
         """Return chapters that need processing (pending or failed), ordered for processing."""
         series = self.get_series(series_name)
@@ -254,6 +519,7 @@ class ChapterDB:
         )
         return [dict(r) for r in cur.fetchall()]
 
+    @_timed
     def get_chapters(self, series_name, status=None):
         """All chapters for a series, optionally filtered by status."""
         series = self.get_series(series_name)
@@ -271,6 +537,7 @@ class ChapterDB:
             )
         return [dict(r) for r in cur.fetchall()]
 
+    @_timed
     def get_failed(self, series_name=None):
         """Failed chapters across all series (or one), newest failures first.
 
@@ -287,6 +554,7 @@ class ChapterDB:
         cur = self._conn.execute(sql, params)
         return [dict(r) for r in cur.fetchall()]
 
+    @_timed
     def summary(self, series_name=None):
         """Return status counts: ``{'pending': N, 'processing': N, 'done': N, 'failed': N}``."""
         counts = {"pending": 0, "processing": 0, "done": 0, "failed": 0}
@@ -304,6 +572,7 @@ class ChapterDB:
             counts[row[0]] = row[1]
         return counts
 
+    @_timed
     def stats(self):
         """Generation statistics across all series.
 
@@ -326,14 +595,201 @@ class ChapterDB:
             'done_30d': row['done_30d'] or 0,
         }
 
-    # ── Backward compatibility ──────────────────────────────────────
+    @_timed
+    def dashboard(self):
+        """Status counts and narrator of every series, plus stats(), in one query.
+
+        Returns ``{'series': {name: {'narrator', 'pending', 'processing', 'done',
+        'failed'}}, 'stats': {...}}`` with stats shaped as stats() returns them.
+        Replaces a summary() + get_series() pair per series: the counts come
+        from the (series_id, status) covering index and the stats from one
+        pass over done chapters. Series without chapters have zero counts.
+        """
+        rows = self._conn.execute(
+            """WITH counts AS (
+                   SELECT series_id, status, COUNT(*) AS n
+                   FROM chapters GROUP BY series_id, status),
+               stats AS (
+                   SELECT COUNT(*) AS done_count,
+                          COALESCE(SUM(duration_s), 0) AS total_s,
+                          SUM(CASE WHEN updated_at >= datetime('now', '-7 days')
+                              THEN 1 ELSE 0 END) AS done_7d,
+                          SUM(CASE WHEN updated_at >= datetime('now', '-30 days')
+                              THEN 1 ELSE 0 END) AS done_30d
+                   FROM chapters WHERE status = 'done')
+               SELECT series.name, series.narrator, counts.status, counts.n, stats.*
+               FROM stats LEFT JOIN series LEFT JOIN counts ON counts.series_id = series.id"""
+        ).fetchall()
+        series = {}
+        for row in rows:
+            if row['name'] is None:
+                continue   # no series yet: the lone stats row
+            counts = series.setdefault(row['name'], {
+                'narrator': row['narrator'],
+                'pending': 0, 'processing': 0, 'done': 0, 'failed': 0,
+            })
+            if row['status'] is not None:
+                counts[row['status']] = row['n']
+        row = rows[0]
+        return {
+            'series': series,
+            'stats': {
+                'done_count': row['done_count'] or 0,
+                'tracked_hours': (row['total_s'] or 0) / 3600,
+                'done_7d': row['done_7d'] or 0,
+                'done_30d': row['done_30d'] or 0,
+            },
+        }
+
+    # ── Timings ─────────────────────────────────────────────────────
+
+    @_timed
+    def record_timings(self, spans, job_id=None):
+        """Persist events.Span records; chapter spans are linked by raw_path."""
+        rows = []
+        for span in spans:
+            created = datetime.fromtimestamp(span.ts, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            rows.append((span.raw_path, job_id, span.series, span.narrator, span.name,
+                         span.wall_s, span.audio_s, span.rtf, span.chars, span.chunks,
+                         span.retries, created))
+        if not rows:
+            return
+        self._conn.executemany(
+            """INSERT INTO timings
+                   (chapter_id, job_id, series, narrator, span, wall_s, audio_s, rtf,
+                    chars, chunks, retries, created_at)
+               VALUES ((SELECT id FROM chapters WHERE raw_path = ?),
+                       ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        self._commit()
+
+    @_timed
+    def timing_summary(self, days=56, bucket='week'):
+        """Throughput trends from the timings table over the last `days`.
+
+        Returns a dict of row lists, each row one (group, period):
+
+        * ``series``: finished chapters per series — chapters, audio hours,
+          end-to-end wall time, realtime factor, chars/s, chunk retries.
+        * ``narrators``: TTS generate calls per voice — batches, chunks,
+          audio seconds, generation wall time and realtime factor.
+        * ``phases``: total and mean wall time per phase span.
+
+        ``bucket`` is 'day' or 'week' (weeks start on Monday).
+        """
+        if bucket == 'day':
+            period = "date(created_at)"
+        elif bucket == 'week':
+            period = "date(created_at, 'weekday 0', '-6 days')"
+        else:
+            raise ValueError(f"bucket must be 'day' or 'week', not {bucket!r}")
+        since = f"-{int(days)} days"
+        series = self._conn.execute(
+            f"""SELECT series, {period} AS period, COUNT(*) AS chapters,
+                       SUM(audio_s) AS audio_s, SUM(wall_s) AS wall_s,
+                       SUM(chars) AS chars, SUM(chunks) AS chunks,
+                       SUM(retries) AS retries
+                FROM timings
+                WHERE span = 'chapter' AND created_at >= datetime('now', ?)
+                GROUP BY series, period ORDER BY period, series""",
+            (since,),
+        ).fetchall()
+        narrators = self._conn.execute(
+            f"""SELECT narrator, {period} AS period, COUNT(*) AS batches,
+                       SUM(chunks) AS chunks, SUM(chars) AS chars,
+                       SUM(audio_s) AS audio_s, SUM(wall_s) AS wall_s,
+                       SUM(span = 'retry') AS retry_batches
+                FROM timings
+                WHERE span IN ('batch', 'retry') AND created_at >= datetime('now', ?)
+                GROUP BY narrator, period ORDER BY period, narrator""",
+            (since,),
+        ).fetchall()
+        phases = self._conn.execute(
+            """SELECT span, COUNT(*) AS count, SUM(wall_s) AS wall_s,
+                      AVG(wall_s) AS mean_s, MAX(wall_s) AS max_s
+               FROM timings WHERE created_at >= datetime('now', ?)
+               GROUP BY span ORDER BY wall_s DESC""",
+            (since,),
+        ).fetchall()
+
+        def rates(row):
+            d = dict(row)
+            audio, wall = d.get('audio_s') or 0, d.get('wall_s') or 0
+            d['rtf'] = wall / audio if audio else None
+            d['chars_per_s'] = (d.get('chars') or 0) / wall if wall else None
+            return d
+
+        return {
+            'bucket': bucket,
+            'days': int(days),
+            'series': [rates(r) for r in series],
+            'narrators': [rates(r) for r in narrators],
+            'phases': [dict(r) for r in phases],
+        }
+
+    # ── Filesystem sync ─────────────────────────────────────────────
+
+    def _listing(self, path):
+        """File names in directory `path`, from the manifest when its mtime is unchanged.
+
+        One stat when the directory is unchanged, one scandir otherwise — the
+        directory mtime moves whenever an entry is added, removed or renamed,
+        except for an entry added later within the same mtime tick. So a
+        listing is cached only once a second scan, at least MANIFEST_SLACK_S
+        later (by the local clock), finds the same mtime and the same names:
+        anything added after that is past the tick and moves the mtime. The
+        mtime itself is only compared for equality, never against the local
+        clock, whose skew from the file server's is unknown. A missing
+        directory lists as empty.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return set()
+        row = self._conn.execute(
+            "SELECT mtime_ns, names, seen_mtime_ns, seen_at FROM dir_manifest WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row and row["mtime_ns"] == mtime_ns:
+            return set(json.loads(row["names"]))
+        with os.scandir(path) as it:
+            names = {e.name for e in it if e.is_file()}
+        listing = json.dumps(sorted(names))
+        now = time.time()
+        seen_at = now
+        if row and row["seen_mtime_ns"] == mtime_ns and row["names"] == listing:
+            seen_at = row["seen_at"]   # same listing as the earlier scan: confirming it
+        settled = now - seen_at >= MANIFEST_SLACK_S
+        self._conn.execute(
+            """INSERT OR REPLACE INTO dir_manifest (path, mtime_ns, names, seen_mtime_ns, seen_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            (path, mtime_ns if settled else None, listing, mtime_ns, seen_at),
+        )
+        return names
+
+    @staticmethod
+    def _in_listing(path, directory, names):
+        """Whether file `path` exists, answered from `directory`'s listing when it is there."""
+        if _same_dir(os.path.dirname(path), directory):
+            return os.path.basename(path) in names
+        return os.path.exists(path)
 
+    @_timed
     def sync_filesystem(self, series_name, raws_dir, output_dir):
         """Reconcile DB state with the filesystem.
 
-        1. Reset stale 'processing' rows back to 'pending' (crash recovery).
+        1. Reset stale 'processing' rows back to 'pending' (crash recovery),
+           except chapters a remote worker holds an unexpired lease on.
         2. Register any .txt files in *raws_dir* not yet tracked.
         3. Mark chapters whose output .mp3 or .wav already exists as 'done'.
+        4. Reset 'done' chapters whose output no longer exists to 'pending'.
+        5. Remove chapters whose raw .txt no longer exists.
+
+        Each directory is listed at most once (see _listing) and the series'
+        rows are read in one query; steps 2-5 are set differences in memory,
+        written in bulk as one transaction, so an unchanged series costs two
+        stats and a SELECT.
         """
         series = self.get_series(series_name)
         if not series:
@@ -341,84 +797,124 @@ class ChapterDB:
         series_id = series["id"]
         now = self._now()
 
-        # 1. Reset stale processing → pending
-        reset_cur = self._conn.execute(
-            "UPDATE chapters SET status='pending', updated_at=? WHERE series_id=? AND status='processing'",
-            (now, series_id),
-        )
-        if reset_cur.rowcount:
-            print(f"[sync] {series_name}: reset {reset_cur.rowcount} stale processing → pending")
-
-        # 2. Register untracked .txt files
-        registered = 0
-        if os.path.isdir(raws_dir):
-            for fname in os.listdir(raws_dir):
-                if not fname.endswith(".txt") or fname.endswith("_cleaned.txt"):
-                    continue
-                raw_path = os.path.join(raws_dir, fname)
+        with self.transaction():
+            # 1. Reset stale processing → pending (live remote leases excepted)
+            reset_cur = self._conn.execute(
+                """UPDATE chapters SET status='pending', lease_owner=NULL,
+                       lease_expires_at=NULL, updated_at=?
+                   WHERE series_id=? AND status='processing' AND """ + self._UNLEASED,
+                (now, series_id, now),
+            )
+            if reset_cur.rowcount:
+                print(f"[sync] {series_name}: reset {reset_cur.rowcount} stale processing → pending")
+
+            raw_names = {n for n in self._listing(raws_dir)
+                         if n.endswith(".txt") and not n.endswith("_cleaned.txt")}
+            out_names = self._listing(output_dir)
+            rows = self._series_files(series_id)
+            tracked = {os.path.basename(r["raw_path"]) for r in rows
+                       if _same_dir(os.path.dirname(r["raw_path"]), raws_dir)}
+
+            # 2. Register untracked .txt files
+            new_chapters = []
+            for fname in sorted(raw_names - tracked):
                 # Derive title from filename: strip date prefix and extension
                 base = os.path.splitext(fname)[0]
                 title = base.split("_", 1)[-1] if "_" in base else base
                 # Extract published_date from filename prefix if it looks like a date
                 parts = base.split("_", 1)
                 published_date = parts[0] if len(parts) > 1 else None
-                existing = self._conn.execute(
-                    "SELECT id FROM chapters WHERE raw_path = ?", (raw_path,)
-                ).fetchone()
-                self.register(series_name, title, raw_path, published_date=published_date)
-                if not existing:
-                    registered += 1
-        if registered:
-            print(f"[sync] {series_name}: registered {registered} new chapter(s) from filesystem")
-
-        # 3. Mark chapters with existing output as done
-        marked = 0
-        cur = self._conn.execute(
-            "SELECT raw_path FROM chapters WHERE series_id=? AND status != 'done'",
-            (series_id,),
-        )
-        for row in cur.fetchall():
-            raw = row["raw_path"]
-            base = os.path.splitext(os.path.basename(raw))[0]
-            mp3 = os.path.join(output_dir, f"{base}.mp3")
-            wav = os.path.join(output_dir, f"{base}.wav")
-            if os.path.exists(mp3) or os.path.exists(wav):
-                self._conn.execute(
-                    "UPDATE chapters SET status='done', output_path=?, updated_at=? WHERE raw_path=?",
-                    (mp3 if os.path.exists(mp3) else wav, now, raw),
-                )
-                marked += 1
-        if marked:
-            print(f"[sync] {series_name}: marked {marked} chapter(s) done from existing audio")
-
-        # 4. Reset 'done' chapters whose output no longer exists → pending
-        reverted = 0
-        cur = self._conn.execute(
-            "SELECT raw_path, output_path FROM chapters WHERE series_id=? AND status='done'",
-            (series_id,),
-        )
-        for row in cur.fetchall():
-            out = row["output_path"]
-            if out and not os.path.exists(out):
-                self._conn.execute(
-                    "UPDATE chapters SET status='pending', output_path=NULL, updated_at=? WHERE raw_path=?",
-                    (now, row["raw_path"]),
-                )
-                reverted += 1
-        if reverted:
-            print(f"[sync] {series_name}: reverted {reverted} chapter(s) to pending (output missing)")
-
-        # 5. Remove DB entries whose raw .txt no longer exists on disk
-        removed = 0
-        cur = self._conn.execute(
-            "SELECT id, raw_path FROM chapters WHERE series_id=?",
+                new_chapters.append({'title': title, 'raw_path': os.path.join(raws_dir, fname),
+                                     'published_date': published_date})
+            registered = self.register_many(series_name, new_chapters)
+            if registered:
+                print(f"[sync] {series_name}: registered {registered} new chapter(s) from filesystem")
+                rows = self._series_files(series_id)
+
+            done, reverted, removed = [], [], []
+            for row in rows:
+                raw = row["raw_path"]
+                # 5. Chapters whose raw .txt no longer exists
+                if not self._in_listing(raw, raws_dir, raw_names):
+                    removed.append((row["id"],))
+                    continue
+                if row["status"] != "done":
+                    # 3. Chapters with existing output → done
+                    base = os.path.splitext(os.path.basename(raw))[0]
+                    for ext in (".mp3", ".wav"):
+                        if f"{base}{ext}" in out_names:
+                            done.append((raw, os.path.join(output_dir, f"{base}{ext}")))
+                            break
+                elif row["output_path"] and not self._in_listing(row["output_path"], output_dir,
+                                                                 out_names):
+                    # 4. 'done' chapters whose output is gone → pending
+                    reverted.append((now, row["id"]))
+
+            if done:
+                self.mark_done_many(done)
+                print(f"[sync] {series_name}: marked {len(done)} chapter(s) done from existing audio")
+            if reverted:
+                self._conn.executemany(
+                    "UPDATE chapters SET status='pending', output_path=NULL, updated_at=? WHERE id=?",
+                    reverted)
+                print(f"[sync] {series_name}: reverted {len(reverted)} chapter(s) to pending (output missing)")
+            if removed:
+                self._conn.executemany("DELETE FROM chapters WHERE id=?", removed)
+                print(f"[sync] {series_name}: removed {len(removed)} stale chapter(s) (raw file missing)")
+
+    def _series_files(self, series_id):
+        return self._conn.execute(
+            "SELECT id, raw_path, output_path, status FROM chapters WHERE series_id=?",
             (series_id,),
-        )
-        for row in cur.fetchall():
-            if not os.path.exists(row["raw_path"]):
-                self._conn.execute("DELETE FROM chapters WHERE id=?", (row["id"],))
-                removed += 1
-        if removed:
-            print(f"[sync] {series_name}: removed {removed} stale chapter(s) (raw file missing)")
+        ).fetchall()
+
 
-        self._conn.commit()
+class ChapterDBPool:
+    """Reusable ChapterDB connections for short request-scoped use (API handlers).
+
+    Opening a ChapterDB connects over the share, sets WAL, and runs the
+    schema script and migrations; at a 2-second GUI poll that dominated the
+    cost of the query itself. The pool does the setup on its first
+    connection only and hands idle connections back out, keeping at most
+    `max_idle` open. Connections are not tied to a thread, so the FastAPI
+    threadpool can use them.
+    """
+
+    def __init__(self, db_path, max_idle=4):
+        self._db_path = db_path
+        self._max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def acquire(self):
+        """An idle connection, or a new one (raises if the DB cannot be opened)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            setup = not self._schema_ready
+        db = ChapterDB(self._db_path, setup=setup, shared=True)
+        self._schema_ready = True
+        return db
+
+    def release(self, db, broken=False):
+        """Return a connection; `broken` ones (a DB or I/O error) are closed instead."""
+        if not broken:
+            try:
+                if db._conn.in_transaction:
+                    db._conn.rollback()
+            except sqlite3.Error:
+                broken = True
+        db.on_query = None
+        db._tx_depth = 0
+        with self._lock:
+            if not broken and len(self._idle) < self._max_idle:
+                self._idle.append(db)
+                return
+        db.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for db in idle:
+            db.close()
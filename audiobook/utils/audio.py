@@ -1,63 +1,12 @@
-"""FFmpeg wrappers for audio merging, modulation, speed adjustment, and MP3 conversion."""
+"""FFmpeg wrappers for modulation, speed and volume adjustment, and MP3 encoding."""
 
 import subprocess
 import os
-import tempfile
-from .colors import RED, GREEN, RESET
+from .colors import RED, RESET
 
+# Chapter output: a short trailing pad, at the rate every engine's audio ends up in
+CHAPTER_AUDIO_FILTER = 'apad=pad_dur=0.05,aresample=24000'
 
-def merge_audio(file_paths, output_path, timeout=None):
-    """Merge multiple audio files into a single WAV file using ffmpeg.
-
-    Args:
-        file_paths: List of paths to WAV files to concatenate.
-        output_path: Destination path for the merged WAV file.
-        timeout: Optional seconds before the ffmpeg call is killed (guards against
-            a hung/stalled write). Raises subprocess.TimeoutExpired on expiry.
-
-    Returns:
-        True if merge succeeded, False otherwise.
-    """
-
-    merge_succeeded = False
-    # Write the concat list to a unique file in the OS temp dir (not the CWD, which
-    # may be a Search-indexed/AV-watched folder that briefly locks new files) with
-    # absolute entry paths so ffmpeg resolves them regardless of the list location.
-    fd, list_path = tempfile.mkstemp(prefix='ffconcat_', suffix='.txt')
-    try:
-        with os.fdopen(fd, 'w', encoding='utf-8') as file_list:
-            for file_path in file_paths:
-                # Escape single quotes for ffmpeg
-                escaped_file_path = os.path.abspath(file_path).replace("'", "'\\''")
-                file_list.write(f"file '{escaped_file_path}'\n")
-
-        cmd = [
-            'ffmpeg',
-            '-y',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', list_path,
-            '-af', 'apad=pad_dur=0.05,aresample=24000',
-            output_path
-        ]
-
-        try:
-            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                           timeout=timeout)
-            print(f"\t{GREEN}Merged!{RESET}")
-            merge_succeeded = True
-        except subprocess.TimeoutExpired:
-            print(f"\t{RED}Timed out merging audio after {timeout}s{RESET}")
-            raise
-        except subprocess.CalledProcessError as e:
-            print(f"\t{RED}Error merging audio: {e}{RESET}")
-            raise
-    finally:
-        try:
-            os.remove(list_path)
-        except OSError:
-            pass  # best-effort: a transient lock on the temp list must not fail the merge
-    return merge_succeeded
 
 def modulate_audio(path, tmp_dir):
     """Apply flanger + chorus modulation to a WAV file in-place.
@@ -164,32 +113,32 @@ def get_audio_duration(path):
         return None
 
 
-def convert_to_mp3(wav_path, mp3_path, timeout=None):
-    """Convert a WAV file to MP3 using libmp3lame and remove the original WAV.
+def open_mp3_encoder(mp3_path, sample_rate):
+    """Start a long-lived MP3 encoder reading mono 16-bit PCM from stdin.
+
+    Encodes with libmp3lame at VBR quality 2, after CHAPTER_AUDIO_FILTER's
+    pad and resample to 24 kHz, so the MP3 does not depend on the engine's
+    native rate. Write raw s16le samples to the returned process's stdin,
+    close it, then wait() for the encode to finish.
 
     Args:
-        wav_path: Source WAV file path.
         mp3_path: Destination MP3 file path.
-        timeout: Optional seconds before the ffmpeg call is killed (guards against
-            a hung/stalled write). Raises subprocess.TimeoutExpired on expiry; the
-            source WAV is left in place so the step can be retried.
+        sample_rate: Sample rate of the PCM that will be written.
+
+    Returns:
+        The ffmpeg subprocess.Popen.
     """
     cmd = [
         'ffmpeg',
         '-y',
-        '-i', wav_path,
+        '-f', 's16le',
+        '-ar', str(sample_rate),
+        '-ac', '1',
+        '-i', 'pipe:0',
+        '-af', CHAPTER_AUDIO_FILTER,
         '-codec:a', 'libmp3lame',
         '-qscale:a', '2',
         mp3_path
     ]
-    try:
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                       timeout=timeout)
-        os.remove(wav_path)
-        print(f"\t{GREEN}Converted to MP3!{RESET}")
-    except subprocess.TimeoutExpired:
-        print(f"\t{RED}Timed out converting to MP3 after {timeout}s{RESET}")
-        raise
-    except subprocess.CalledProcessError as e:
-        print(f"\t{RED}Error converting to MP3: {e}{RESET}")
-        raise
\ No newline at end of file
+    return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
@@ -0,0 +1,143 @@
+"""In-process numpy audio effects: volume, tempo, and the system-voice modulation.
+
+Mirrors the ffmpeg filter chains in utils/audio.py (``volume``, ``atempo`` and
+``flanger,chorus,volume=1.5``) on float waveforms, so TTS output can be
+post-processed in memory before its single write instead of forking ffmpeg
+and round-tripping the WAV once per effect. The ffmpeg wrappers remain the
+reference implementation (config ``audio_postproc: ffmpeg``).
+"""
+
+import numpy as np
+
+TEMPO_FRAME_S = 0.040   # WSOLA analysis window; ~ffmpeg atempo's default scale
+
+# ffmpeg 'flanger=delay=20:depth=5' (regen=0, width=71, speed=0.5 defaults)
+FLANGER_DELAY_MS = 20.0
+FLANGER_DEPTH_MS = 5.0
+FLANGER_WIDTH = 0.71
+FLANGER_SPEED_HZ = 0.5
+# ffmpeg 'chorus=0.5:0.9:50:0.7:0.5:2' (in_gain:out_gain:delay:decay:speed:depth)
+CHORUS_IN_GAIN = 0.5
+CHORUS_OUT_GAIN = 0.9
+CHORUS_DELAY_MS = 50.0
+CHORUS_DECAY = 0.7
+CHORUS_SPEED_HZ = 0.5
+CHORUS_DEPTH_MS = 2.0
+MODULATE_GAIN = 1.5
+
+
+def _clip(wav):
+    return np.clip(wav, -1.0, 1.0).astype(np.float32, copy=False)
+
+
+def apply_volume(wav, volume):
+    """Scale a waveform by `volume` (1.0 = no change), clipping to [-1, 1]."""
+    if volume is None or volume == 1.0:
+        return wav
+    return _clip(wav * volume)
+
+
+def _modulated_delay(wav, sr, base_ms, depth_ms, rate_hz):
+    """Return `wav` read back through a sinusoidally swept delay line.
+
+    The delay sweeps between base_ms and base_ms + depth_ms; fractional
+    positions are linearly interpolated (ffmpeg's default interp=linear).
+    """
+    n = np.arange(len(wav), dtype=np.float64)
+    sweep = (1.0 + np.sin(2.0 * np.pi * rate_hz * n / sr)) / 2.0
+    delay = (base_ms + depth_ms * sweep) * sr / 1000.0
+    return np.interp(n - delay, n, wav, left=0.0).astype(np.float32)
+
+
+def modulate(wav, sr):
+    """Flanger + chorus + 1.5x gain — the system-voice effect from modulate_audio."""
+    if len(wav) == 0:
+        return wav
+    wav = np.asarray(wav, dtype=np.float32)
+    flanged = _modulated_delay(wav, sr, FLANGER_DELAY_MS, FLANGER_DEPTH_MS,
+                               FLANGER_SPEED_HZ)
+    wav = (wav + FLANGER_WIDTH * flanged) / (1.0 + FLANGER_WIDTH)
+    chorused = _modulated_delay(wav, sr, CHORUS_DELAY_MS, CHORUS_DEPTH_MS,
+                                CHORUS_SPEED_HZ)
+    wav = (wav * CHORUS_IN_GAIN + chorused * CHORUS_DECAY) * CHORUS_OUT_GAIN
+    return _clip(wav * MODULATE_GAIN)
+
+
+def change_tempo(wav, sr, speed):
+    """Time-stretch a mono waveform by `speed` without changing pitch (WSOLA).
+
+    Each output frame is overlap-added from the input position within a small
+    tolerance of its nominal one that best continues the previous frame, which
+    keeps voiced speech free of the phasing a plain overlap-add produces.
+    """
+    if speed == 1.0 or len(wav) == 0:
+        return wav
+    wav = np.asarray(wav, dtype=np.float32)
+    frame = max(64, int(sr * TEMPO_FRAME_S)) // 2 * 2
+    hop = frame // 2
+    tol = hop // 2
+    window = np.hanning(frame).astype(np.float32)
+
+    # Pad so every search region and frame slice stays in bounds
+    src = np.concatenate([np.zeros(tol, np.float32), wav,
+                          np.zeros(frame + tol, np.float32)])
+    n_frames = int(len(wav) / (hop * speed)) + 1
+    out = np.zeros(n_frames * hop + frame, np.float32)
+    norm = np.zeros_like(out)
+
+    pos = tol
+    for k in range(n_frames):
+        nominal = tol + int(round(k * hop * speed))
+        if k:
+            # Natural continuation of the previous frame's overlap half
+            target = src[pos + hop:pos + frame]
+            lo = nominal - tol
+            region = src[lo:nominal + tol + hop]
+            pos = lo + int(np.argmax(np.correlate(region, target, mode='valid')))
+        else:
+            pos = nominal
+        start = k * hop
+        out[start:start + frame] += src[pos:pos + frame] * window
+        norm[start:start + frame] += window
+
+    norm[norm < 1e-3] = 1.0
+    out /= norm
+    return _clip(out[:int(round(len(wav) / speed))])
+
+
+def build_chain(volume=None, speed=1.0, modulate_system=False):
+    """Return fn(wav, sr) -> wav applying the requested effects, or None if a no-op.
+
+    Order matches the ffmpeg path in TTSProcessor: modulation, then tempo,
+    then volume.
+    """
+    steps = []
+    if modulate_system:
+        steps.append(modulate)
+    if speed and speed != 1.0:
+        steps.append(lambda wav, sr: change_tempo(wav, sr, speed))
+    if volume is not None and volume != 1.0:
+        steps.append(lambda wav, sr: apply_volume(wav, volume))
+    if not steps:
+        return None
+
+    def chain(wav, sr):
+        for step in steps:
+            wav = step(wav, sr)
+        return wav
+    return chain
+
+
+def process_file(path, chain):
+    """Apply `chain` to a WAV file in-place with one read and one write.
+
+    For engines that can only synthesize straight to a file.
+    """
+    if chain is None:
+        return path
+    import soundfile as sf
+    wav, sr = sf.read(path, dtype='float32')
+    if wav.ndim > 1:
+        wav = wav.mean(axis=1)
+    sf.write(path, chain(wav, sr), sr)
+    return path
@@ -21,19 +21,19 @@ def _build_dashboard_data(runner):
         return {'rows': [], 'stats': None}
 
     try:
+        dashboard = db.dashboard()
         rows = []
         for series in enabled:
             name = series.get('name', 'Unnamed')
-            s = db.summary(name)
-            series_info = db.get_series(name)
+            s = dashboard['series'].get(name)
             rows.append({
                 'name': name,
-                'done': s['done'],
-                'pending': s['pending'],
-                'failed': s['failed'],
-                'narrator': series_info.get('narrator', '') if series_info else series.get('narrator', ''),
+                'done': s['done'] if s else 0,
+                'pending': s['pending'] if s else 0,
+                'failed': s['failed'] if s else 0,
+                'narrator': s['narrator'] if s else series.get('narrator', ''),
             })
-        return {'rows': rows, 'stats': db.stats()}
+        return {'rows': rows, 'stats': dashboard['stats']}
     finally:
         db.close()
 
@@ -77,7 +77,7 @@ def create_dashboard(runner: PipelineRunner):
             btn_scrape.props('flat outline').style(
                 f'color: {TEXT_DIM}; border-color: {TEXT_DIM}')
             btn_sync = ui.button('Sync Filesystem',
-                on_click=lambda: _sync_filesystem(runner, log_area))
+                on_click=lambda: _enqueue(runner.start_sync))
             btn_sync.props('flat outline').style(
                 f'color: {TEXT_DIM}; border-color: {TEXT_DIM}')
             ui.button('Add Series', on_click=lambda: open_add_series(
@@ -213,20 +213,3 @@ def _enqueue(start_fn):
 def _clear_log(runner, log_area):
     runner.clear_log()
     log_area.clear()
-
-
-async def _sync_filesystem(runner, log_area):
-    if runner.is_busy:
-        ui.notify('Pipeline is busy', type='warning')
-        return
-    ui.notify('Syncing filesystem...')
-
-    def do_sync():
-        runner.sync_all()
-
-    try:
-        await run.io_bound(do_sync)
-        log_area.push('[sync] Filesystem sync complete')
-        ui.notify('Sync complete', type='positive')
-    except Exception as ex:
-        ui.notify(f'Error: {ex}', type='negative')
@@ -6,6 +6,8 @@ from nicegui import ui, run
 from ..server.health import _exists_with_timeout, check_health  # noqa: F401
 from .theme import ERROR, SUCCESS, TEXT_DIM, WARNING
 
+REPLICATION_LAG_WARN_S = 600   # share copy of a local_db this far behind turns amber
+
 
 def _chip(label, color):
     return (
@@ -29,12 +31,21 @@ def render_health_html(health):
             chips.append(_chip(f'db {health["db_size_mb"]:.1f} MB', TEXT_DIM))
     else:
         chips.append(_chip('share unreachable', ERROR))
+    if 'replication_lag_s' in health:
+        lag = health['replication_lag_s']
+        color = ERROR if health.get('replication_error') else (
+            WARNING if lag > REPLICATION_LAG_WARN_S else SUCCESS)
+        chips.append(_chip(f'replica {"current" if not lag else f"{lag / 60:.0f}m behind"}',
+                           color))
 
     if health.get('model_loaded'):
         vram = ''
         if 'vram_used_gb' in health:
             vram = f' {health["vram_used_gb"]:.1f}/{health["vram_total_gb"]:.0f} GB'
-        chips.append(_chip(f'model loaded{vram}', WARNING))
+        label = 'model loaded'
+        if health.get('model_unload_in_s') is not None:
+            label += f' (unload in {health["model_unload_in_s"] / 60:.0f}m)'
+        chips.append(_chip(f'{label}{vram}', WARNING))
     elif 'vram_used_gb' in health:
         chips.append(_chip(
             f'vram {health["vram_used_gb"]:.1f}/{health["vram_total_gb"]:.0f} GB',
@@ -54,7 +65,9 @@ def create_health_strip(runner):
     db_path = runner._db_path
 
     async def refresh():
-        health = await run.io_bound(check_health, output_dir, db_path)
+        health = await run.io_bound(check_health, output_dir, db_path,
+                                    runner.queue.model_status(),
+                                    runner.replication_status())
         holder.set_content(render_health_html(health))
 
     ui.timer(10.0, refresh)
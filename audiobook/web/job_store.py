@@ -0,0 +1,98 @@
+"""SQLite persistence for the job queue, so queued and interrupted jobs survive a restart.
+
+The jobs table lives in audiobook.db by default. Config ``job_db`` points it
+at a local sidecar file instead — every write is small, but it happens on
+each job transition and checkpoint, which adds up on a slow share.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+
+class JobStore:
+    """Rows of the jobs table as plain dicts (JobQueue converts to and from Job).
+
+    One connection shared by the queue's worker threads, serialized by a lock.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        series TEXT,
+        chapter_id INTEGER,
+        chapter_title TEXT,
+        priority INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        error TEXT NOT NULL DEFAULT '',
+        progress TEXT NOT NULL DEFAULT '{}',
+        checkpoint TEXT NOT NULL DEFAULT '{}'
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at);
+    """
+
+    _JSON_COLUMNS = ('progress', 'checkpoint')
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def save(self, row):
+        """Insert or replace one job row."""
+        values = dict(row)
+        for col in self._JSON_COLUMNS:
+            values[col] = json.dumps(values.get(col) or {})
+        cols = ', '.join(values)
+        marks = ', '.join('?' * len(values))
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO jobs ({cols}) VALUES ({marks})",
+                               tuple(values.values()))
+            self._conn.commit()
+
+    def load(self, history_len):
+        """Return (active, history): queued/running rows oldest first, and the
+        `history_len` most recently finished rows newest first."""
+        with self._lock:
+            active = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+            history = self._conn.execute(
+                """SELECT * FROM jobs WHERE status NOT IN ('queued', 'running')
+                   ORDER BY finished_at DESC LIMIT ?""",
+                (history_len,),
+            ).fetchall()
+        return [self._decode(r) for r in active], [self._decode(r) for r in history]
+
+    def prune(self, keep):
+        """Delete finished rows beyond the `keep` most recent."""
+        with self._lock:
+            self._conn.execute(
+                """DELETE FROM jobs WHERE status NOT IN ('queued', 'running') AND id NOT IN (
+                       SELECT id FROM jobs WHERE status NOT IN ('queued', 'running')
+                       ORDER BY finished_at DESC LIMIT ?)""",
+                (keep,),
+            )
+            self._conn.commit()
+
+    def _decode(self, row):
+        out = dict(row)
+        for col in self._JSON_COLUMNS:
+            out[col] = json.loads(out[col] or '{}')
+        return out
@@ -1,11 +1,32 @@
-"""In-memory FIFO job queue executing pipeline operations on a single worker thread.
+"""Persistent job queue executing pipeline operations on per-resource worker lanes.
 
 Replaces the old one-shot PipelineRunner threading: operations are queued
 instead of rejected, a running job can be cancelled cooperatively, and the
 GUI observes everything through locked snapshots and a seq-numbered event
 ring buffer (safe for any number of browser tabs).
+
+Each job type declares the resources it needs (GPU, network, disk) and runs
+on the matching lane: one GPU worker (the TTS model is a singleton), N scrape
+workers, and one maintenance worker. So a scrape no longer waits behind a
+multi-hour generation. A queued job starts only once no running job it
+conflicts with holds an overlapping scope (see Job.conflicts_with).
+
+Within a lane, jobs start by priority (interactive single-chapter jobs, then
+single-series jobs, then bulk ones), FIFO within a priority. An interactive
+job also preempts a running job of its lane at the next safe boundary
+(PipelineContext.yield_point): it runs inline on that worker, then the
+preempted job carries on where it stopped.
+
+Queued and running jobs, with a checkpoint of the phases started and series
+finished, and recent history are written to a JobStore (web/job_store.py: the
+jobs table of audiobook.db, or the ``job_db`` sidecar) on every transition.
+On start the queue restores them: queued jobs are re-queued in order, a job
+that was running is re-queued to resume after its last finished series (its
+chapters left 'processing' are reset), and generation inside a series resumes
+at the first chapter not yet done. Without a store the queue is in-memory only.
 """
 
+import copy
 import logging
 import threading
 import time
@@ -13,11 +34,12 @@ import traceback
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 
 from ..config import load_config, save_config
-from ..events import EventType, JobCancelled, PipelineContext
+from ..events import TRANSIENT_SPANS, EventType, JobCancelled, PipelineContext
 from ..state import ChapterDB
+from .metrics import QueueMetrics
 
 logger = logging.getLogger('audiobook')
 
@@ -29,6 +51,7 @@ class JobType(Enum):
     GENERATE_SERIES = 'generate_series'
     REGENERATE_CHAPTER = 'regenerate_chapter'
     RESCRAPE_CHAPTER = 'rescrape_chapter'
+    SYNC_FILESYSTEM = 'sync_filesystem'
 
 
 JOB_TYPE_LABELS = {
@@ -38,10 +61,65 @@ JOB_TYPE_LABELS = {
     JobType.GENERATE_SERIES: 'Generate',
     JobType.REGENERATE_CHAPTER: 'Regenerate',
     JobType.RESCRAPE_CHAPTER: 'Rescrape',
+    JobType.SYNC_FILESYSTEM: 'Sync',
 }
 
 # Job types whose work is scraping (for the SCRAPING/GENERATING state badge)
 SCRAPE_TYPES = {JobType.SCRAPE_ALL, JobType.SCRAPE_SERIES, JobType.RESCRAPE_CHAPTER}
+# Job types that synthesize audio (the TTS model is preloaded when they start)
+GENERATE_TYPES = {JobType.FULL_PIPELINE, JobType.GENERATE_SERIES,
+                  JobType.REGENERATE_CHAPTER}
+
+
+class Resource(Enum):
+    GPU = 'gpu'             # the TTS model
+    NETWORK = 'network'     # source sites; scrapes of one series must not overlap
+    DISK = 'disk'           # whole-tree DB/filesystem reconciliation
+
+
+JOB_RESOURCES = {
+    JobType.FULL_PIPELINE: frozenset({Resource.NETWORK, Resource.GPU}),
+    JobType.SCRAPE_ALL: frozenset({Resource.NETWORK}),
+    JobType.SCRAPE_SERIES: frozenset({Resource.NETWORK}),
+    JobType.GENERATE_SERIES: frozenset({Resource.GPU}),
+    JobType.REGENERATE_CHAPTER: frozenset({Resource.GPU}),
+    JobType.RESCRAPE_CHAPTER: frozenset({Resource.NETWORK}),
+    JobType.SYNC_FILESYSTEM: frozenset({Resource.DISK}),
+}
+
+# Resources still held once a job has started a later phase: a full pipeline
+# gives up NETWORK when its audio phase starts, so scrapes run alongside the
+# hours of generation instead of waiting for the whole job.
+PHASE_RESOURCES = {
+    JobType.FULL_PIPELINE: {'audio': frozenset({Resource.GPU})},
+}
+
+class Priority(IntEnum):
+    INTERACTIVE = 0     # one chapter someone is waiting on; preempts
+    SERIES = 1
+    BULK = 2
+
+
+JOB_PRIORITY = {
+    JobType.REGENERATE_CHAPTER: Priority.INTERACTIVE,
+    JobType.RESCRAPE_CHAPTER: Priority.INTERACTIVE,
+    JobType.SCRAPE_SERIES: Priority.SERIES,
+    JobType.GENERATE_SERIES: Priority.SERIES,
+    JobType.FULL_PIPELINE: Priority.BULK,
+    JobType.SCRAPE_ALL: Priority.BULK,
+    JobType.SYNC_FILESYSTEM: Priority.BULK,
+}
+
+# Priorities that preempt a running lower-priority job at a yield point
+# (single-series jobs only jump the queue; they do not pause a bulk run).
+PREEMPTING = frozenset({Priority.INTERACTIVE})
+
+# Worker lanes, in lane-selection order: a job runs on the first lane whose
+# resource it needs (FULL_PIPELINE scrapes too, but holds the GPU lane).
+# The lane is chosen by JOB_RESOURCES, before any phase releases resources.
+LANE_RESOURCES = (('gpu', Resource.GPU), ('scrape', Resource.NETWORK),
+                  ('maintenance', Resource.DISK))
+DEFAULT_SCRAPE_WORKERS = 2
 
 
 class JobStatus(Enum):
@@ -67,6 +145,12 @@ class Job:
     error: str = ""
     progress: dict = field(default_factory=dict)
     cancel_event: threading.Event = field(default_factory=threading.Event)
+    priority: Priority | None = None        # None: JOB_PRIORITY for the type
+    checkpoint: dict = field(default_factory=dict)  # {'phases': [...], 'series_done': {phase: [...]}}
+
+    def __post_init__(self):
+        if self.priority is None:
+            self.priority = JOB_PRIORITY[self.type]
 
     def label(self):
         base = JOB_TYPE_LABELS.get(self.type, self.type.value)
@@ -76,10 +160,72 @@ class Job:
     def dedupe_key(self):
         return (self.type, self.series, self.chapter_id)
 
+    def to_row(self, status=None):
+        """JobStore row; `status` overrides (an interrupted job is stored as queued)."""
+        return {
+            'id': self.id,
+            'type': self.type.value,
+            'series': self.series,
+            'chapter_id': self.chapter_id,
+            'chapter_title': self.chapter_title,
+            'priority': int(self.priority),
+            'status': (status or self.status).value,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error,
+            'progress': self.progress,
+            'checkpoint': self.checkpoint,
+        }
+
+    @classmethod
+    def from_row(cls, row, fn):
+        return cls(type=JobType(row['type']), fn=fn, series=row['series'],
+                   chapter_id=row['chapter_id'], chapter_title=row['chapter_title'],
+                   id=row['id'], status=JobStatus(row['status']),
+                   created_at=row['created_at'], started_at=row['started_at'],
+                   finished_at=row['finished_at'], error=row['error'],
+                   progress=row['progress'], priority=Priority(row['priority']),
+                   checkpoint=row['checkpoint'])
+
+    @property
+    def resources(self):
+        phases = PHASE_RESOURCES.get(self.type, {})
+        for phase in reversed(self.checkpoint.get('phases', ())):
+            if phase in phases:
+                return phases[phase]
+        return JOB_RESOURCES[self.type]
+
+    @property
+    def lane(self):
+        for lane, resource in LANE_RESOURCES:
+            if resource in JOB_RESOURCES[self.type]:
+                return lane
+        return 'maintenance'
+
+    def conflicts_with(self, other):
+        """Whether the two jobs must not run at the same time.
+
+        Scopes overlap when either job covers every series (series=None) or
+        both name the same series. Overlapping jobs conflict when they share
+        a resource (two scrapes racing on one series' raws and 'latest'
+        cursor), when either needs DISK (sync resets 'processing' rows a
+        generation job owns), or when both target the same chapter
+        (rescrape vs regenerate).
+        """
+        if self.series is not None and other.series is not None and self.series != other.series:
+            return False
+        if self.chapter_id is not None and self.chapter_id == other.chapter_id:
+            return True
+        return bool(self.resources & other.resources
+                    or Resource.DISK in self.resources | other.resources)
+
     def snapshot(self):
         return {
             'id': self.id,
             'type': self.type.value,
+            'lane': self.lane,
+            'priority': self.priority.name.lower(),
             'label': self.label(),
             'series': self.series,
             'chapter_id': self.chapter_id,
@@ -89,33 +235,55 @@ class Job:
             'started_at': self.started_at,
             'finished_at': self.finished_at,
             'error': self.error,
-            'progress': dict(self.progress),
+            'progress': {k: dict(v) if isinstance(v, dict) else v
+                         for k, v in self.progress.items()},
         }
 
 
+# Model residency after the queue drains (config: tts_unload / tts_idle_unload_min)
+UNLOAD_POLICIES = ('idle', 'immediate', 'never')
+DEFAULT_UNLOAD_POLICY = 'idle'
+DEFAULT_IDLE_UNLOAD_MIN = 10
+
+
+def _tts_classes():
+    """The TTS singleton classes already imported (an unimported one cannot be loaded)."""
+    from ..processors.engines import imported_engines
+    return imported_engines()
+
+
+def tts_status():
+    """Which TTS singleton is loaded and how long its last load took."""
+    status = {'loaded': False, 'engine': None, 'load_s': None}
+    for cls in _tts_classes():
+        if cls._inst is not None:
+            status.update(loaded=True, engine=cls.__name__, load_s=cls.last_load_s)
+        elif status['load_s'] is None and cls.last_load_s is not None:
+            status['load_s'] = cls.last_load_s
+    return status
+
+
 def unload_tts():
     """Unload whichever TTS singleton is loaded, freeing GPU memory."""
-    try:
-        from ..processors.tts_qwen import QwenTTSInstance
-        QwenTTSInstance.unload()
-    except Exception:
-        pass
-    try:
-        from ..processors.tts_instance import TTSInstance
-        TTSInstance.unload()
-    except Exception:
-        pass
+    for cls in _tts_classes():
+        try:
+            cls.unload()
+        except Exception:
+            pass
 
 
 class JobQueue:
-    """FIFO queue with one daemon worker thread.
+    """Job queue served by one worker thread pool per resource lane.
 
     A deque + Condition (rather than queue.Queue) so queued jobs can be
-    removed mid-queue on cancel.
+    removed mid-queue on cancel, and so each worker can take the next job
+    of its lane — by priority, FIFO within one — that does not conflict
+    with a running one.
     """
 
     def __init__(self, config_file, db_path, on_config=None, on_worker_start=None,
-                 config_lock=None, history_len=20, event_buffer_len=1000):
+                 config_lock=None, history_len=20, event_buffer_len=1000,
+                 scrape_workers=DEFAULT_SCRAPE_WORKERS, store=None, job_factory=None):
         self._config_file = config_file
         self._db_path = db_path
         self._on_config = on_config            # callback(config) after each job's reload
@@ -124,13 +292,30 @@ class JobQueue:
         self._cond = threading.Condition()
         self._pending = deque()
         self._shutdown = False
-        self.current = None
+        self.running = {}                      # job id -> Job, every lane
         self.history = deque(maxlen=history_len)
         self._events = deque(maxlen=event_buffer_len)
         self._event_seq = 0
-        self._worker = threading.Thread(target=self._worker_loop, daemon=True,
-                                        name='job-queue-worker')
-        self._worker.start()
+        self.metrics = QueueMetrics()
+        self._unload_policy = (DEFAULT_UNLOAD_POLICY, DEFAULT_IDLE_UNLOAD_MIN)
+        self._unload_at = None          # monotonic deadline of an idle unload
+        self._store = store                     # JobStore, or None for in-memory only
+        self._job_factory = job_factory         # fn for a restored job: (type, series, chapter_id)
+        self._runs = {}                         # job id -> {'config', 'latest_before'}
+        self._interrupted = set()               # ids cancelled by shutdown (resume next start)
+        if store is not None and job_factory is not None:
+            self._restore()
+        lanes = {'gpu': 1, 'scrape': max(1, int(scrape_workers)), 'maintenance': 1}
+        self._workers = []
+        for lane, count in lanes.items():
+            for i in range(count):
+                # 'job-' prefix: log_capture forwards these threads' output to the GUI
+                name = f'job-worker-{lane}' + (f'-{i + 1}' if count > 1 else '')
+                worker = threading.Thread(target=self._worker_loop, args=(lane,),
+                                          daemon=True, name=name)
+                self._workers.append(worker)
+        for worker in self._workers:
+            worker.start()
 
     # ── Public API (any thread) ──────────────────────────────
 
@@ -142,22 +327,21 @@ class JobQueue:
             if self._shutdown:
                 return job, False
             key = job.dedupe_key()
-            if self.current and self.current.dedupe_key() == key:
-                return self.current, False
-            for queued in self._pending:
-                if queued.dedupe_key() == key:
-                    return queued, False
+            for existing in (*self.running.values(), *self._pending):
+                if existing.dedupe_key() == key:
+                    return existing, False
             self._pending.append(job)
-            self._cond.notify()
+            self._cond.notify_all()
+        self._persist(job)
         logger.info(f'[queue] queued: {job.label()} ({job.id})')
         return job, True
 
     def cancel(self, job_id):
-        """Cancel a job. Queued jobs are removed; the running job gets its
+        """Cancel a job. Queued jobs are removed; a running job gets its
         cancel event set (cooperative — takes effect at the next checkpoint)."""
         with self._cond:
-            if self.current and self.current.id == job_id:
-                self.current.cancel_event.set()
+            if job_id in self.running:
+                self.running[job_id].cancel_event.set()
                 logger.info(f'[queue] cancelling running job {job_id}...')
                 return True
             for job in list(self._pending):
@@ -166,27 +350,43 @@ class JobQueue:
                     job.status = JobStatus.CANCELLED
                     job.finished_at = time.time()
                     self.history.appendleft(job)
-                    logger.info(f'[queue] removed queued job: {job.label()} ({job_id})')
-                    return True
-        return False
+                    break
+            else:
+                return False
+        self._persist(job)
+        logger.info(f'[queue] removed queued job: {job.label()} ({job_id})')
+        return True
+
+    @property
+    def current(self):
+        """The headline running job: the GPU lane's, else the earliest started."""
+        with self._cond:
+            jobs = sorted(self.running.values(), key=lambda j: j.started_at or 0)
+        for job in jobs:
+            if job.lane == 'gpu':
+                return job
+        return jobs[0] if jobs else None
 
     def snapshot(self):
+        current = self.current
         with self._cond:
+            running = sorted(self.running.values(), key=lambda j: j.started_at or 0)
             return {
-                'current': self.current.snapshot() if self.current else None,
-                'queued': [j.snapshot() for j in self._pending],
+                'current': current.snapshot() if current else None,
+                'running': [j.snapshot() for j in running],
+                'queued': [j.snapshot() for j in self._by_priority()],
                 'history': [j.snapshot() for j in self.history],
             }
 
     @property
     def is_running(self):
         with self._cond:
-            return self.current is not None
+            return bool(self.running)
 
     @property
     def is_busy(self):
         with self._cond:
-            return self.current is not None or bool(self._pending)
+            return bool(self.running) or bool(self._pending)
 
     def events_since(self, seq):
         """Return (events, new_seq) for events newer than seq."""
@@ -194,8 +394,38 @@ class JobQueue:
             events = [ev for s, ev in self._events if s > seq]
             return events, self._event_seq
 
+    def metrics_text(self):
+        """Prometheus text exposition of the event-fed metrics plus queue gauges."""
+        with self._cond:
+            depth = len(self._pending)
+            running = [j.type.value for j in self.running.values()]
+        return self.metrics.render(depth, running, [t.value for t in JobType])
+
+    def model_status(self):
+        """TTS residency for the health payload: warm/cold, load time, policy."""
+        status = tts_status()
+        with self._cond:
+            policy, idle_min = self._unload_policy
+            unload_at = self._unload_at
+        out = {
+            'model_loaded': status['loaded'],
+            'model_state': 'warm' if status['loaded'] else 'cold',
+            'model_engine': status['engine'],
+            'model_load_s': status['load_s'],
+            'model_unload_policy': policy,
+        }
+        if policy == 'idle':
+            out['model_idle_unload_min'] = idle_min
+        if status['loaded'] and unload_at is not None:
+            out['model_unload_in_s'] = max(0.0, unload_at - time.monotonic())
+        return out
+
     def shutdown(self, timeout=10):
-        """Cancel everything and wait briefly for the worker to stop."""
+        """Cancel everything and wait briefly for the workers to stop.
+
+        With a store, queued jobs stay queued there and running ones are
+        stored as interrupted, so the next start picks them all up again.
+        """
         with self._cond:
             self._shutdown = True
             for job in self._pending:
@@ -203,10 +433,83 @@ class JobQueue:
                 job.finished_at = time.time()
                 self.history.appendleft(job)
             self._pending.clear()
-            if self.current:
-                self.current.cancel_event.set()
-            self._cond.notify()
-        self._worker.join(timeout)
+            for job in self.running.values():
+                if not job.cancel_event.is_set():
+                    self._interrupted.add(job.id)
+                job.cancel_event.set()
+            self._cond.notify_all()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        if self._store is not None:
+            try:
+                self._store.prune(self.history.maxlen)
+                self._store.close()
+            except Exception as e:
+                logger.warning(f'[queue] could not close job store: {e}')
+
+    # ── Persistence ──────────────────────────────────────────
+
+    def _persist(self, job):
+        """Write the job's row (best-effort: a store failure must not stop the queue)."""
+        if self._store is None:
+            return
+        status = None
+        if job.id in self._interrupted and job.status in (JobStatus.RUNNING,
+                                                         JobStatus.CANCELLED):
+            status = JobStatus.QUEUED
+        elif self._shutdown and job.status == JobStatus.CANCELLED and job.started_at is None:
+            return   # dropped from the queue by shutdown: stays queued in the store
+        try:
+            self._store.save(job.to_row(status))
+        except Exception as e:
+            logger.warning(f'[queue] could not persist job {job.id}: {e}')
+
+    def _checkpoint(self, job):
+        """Persist a resume point: the job's progress plus scrape cursors advanced so far."""
+        run = self._runs.get(job.id)
+        if run is not None:
+            try:
+                self._save_latest_cursors(run['config'], run['latest_before'])
+                run['latest_before'] = self._latest_map(run['config'])
+            except Exception as e:
+                logger.error(f'[queue] could not save config: {e}')
+        self._persist(job)
+
+    def _restore(self):
+        """Re-queue the jobs a previous process left queued or running."""
+        try:
+            active, history = self._store.load(self.history.maxlen)
+        except Exception as e:
+            logger.warning(f'[queue] could not load persisted jobs: {e}')
+            return
+        self.history.extend(Job.from_row(row, fn=None) for row in history)
+        interrupted = False
+        for row in active:
+            try:
+                job = Job.from_row(row, fn=None)
+                job.fn = self._job_factory(job.type, job.series, job.chapter_id)
+            except Exception as e:
+                logger.warning(f'[queue] dropping persisted job {row["id"]}: {e}')
+                continue
+            if job.status == JobStatus.RUNNING:
+                interrupted = True
+                job.progress = {'resumed': True}
+                logger.info(f'[queue] resuming interrupted job: {job.label()} ({job.id})')
+            elif job.started_at is not None:
+                job.progress = {'resumed': True}   # stored as interrupted at shutdown
+            job.status = JobStatus.QUEUED
+            job.started_at = None
+            self._pending.append(job)
+        if interrupted:
+            # A crash leaves the interrupted job's chapters 'processing'
+            try:
+                with ChapterDB(self._db_path) as db:
+                    db.reset_all_processing()
+            except Exception as e:
+                logger.warning(f'[queue] could not reset processing chapters: {e}')
+        if self._pending:
+            logger.info(f'[queue] restored {len(self._pending)} job(s)')
 
     # ── Worker internals ─────────────────────────────────────
 
@@ -216,11 +519,26 @@ class JobQueue:
             self._events.append((self._event_seq, event))
 
     def _on_event(self, job, ev):
-        """Event sink: record the event and fold it into the job's progress."""
+        """Event sink: record the event and fold it into the job's progress and metrics."""
+        self.metrics.observe(job, ev)
+        if ev.type == EventType.SPAN and ev.span.name in TRANSIENT_SPANS:
+            return   # per-request/per-query spans would flood the ring buffer
         self._append_event(ev)
         p = job.progress
         if ev.type == EventType.PHASE_STARTED:
             p['phase'] = ev.message
+            job.checkpoint.setdefault('phases', [])
+            if ev.message not in job.checkpoint['phases']:
+                job.checkpoint['phases'].append(ev.message)
+            self._checkpoint(job)
+            if ev.message in PHASE_RESOURCES.get(job.type, {}):
+                with self._cond:
+                    self._cond.notify_all()   # released resources may unblock other lanes
+        elif ev.type == EventType.SERIES_FINISHED:
+            done = job.checkpoint.setdefault('series_done', {}).setdefault(ev.message, [])
+            if ev.series not in done:
+                done.append(ev.series)
+            self._checkpoint(job)
         elif ev.type == EventType.SERIES_STARTED:
             p['series'] = ev.series
             p['series_idx'] = ev.index
@@ -231,26 +549,132 @@ class JobQueue:
             p['chapter'] = ev.chapter
             p['raw_path'] = ev.raw_path
             p['pct'] = 0
+            # Several chapters can be in flight at once (cross-chapter batch
+            # windows, pipelined encodes): per-chapter pct keyed by raw_path.
+            p.setdefault('chapter_pcts', {})[ev.raw_path] = 0
         elif ev.type == EventType.CHUNK_PROGRESS:
             if ev.chars_total:
-                p['pct'] = ev.chars_done * 100 // ev.chars_total
+                pct = ev.chars_done * 100 // ev.chars_total
+                p.setdefault('chapter_pcts', {})[ev.raw_path] = pct
+                if ev.raw_path == p.get('raw_path'):
+                    p['pct'] = pct
         elif ev.type in (EventType.CHAPTER_DONE, EventType.CHAPTER_FAILED):
-            p['pct'] = 100 if ev.type == EventType.CHAPTER_DONE else p.get('pct')
+            p.get('chapter_pcts', {}).pop(ev.raw_path, None)
+            # Only the chapter currently shown may move the headline pct.
+            if ev.raw_path == p.get('raw_path'):
+                p['pct'] = 100 if ev.type == EventType.CHAPTER_DONE else p.get('pct')
+
+    def _by_priority(self):
+        """Pending jobs in start order: priority, then FIFO (caller holds self._cond)."""
+        return sorted(self._pending, key=lambda j: j.priority)
+
+    def _next_job(self, lane, preempting=None):
+        """Pop the next pending job of `lane` that can start now.
+
+        A job waits while it conflicts with a running job or with a job due
+        to start before it, so conflicting jobs keep their order across
+        lanes (and a queued sync is not starved by later scrapes). With
+        `preempting` (a running job at a yield point), only jobs that may
+        preempt it are considered, and it does not count as a conflict —
+        it is paused. Caller holds self._cond.
+        """
+        running = [j for j in self.running.values() if j is not preempting]
+        ahead = []
+        for job in self._by_priority():
+            eligible = job.lane == lane and (
+                preempting is None
+                or job.priority in PREEMPTING and job.priority < preempting.priority)
+            if (eligible
+                    and not any(job.conflicts_with(o) for o in running)
+                    and not any(job.conflicts_with(o) for o in ahead)):
+                self._pending.remove(job)
+                return job
+            ahead.append(job)
+        return None
+
+    def _start(self, job):
+        """Mark a popped job running (caller holds self._cond)."""
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        self.running[job.id] = job
+
+    def _finish(self, job):
+        """Move a finished job to history (caller holds self._cond)."""
+        del self.running[job.id]
+        self.history.appendleft(job)
+        # A finished job may unblock conflicting jobs on other lanes
+        self._cond.notify_all()
+
+    def _yield_to(self, job, ctx, prepare):
+        """PipelineContext.yield_point hook: run waiting preempting jobs inline.
+
+        The preempting jobs run on this worker thread (the GPU lane keeps
+        its single model user), while `job` stays 'running' with
+        progress['preempted_by'] set; when they are done the caller resumes.
+        """
+        while not job.cancel_event.is_set():
+            with self._cond:
+                if self._shutdown:
+                    return
+                nxt = self._next_job(job.lane, preempting=job)
+                if nxt is None:
+                    return
+                self._start(nxt)
+                job.progress['preempted_by'] = nxt.id
+            self._persist(nxt)
+            if prepare is not None:
+                prepare()
+                prepare = None
+            ctx.emit(EventType.LOG, message=f'paused for {nxt.label()}')
+            logger.info(f'[queue] {job.label()} ({job.id}) yields to {nxt.label()} ({nxt.id})')
+            try:
+                self._run_job(nxt)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                with self._cond:
+                    self._finish(nxt)
+                    job.progress.pop('preempted_by', None)
+                self._persist(nxt)
+            logger.info(f'[queue] resuming: {job.label()} ({job.id})')
+
+    def _gpu_drained(self):
+        """No GPU job running or queued (caller holds self._cond)."""
+        return not any(j.lane == 'gpu' for j in (*self.running.values(), *self._pending))
 
-    def _worker_loop(self):
+    def _worker_loop(self, lane):
         if self._on_worker_start:
             try:
                 self._on_worker_start()
             except Exception:
                 pass
+        # Only the GPU lane owns the model, so only it runs the idle unload.
+        owns_unload = lane == 'gpu'
         while True:
             with self._cond:
-                while not self._pending and not self._shutdown:
-                    self._cond.wait()
+                job = None
+                while not self._shutdown:
+                    job = self._next_job(lane)
+                    if job is not None:
+                        break
+                    if not owns_unload or self._unload_at is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._unload_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
                 if self._shutdown:
                     return
-                job = self._pending.popleft()
-                self.current = job
+                if owns_unload:
+                    self._unload_at = None
+                if job is not None:
+                    self._start(job)
+            if job is None:
+                # Idle timeout expired with nothing queued
+                unload_tts()
+                continue
+            self._persist(job)
             try:
                 self._run_job(job)
             except Exception:
@@ -258,17 +682,44 @@ class JobQueue:
                 traceback.print_exc()
             finally:
                 with self._cond:
-                    self.current = None
-                    self.history.appendleft(job)
-                    drained = not self._pending
+                    self._finish(job)
+                    drained = job.lane == 'gpu' and self._gpu_drained()
+                self._persist(job)
                 if drained:
-                    unload_tts()
+                    self._schedule_unload()
+
+    def _schedule_unload(self):
+        """Apply the residency policy once the queue has drained.
+
+        'immediate' frees VRAM right away; 'idle' keeps the model warm for
+        tts_idle_unload_min minutes so follow-up jobs (e.g. regenerating
+        another chapter) skip the reload; 'never' keeps it until shutdown.
+        """
+        policy, idle_min = self._unload_policy
+        if policy == 'immediate':
+            unload_tts()
+        elif policy == 'idle':
+            with self._cond:
+                self._unload_at = time.monotonic() + idle_min * 60
+
+    @staticmethod
+    def _read_unload_policy(config):
+        cfg = config.get('config', {})
+        policy = cfg.get('tts_unload') or DEFAULT_UNLOAD_POLICY
+        if policy not in UNLOAD_POLICIES:
+            logger.warning(f'[queue] unknown tts_unload {policy!r}; '
+                           f'using {DEFAULT_UNLOAD_POLICY!r}')
+            policy = DEFAULT_UNLOAD_POLICY
+        idle_min = cfg.get('tts_idle_unload_min')
+        if idle_min is None:
+            idle_min = DEFAULT_IDLE_UNLOAD_MIN
+        return policy, float(idle_min)
 
     def _run_job(self, job):
-        job.status = JobStatus.RUNNING
-        job.started_at = time.time()
         ctx = PipelineContext(sink=lambda ev: self._on_event(job, ev),
-                              cancel_event=job.cancel_event, job_id=job.id)
+                              cancel_event=job.cancel_event, job_id=job.id,
+                              yield_to=lambda prepare: self._yield_to(job, ctx, prepare),
+                              resume=copy.deepcopy(job.checkpoint))
         ctx.emit(EventType.JOB_STARTED, message=job.label())
         logger.info(f'[queue] started: {job.label()} ({job.id})')
 
@@ -280,9 +731,15 @@ class JobQueue:
             with self._config_lock:
                 config = load_config(self._config_file)
             latest_before = self._latest_map(config)
+            self._runs[job.id] = {'config': config, 'latest_before': latest_before}
+            self._unload_policy = self._read_unload_policy(config)
+            if job.type in GENERATE_TYPES:
+                from ..pipeline import start_tts_preload
+                start_tts_preload(config)
             if self._on_config:
                 self._on_config(config)
-            db = ChapterDB(self._db_path)
+            db = ChapterDB(self._db_path, on_query=lambda op, wall_s: ctx.record_span(
+                'db', wall_s, detail=op))
             job.fn(config, db, ctx)
             job.status = JobStatus.DONE
             ctx.emit(EventType.JOB_FINISHED, message=job.label())
@@ -291,7 +748,9 @@ class JobQueue:
             job.status = JobStatus.CANCELLED
             ctx.emit(EventType.JOB_CANCELLED, message=job.label())
             logger.info(f'[queue] cancelled: {job.label()} ({job.id})')
-            if db:
+            # Only GPU jobs mark chapters 'processing'; other lanes' jobs must
+            # not reset the rows a concurrent generation job owns.
+            if db and job.lane == 'gpu':
                 try:
                     db.reset_all_processing()
                 except Exception:
@@ -304,12 +763,13 @@ class JobQueue:
             traceback.print_exc()
         finally:
             job.finished_at = time.time()
+            run = self._runs.pop(job.id, None)
             if db:
                 # Scraper may have advanced 'latest' cursors even on cancel/failure.
                 # Merge only those back into a fresh load so concurrent GUI config
                 # edits made during the job are not clobbered.
                 try:
-                    self._save_latest_cursors(config, latest_before)
+                    self._save_latest_cursors(config, run['latest_before'])
                 except Exception as e:
                     logger.error(f'[queue] could not save config: {e}')
                 try:
@@ -9,11 +9,16 @@ from .gui_log import GuiLogBuffer
 
 ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
 
+# Helper threads the pipeline spawns for a job (e.g. the chapter finalizer)
+# are named with this prefix so their output reaches the GUI log too.
+JOB_THREAD_PREFIX = 'job-'
+
 
 class LogCapture(io.TextIOBase):
     """Replaces sys.stdout/sys.stderr to capture output from a specific thread.
 
-    Output from the captured thread is forwarded (ANSI-stripped) into a shared
+    Output from the captured thread (and from any thread named with
+    JOB_THREAD_PREFIX) is forwarded (ANSI-stripped) into a shared
     GuiLogBuffer. Output from all other threads passes through to the original
     stream.
     """
@@ -33,7 +38,9 @@ class LogCapture(io.TextIOBase):
     def write(self, s):
         if not s:
             return 0
-        if threading.current_thread().ident == self._capture_thread_id:
+        current = threading.current_thread()
+        if (current.ident == self._capture_thread_id
+                or current.name.startswith(JOB_THREAD_PREFIX)):
             cleaned = ANSI_RE.sub('', s)
             # Split on newlines and carriage returns
             for line in cleaned.replace('\r', '\n').split('\n'):
@@ -0,0 +1,193 @@
+"""Prometheus metrics folded from the job event stream.
+
+JobQueue._on_event hands every PipelineEvent to QueueMetrics.observe; the
+server's /metrics route renders the counters and histograms plus queue
+gauges read at scrape time. Hand-rolled text exposition (format 0.0.4) —
+a few counters and histograms do not justify a prometheus_client dependency.
+"""
+
+import math
+import threading
+
+from ..events import EventType
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0)
+HTTP_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Event type -> chapters_total status label
+_CHAPTER_STATUS = {
+    EventType.CHAPTER_DONE: 'done',
+    EventType.CHAPTER_FAILED: 'failed',
+    EventType.CHAPTER_SKIPPED: 'skipped',
+}
+# Event type -> jobs_total status label
+_JOB_STATUS = {
+    EventType.JOB_FINISHED: 'done',
+    EventType.JOB_FAILED: 'failed',
+    EventType.JOB_CANCELLED: 'cancelled',
+}
+
+
+def _fmt(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}   # label values tuple -> value
+        if not self.labels and self.type != 'histogram':
+            self._values[()] = 0.0
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labels)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.type}']
+        for key in sorted(self._values):
+            lines.extend(self._samples(key, self._values[key]))
+        return lines
+
+    def _samples(self, key, value):
+        return [f'{self.name}{_labels(self.labels, key)} {_fmt(value)}']
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=()):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = {'counts': [0] * len(self.buckets),
+                                         'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state['counts'][i] += 1
+                break
+        state['sum'] += value
+        state['count'] += 1
+
+    def _samples(self, key, state):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state['counts']):
+            cumulative += count
+            labels = _labels(self.labels, key, [('le', _fmt(bound))])
+            lines.append(f'{self.name}_bucket{labels} {cumulative}')
+        labels = _labels(self.labels, key)
+        lines.append(f'{self.name}_sum{labels} {_fmt(state["sum"])}')
+        lines.append(f'{self.name}_count{labels} {state["count"]}')
+        return lines
+
+
+class QueueMetrics:
+    """Counters and histograms for one JobQueue, updated from its events.
+
+    observe() runs on the job thread and on the finalizer thread (spans
+    recorded there are emitted there), so every update holds the lock.
+    Generation rates are exported as counters (chars, audio seconds, and
+    generate wall seconds) for rate() plus gauges for the latest batch.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jobs = Counter('audiobook_jobs_total', 'Jobs finished, by type and outcome.',
+                            ('type', 'status'))
+        self.chapters = Counter('audiobook_chapters_total', 'Chapters finished, by outcome.',
+                                ('series', 'status'))
+        self.chars = Counter('audiobook_tts_chars_total',
+                             'Characters synthesized by TTS batches.')
+        self.audio = Counter('audiobook_tts_audio_seconds_total',
+                             'Seconds of audio synthesized by TTS batches.')
+        self.generate = Counter('audiobook_tts_generate_seconds_total',
+                                'Wall seconds spent in TTS batches.')
+        self.chars_rate = Gauge('audiobook_tts_chars_per_second',
+                                'Characters per wall second of the latest TTS batch.')
+        self.audio_rate = Gauge('audiobook_tts_audio_seconds_per_second',
+                                'Audio seconds per wall second of the latest TTS batch.')
+        self.rtf = Histogram('audiobook_tts_rtf',
+                             'Realtime factor (wall / audio seconds) per TTS batch and chapter.',
+                             ('span',), RTF_BUCKETS)
+        self.http = Histogram('audiobook_scrape_request_seconds',
+                              'Scraper HTTP request latency.', ('host',), HTTP_BUCKETS)
+        self.db = Histogram('audiobook_db_query_seconds',
+                            'ChapterDB call latency on job threads.', ('op',), DB_BUCKETS)
+
+    def observe(self, job, ev):
+        with self._lock:
+            if ev.type in _CHAPTER_STATUS:
+                self.chapters.inc(series=ev.series or '', status=_CHAPTER_STATUS[ev.type])
+            elif ev.type in _JOB_STATUS:
+                self.jobs.inc(type=job.type.value, status=_JOB_STATUS[ev.type])
+            elif ev.type == EventType.SPAN:
+                self._observe_span(ev.span)
+
+    def _observe_span(self, span):
+        if span.name in ('batch', 'retry'):
+            self.chars.inc(span.chars or 0)
+            self.audio.inc(span.audio_s or 0.0)
+            self.generate.inc(span.wall_s)
+            if span.wall_s > 0:
+                self.chars_rate.set((span.chars or 0) / span.wall_s)
+                self.audio_rate.set((span.audio_s or 0.0) / span.wall_s)
+        if span.name in ('batch', 'retry', 'chapter') and span.rtf is not None:
+            self.rtf.observe(span.rtf, span=span.name)
+        elif span.name == 'http':
+            self.http.observe(span.wall_s, host=span.detail or '')
+        elif span.name == 'db':
+            self.db.observe(span.wall_s, op=span.detail or '')
+
+    def render(self, queue_depth, running_types, job_types):
+        """Text exposition; queue gauges are passed in as read at scrape time."""
+        depth = Gauge('audiobook_queue_depth', 'Jobs waiting in the queue.')
+        depth.set(queue_depth)
+        running = Gauge('audiobook_job_running', 'Jobs of this type currently running.',
+                        ('type',))
+        for job_type in job_types:
+            running.set(running_types.count(job_type), type=job_type)
+        lines = depth.render() + running.render()
+        with self._lock:
+            for metric in (self.jobs, self.chapters, self.chars, self.audio, self.generate,
+                           self.chars_rate, self.audio_rate, self.rtf, self.http, self.db):
+                lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
@@ -1,4 +1,4 @@
-"""Job queue panel: current job with progress, queued jobs, and history."""
+"""Job queue panel: running jobs with progress, queued jobs, and history."""
 
 import json
 import time
@@ -85,6 +85,8 @@ def create_queue_panel(runner):
                         ui.label(_fmt_duration(time.time() - cur['started_at'])).classes(
                             'text-xs ml-auto').style(f'color: {TEXT_DIM}')
                 detail_parts = []
+                if progress.get('preempted_by'):
+                    detail_parts.append('paused for a higher-priority job')
                 if progress.get('chapter'):
                     detail_parts.append(progress['chapter'])
                 if detail_parts:
@@ -148,11 +150,11 @@ def create_queue_panel(runner):
         _last_key[0] = key
 
         container.clear()
-        if not snap['current'] and not snap['queued'] and not snap['history']:
+        if not snap['running'] and not snap['queued'] and not snap['history']:
             return
         with container:
-            if snap['current']:
-                _render_current(snap['current'])
+            for job in snap['running']:
+                _render_current(job)
             if snap['queued']:
                 _render_queued(snap['queued'])
             if snap['history']:
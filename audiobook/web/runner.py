@@ -5,9 +5,12 @@ import threading
 from enum import Enum
 
 from ..config import load_config, save_config
-from ..state import ChapterDB
+from ..replication import open_local_first
+from ..state import ChapterDB, ChapterDBPool
 from .gui_log import setup_gui_logging
-from .jobs import Job, JobQueue, JobStatus, JobType, SCRAPE_TYPES, unload_tts
+from .job_store import JobStore
+from .jobs import (DEFAULT_SCRAPE_WORKERS, Job, JobQueue, JobStatus, JobType, SCRAPE_TYPES,
+                   unload_tts)
 from .log_capture import install
 
 
@@ -20,6 +23,27 @@ class PipelineState(Enum):
     CANCELLED = "Cancelled"
 
 
+def _sync_series(config, db):
+    """Upsert every enabled series and reconcile its DB rows with the filesystem."""
+    from ..pipeline import detect_source_name
+    out = config['config']['output_dir']
+    for series in config.get('series', []):
+        if not series.get('enabled', True):
+            continue
+        name = series.get('name', '')
+        url = series.get('url', '')
+        db.upsert_series(
+            name,
+            url=url,
+            source=detect_source_name(url),
+            narrator=series.get('narrator'),
+            latest_url=series.get('latest'),
+        )
+        raws_dir = os.path.join(out, name, 'raws')
+        series_out = os.path.join(out, name)
+        db.sync_filesystem(name, raws_dir, series_out)
+
+
 class PipelineRunner:
     """Facade the GUI talks to. All pipeline work runs as queued jobs."""
 
@@ -29,9 +53,8 @@ class PipelineRunner:
         setup_gui_logging(self._log_buffer)
         self._config_file = 'config_dev.yml' if dev_mode else 'config.yml'
         self._config = load_config(self._config_file)
-        self._db_path = os.path.join(
-            self._config['config']['output_dir'], 'audiobook.db'
-        )
+        self._db_path, self.replicator = open_local_first(self._config)
+        self.db_pool = ChapterDBPool(self._db_path)
         self._config_lock = threading.Lock()
         self.queue = JobQueue(
             config_file=self._config_file,
@@ -39,8 +62,21 @@ class PipelineRunner:
             on_config=self._set_config,
             on_worker_start=self._on_worker_start,
             config_lock=self._config_lock,
+            scrape_workers=self._config['config'].get('scrape_workers',
+                                                      DEFAULT_SCRAPE_WORKERS),
+            store=self._open_job_store(),
+            job_factory=self._job_fn,
         )
 
+    def _open_job_store(self):
+        """The persistent job queue: config job_db (a local sidecar file) or audiobook.db."""
+        path = self._config['config'].get('job_db') or self._db_path
+        try:
+            return JobStore(path)
+        except Exception as e:
+            print(f"[queue] job persistence disabled — cannot open {path}: {e}")
+            return None
+
     def _set_config(self, config):
         self._config = config
 
@@ -105,6 +141,10 @@ class PipelineRunner:
         """Create a new DB connection for the GUI thread (read-only queries)."""
         return ChapterDB(self._db_path)
 
+    def replication_status(self):
+        """Health fields for the local-first DB's share copy (None without local_db)."""
+        return self.replicator.status() if self.replicator else None
+
     def get_config(self):
         """Return the current config dict."""
         return self._config
@@ -132,35 +172,6 @@ class PipelineRunner:
     def clear_log(self):
         self._log_buffer.clear()
 
-    # ── Maintenance operations (run on GUI io_bound threads) ─
-
-    def sync_all(self):
-        """Sync DB with filesystem for all enabled series."""
-        from ..pipeline import detect_source_name
-        try:
-            db = ChapterDB(self._db_path)
-        except Exception:
-            return
-        try:
-            out = self._config['config']['output_dir']
-            for series in self._config.get('series', []):
-                if not series.get('enabled', True):
-                    continue
-                name = series.get('name', '')
-                url = series.get('url', '')
-                db.upsert_series(
-                    name,
-                    url=url,
-                    source=detect_source_name(url),
-                    narrator=series.get('narrator'),
-                    latest_url=series.get('latest'),
-                )
-                raws_dir = os.path.join(out, name, 'raws')
-                series_out = os.path.join(out, name)
-                db.sync_filesystem(name, raws_dir, series_out)
-        finally:
-            db.close()
-
     def shutdown(self):
         """Clean up on exit: drain the queue, then reset stale chapters."""
         self.queue.shutdown(timeout=10)
@@ -175,54 +186,83 @@ class PipelineRunner:
                 print(f"[shutdown] Reset {count} processing chapter(s) to pending")
         finally:
             db.close()
+        self.db_pool.close()
+        if self.replicator:
+            self.replicator.stop()
 
     # ── Job submission (same method names as before) ─────────
 
+    def _job_fn(self, job_type, series_name=None, chapter_id=None):
+        """The fn(config, db, ctx) a job of this type runs.
+
+        Also the JobQueue's job_factory: persisted jobs store only their type
+        and target, and get their fn back from here when restored.
+        """
+        dev_mode = self.dev_mode
+        if job_type == JobType.FULL_PIPELINE:
+            def fn(config, db, ctx):
+                from ..pipeline import run_scrape_phase, run_audio_phase, print_summary
+                if not ctx.phase_done('scrape'):
+                    run_scrape_phase(config, db, ctx=ctx)
+                run_audio_phase(config, db, dev_mode=dev_mode, ctx=ctx)
+                print_summary(config, db)
+        elif job_type == JobType.SCRAPE_ALL:
+            def fn(config, db, ctx):
+                from ..pipeline import run_scrape_phase
+                run_scrape_phase(config, db, ctx=ctx)
+        elif job_type == JobType.SCRAPE_SERIES:
+            def fn(config, db, ctx):
+                from ..pipeline import run_scrape_single_series
+                run_scrape_single_series(config, db, series_name, ctx=ctx)
+        elif job_type == JobType.GENERATE_SERIES:
+            def fn(config, db, ctx):
+                from ..pipeline import run_audio_single_series
+                run_audio_single_series(config, db, series_name, dev_mode=dev_mode, ctx=ctx)
+        elif job_type == JobType.REGENERATE_CHAPTER:
+            def fn(config, db, ctx):
+                from ..pipeline import regenerate_chapter
+                regenerate_chapter(config, db, series_name, chapter_id,
+                                   dev_mode=dev_mode, ctx=ctx)
+        elif job_type == JobType.RESCRAPE_CHAPTER:
+            def fn(config, db, ctx):
+                from ..pipeline import rescrape_chapter
+                rescrape_chapter(config, db, series_name, chapter_id, ctx=ctx)
+        elif job_type == JobType.SYNC_FILESYSTEM:
+            def fn(config, db, ctx):
+                _sync_series(config, db)
+        else:
+            raise ValueError(f"Unknown job type: {job_type}")
+        return fn
+
+    def _submit(self, job_type, series_name=None, chapter_id=None, chapter_title=None):
+        return self.queue.submit(Job(
+            type=job_type, series=series_name, chapter_id=chapter_id,
+            chapter_title=chapter_title, fn=self._job_fn(job_type, series_name, chapter_id)))
+
     def start_full(self):
         """Queue scrape + generate for all series."""
-        def fn(config, db, ctx):
-            from ..pipeline import run_scrape_phase, run_audio_phase, print_summary
-            run_scrape_phase(config, db, ctx=ctx)
-            run_audio_phase(config, db, dev_mode=self.dev_mode, ctx=ctx)
-            print_summary(config, db)
-        return self.queue.submit(Job(type=JobType.FULL_PIPELINE, fn=fn))
+        return self._submit(JobType.FULL_PIPELINE)
 
     def start_scrape_only(self):
         """Queue the scraping phase for all series."""
-        def fn(config, db, ctx):
-            from ..pipeline import run_scrape_phase
-            run_scrape_phase(config, db, ctx=ctx)
-        return self.queue.submit(Job(type=JobType.SCRAPE_ALL, fn=fn))
+        return self._submit(JobType.SCRAPE_ALL)
 
     def start_scrape_series(self, series_name):
         """Queue a scrape of a single series."""
-        def fn(config, db, ctx):
-            from ..pipeline import run_scrape_single_series
-            run_scrape_single_series(config, db, series_name, ctx=ctx)
-        return self.queue.submit(Job(type=JobType.SCRAPE_SERIES, series=series_name, fn=fn))
+        return self._submit(JobType.SCRAPE_SERIES, series_name)
 
     def start_generate_series(self, series_name):
         """Queue audio generation for a single series."""
-        def fn(config, db, ctx):
-            from ..pipeline import run_audio_single_series
-            run_audio_single_series(config, db, series_name, dev_mode=self.dev_mode, ctx=ctx)
-        return self.queue.submit(Job(type=JobType.GENERATE_SERIES, series=series_name, fn=fn))
+        return self._submit(JobType.GENERATE_SERIES, series_name)
+
+    def start_sync(self):
+        """Queue a filesystem sync on the maintenance lane (waits out running jobs)."""
+        return self._submit(JobType.SYNC_FILESYSTEM)
 
     def start_regenerate_chapter(self, series_name, chapter_id, chapter_title=None):
         """Queue a delete-and-regenerate of a single chapter."""
-        def fn(config, db, ctx):
-            from ..pipeline import regenerate_chapter
-            regenerate_chapter(config, db, series_name, chapter_id,
-                               dev_mode=self.dev_mode, ctx=ctx)
-        return self.queue.submit(Job(
-            type=JobType.REGENERATE_CHAPTER, series=series_name,
-            chapter_id=chapter_id, chapter_title=chapter_title, fn=fn))
+        return self._submit(JobType.REGENERATE_CHAPTER, series_name, chapter_id, chapter_title)
 
     def start_rescrape_chapter(self, series_name, chapter_id, chapter_title=None):
         """Queue a re-fetch of chapter text from source."""
-        def fn(config, db, ctx):
-            from ..pipeline import rescrape_chapter
-            rescrape_chapter(config, db, series_name, chapter_id, ctx=ctx)
-        return self.queue.submit(Job(
-            type=JobType.RESCRAPE_CHAPTER, series=series_name,
-            chapter_id=chapter_id, chapter_title=chapter_title, fn=fn))
+        return self._submit(JobType.RESCRAPE_CHAPTER, series_name, chapter_id, chapter_title)
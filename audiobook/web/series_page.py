@@ -711,14 +711,16 @@ def create_series_page(runner: PipelineRunner, series_name: str):
         if data is None:
             return
 
-        # Inline pct on the chapter currently being processed
+        # Inline pct on the chapters currently being processed
         cur = runner.queue_snapshot()['current']
         if cur:
             prog = cur.get('progress', {})
+            pcts = dict(prog.get('chapter_pcts') or {})
             if prog.get('raw_path') and prog.get('pct') is not None:
-                for r in data['rows']:
-                    if r['raw_path'] == prog['raw_path'] and r['status'] == 'processing':
-                        r['pct'] = prog['pct']
+                pcts[prog['raw_path']] = prog['pct']
+            for r in data['rows']:
+                if r['raw_path'] in pcts and r['status'] == 'processing':
+                    r['pct'] = pcts[r['raw_path']]
 
         # Update info bar only if changed
         new_info = _info_bar_html(data['narrator'], data['source'], data['summary_text'])
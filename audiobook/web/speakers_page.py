@@ -112,8 +112,8 @@ def _open_transcript(name):
                 f'color: {WARNING}')
         editor = ui.textarea(value=content).classes('w-full').props(
             'outlined autogrow input-style="font-size: 13px;"')
-        ui.label('Note: an already-loaded TTS model keeps its cached voice prompt'
-                 ' until the job queue drains and the model unloads.').classes(
+        ui.label('Note: the cached voice prompt is rebuilt automatically for'
+                 ' chunks generated after the transcript changes.').classes(
             'text-xs').style(f'color: {TEXT_DIM}')
         with ui.row().classes('w-full justify-end gap-2'):
             ui.button('Cancel', on_click=dlg.close).props('flat').style(
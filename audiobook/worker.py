@@ -0,0 +1,212 @@
+"""Remote generation worker: lease chapters from a coordinator server and synthesize them here.
+
+The coordinator is a normal API server (``audiobook``); it keeps the job queue,
+the DB, and the share. A worker (``audiobook --worker http://host:8086``) runs
+on any box with a GPU: it leases one chapter, runs the ordinary
+process_chapter on its own scratch directory, uploads the MP3, and leases the
+next. A heartbeat thread renews the lease while the chapter generates; if the
+lease is lost (expired and taken by another worker) the chapter is cancelled
+at its next checkpoint. Several workers — on one host or many — share a
+backlog this way.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import requests
+
+from .events import EventType, JobCancelled, PipelineContext
+from .processors.processing import NetworkError, process_chapter
+from .utils.colors import GREEN, PURPLE, RED, RESET, YELLOW
+
+POLL_S = 10       # idle wait when the coordinator has nothing to lease
+RETRY_S = 30      # wait after the coordinator could not be reached
+HTTP_TIMEOUT = 30
+UPLOAD_TIMEOUT = 600
+
+
+class LeaseLost(Exception):
+    """The coordinator gave the chapter to another worker (our lease expired)."""
+
+
+class _Heartbeat(threading.Thread):
+    """Renews a chapter lease every third of its length until stopped.
+
+    Losing the lease sets the chapter context's cancel event, so
+    process_chapter stops at its next cancellation check.
+    """
+
+    def __init__(self, worker, lease, ctx):
+        super().__init__(name='worker-heartbeat', daemon=True)
+        self._worker = worker
+        self._lease = lease
+        self._ctx = ctx
+        self._done = threading.Event()
+        self.lost = False
+
+    def run(self):
+        interval = max(1, self._lease['lease_s'] / 3)
+        while not self._done.wait(interval):
+            try:
+                self._worker._post(f"chapters/{self._lease['id']}/renew")
+            except LeaseLost:
+                self.lost = True
+                self._ctx.cancel_event.set()
+                return
+            except requests.RequestException as e:
+                # Keep trying: the lease survives a blip shorter than lease_s
+                print(f"{YELLOW}[worker] lease renewal failed: {e}{RESET}")
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+class Worker:
+    """Lease-synthesize-upload loop against one coordinator.
+
+    Args:
+        server: Coordinator base URL, e.g. ``http://192.168.0.10:8086``.
+        worker_id: Lease owner name (default ``<hostname>-<pid>``, unique per process).
+        workdir: Local scratch directory for raws, chunk buffers, and MP3s.
+        engine: Override the coordinator's ``tts_engine`` (e.g. ``synthetic`` for tests).
+        series: Only lease chapters of these series (default: every enabled series).
+    """
+
+    def __init__(self, server, worker_id=None, workdir='worker', engine=None, series=None):
+        self.server = server.rstrip('/')
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.workdir = os.path.abspath(workdir)
+        self.engine = engine
+        self.series = series or None
+        self._session = requests.Session()
+        self._current = None    # lease being processed, released on interrupt
+
+    # ── Coordinator API ──────────────────────────────────────
+
+    def _url(self, path):
+        return f"{self.server}/api/workers/{path}"
+
+    def _post(self, path, **body):
+        resp = self._session.post(self._url(path), json={'worker': self.worker_id, **body},
+                                  timeout=HTTP_TIMEOUT)
+        if resp.status_code == 409:
+            raise LeaseLost(path)
+        resp.raise_for_status()
+        return resp
+
+    def lease(self):
+        """Lease the next chapter, or None when the coordinator has nothing to do."""
+        resp = self._post('lease', series=self.series)
+        if resp.status_code == 204:
+            return None
+        return resp.json()
+
+    def upload(self, lease, mp3_path):
+        with open(mp3_path, 'rb') as f:
+            resp = self._session.put(
+                self._url(f"chapters/{lease['id']}/audio"), params={'worker': self.worker_id},
+                data=f, headers={'Content-Type': 'audio/mpeg'}, timeout=UPLOAD_TIMEOUT)
+        if resp.status_code == 409:
+            raise LeaseLost(lease['id'])
+        resp.raise_for_status()
+
+    # ── Loop ─────────────────────────────────────────────────
+
+    def run(self, drain=False):
+        """Process chapters until interrupted; with `drain`, until none are left."""
+        print(f"{GREEN}[worker] {self.worker_id} → {self.server}{RESET}")
+        try:
+            while True:
+                try:
+                    lease = self.lease()
+                except requests.RequestException as e:
+                    print(f"{RED}[worker] coordinator unreachable: {e}{RESET}")
+                    time.sleep(RETRY_S)
+                    continue
+                if lease is None:
+                    if drain:
+                        print(f"{GREEN}[worker] nothing left to lease{RESET}")
+                        return
+                    time.sleep(POLL_S)
+                    continue
+                self._current = lease
+                self.process(lease)
+                self._current = None
+        except KeyboardInterrupt:
+            if self._current:
+                try:
+                    self._post(f"chapters/{self._current['id']}/release")
+                except (LeaseLost, requests.RequestException):
+                    pass   # the lease expires on its own
+            raise
+
+    def process(self, lease):
+        """Synthesize one leased chapter and upload it; failures are reported back."""
+        series_cfg = dict(lease['series_cfg'])
+        if self.engine:
+            series_cfg['tts_engine'] = self.engine
+        series = lease['series']
+        raws_dir = os.path.join(self.workdir, series, 'raws')
+        output_base = os.path.join(self.workdir, 'out')
+        tmp_dir = os.path.join(self.workdir, 'tmp')
+        os.makedirs(raws_dir, exist_ok=True)
+        raw_path = os.path.join(raws_dir, lease['filename'])
+        with open(raw_path, 'w', encoding='utf-8') as f:
+            f.write(lease['text'])
+        base = os.path.splitext(lease['filename'])[0]
+        mp3 = os.path.join(output_base, series, f"{base}.mp3")
+        if os.path.exists(mp3):
+            os.remove(mp3)   # stale audio of an earlier version of the text
+
+        errors = []
+
+        def sink(ev):
+            if ev.type == EventType.CHAPTER_FAILED:
+                errors.append(ev.error or 'chapter failed')
+
+        ctx = PipelineContext(sink=sink)
+        heartbeat = _Heartbeat(self, lease, ctx)
+        print(f"{GREEN}[worker] leased {PURPLE}{series}{RESET}: {lease['title']}")
+        heartbeat.start()
+        try:
+            process_chapter(raw_path, series_cfg, output_base, tmp_dir, ctx=ctx,
+                            refresh_cache=lease.get('refresh_cache', False))
+        except JobCancelled:
+            pass
+        except NetworkError as e:
+            errors.append(str(e))
+        finally:
+            heartbeat.stop()
+            os.remove(raw_path)
+
+        try:
+            if heartbeat.lost:
+                print(f"{YELLOW}[worker] lease lost, dropped {lease['title']}{RESET}")
+            elif errors or not os.path.exists(mp3):
+                self._post(f"chapters/{lease['id']}/fail",
+                           error=errors[0] if errors else 'no audio produced')
+            else:
+                self.upload(lease, mp3)
+                print(f"{GREEN}[worker] uploaded {lease['title']}{RESET}")
+        except LeaseLost:
+            print(f"{YELLOW}[worker] lease lost, dropped {lease['title']}{RESET}")
+        except requests.RequestException as e:
+            # Leave the lease to expire; the chapter is retried by whoever leases it next
+            print(f"{RED}[worker] could not report {lease['title']}: {e}{RESET}")
+        finally:
+            if os.path.exists(mp3):
+                os.remove(mp3)
+
+
+def run_worker(server, worker_id=None, workdir='worker', engine=None, series=None,
+               drain=False):
+    """CLI entry: run a Worker until interrupted (or drained)."""
+    worker = Worker(server, worker_id=worker_id, workdir=workdir, engine=engine,
+                    series=series)
+    try:
+        worker.run(drain=drain)
+    except KeyboardInterrupt:
+        print(f"\n{YELLOW}[worker] stopped{RESET}")
@@ -0,0 +1,8 @@
+"""Offline benchmark suite for the audiobook pipeline.
+
+Every benchmark runs without network access or a GPU: scraper parsing reads
+saved pages from fixtures/, and chapter processing uses the synthetic TTS
+engine. Results are JSON (benchmarks/results/ by default) so runs can be
+compared with ``--compare``. ffmpeg-based benchmarks are skipped when ffmpeg
+is not on PATH.
+"""
@@ -0,0 +1,58 @@
+"""Run the offline benchmark suite: ``python -m benchmarks [options]``."""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+from . import bench_audio, bench_db, bench_pipeline, bench_scrapers, bench_text  # noqa: F401  (register)
+from .harness import REPO_ROOT, Options, compare, run, write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark text cleaning, chunking, scraper parsing, ChapterDB, '
+                    'audio assembly, and full chapter processing (no network, no GPU).'
+    )
+    parser.add_argument(
+        'only', nargs='*',
+        help='Run only benchmarks whose name starts with one of these prefixes '
+             '(e.g. text db.summary).'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Timed repetitions per measurement (default 5).'
+    )
+    parser.add_argument(
+        '--chapters', type=int, default=100_000,
+        help='Chapter rows for the ChapterDB benchmarks (default 100000).'
+    )
+    parser.add_argument(
+        '--out',
+        help='Result JSON path (default benchmarks/results/<timestamp>.json).'
+    )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='Compare medians against a previous result JSON; exit 1 on a regression.'
+    )
+    args = parser.parse_args()
+
+    # TTSProcessor resolves speakers/ relative to the working directory
+    os.chdir(REPO_ROOT)
+    workdir = tempfile.mkdtemp(prefix='audiobook-bench-')
+    try:
+        report = run(Options(args.repeat, args.chapters, workdir), only=args.only)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    path = write_results(report, args.out)
+    print(f"\nResults written to {path}")
+
+    if args.compare:
+        print(f"\nCompared to {args.compare}:")
+        if compare(report, args.compare):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
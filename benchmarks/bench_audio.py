@@ -0,0 +1,69 @@
+"""Chapter audio assembly: ChapterBuffer appends and the streamed MP3 encode.
+
+Input is CHUNKS synthetic chunks of CHUNK_S seconds at 24 kHz (a ~20 minute
+chapter). The ffmpeg benchmark is skipped when ffmpeg is not on PATH.
+"""
+
+import os
+import shutil
+
+import numpy as np
+
+from audiobook.processors.assembly import ChapterBuffer, StreamingEncoder
+
+from .harness import Skip, benchmark, measure
+
+SAMPLE_RATE = 24000
+CHUNKS = 120
+CHUNK_S = 10.0
+AUDIO_S = CHUNKS * CHUNK_S
+
+
+def _require_ffmpeg():
+    if shutil.which('ffmpeg') is None:
+        raise Skip("ffmpeg not found")
+
+
+def _chunk(i):
+    rng = np.random.default_rng(i)
+    n = int(SAMPLE_RATE * CHUNK_S)
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+    wav = 0.2 * np.sin(2 * np.pi * (110 + i) * t) + 0.01 * rng.standard_normal(n)
+    return wav.astype(np.float32)
+
+
+def _key(i):
+    return f"{i:064x}"
+
+
+def _buffer(workdir):
+    """A ChapterBuffer holding every chunk, plus its slot keys."""
+    buffer = ChapterBuffer(os.path.join(workdir, 'audio', 'bench.chunks'))
+    if not buffer.slots():
+        for i in range(CHUNKS):
+            buffer.append(i, _key(i), _chunk(i), SAMPLE_RATE)
+        buffer.close()
+    return buffer, [_key(i) for i in range(CHUNKS)]
+
+
+@benchmark('audio.buffer_append')
+def bench_buffer_append(opts):
+    path = os.path.join(opts.workdir, 'audio', 'append.chunks')
+    wavs = [_chunk(i) for i in range(CHUNKS)]
+
+    def append_all():
+        buffer = ChapterBuffer(path)
+        for i, wav in enumerate(wavs):
+            buffer.append(i, _key(i), wav, SAMPLE_RATE)
+        buffer.remove()
+    return measure(append_all, opts.repeat, items=CHUNKS, unit='chunk', audio_s=AUDIO_S)
+
+
+@benchmark('audio.stream_encode')
+def bench_stream_encode(opts):
+    """Whole-buffer StreamingEncoder pass (the finish() of a chapter that never advanced)."""
+    _require_ffmpeg()
+    buffer, keys = _buffer(opts.workdir)
+    mp3 = os.path.join(opts.workdir, 'audio', 'stream.mp3')
+    return measure(lambda: StreamingEncoder(buffer, mp3).finish(keys), opts.repeat,
+                   audio_s=AUDIO_S)
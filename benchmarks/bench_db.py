@@ -0,0 +1,144 @@
+"""ChapterDB operations on a database with `--chapters` rows (default 100k).
+
+Rows are spread over SERIES series with a realistic status mix (mostly done,
+some pending, ~1% failed). Per-call writes are timed on BATCH calls each,
+next to their batch APIs (register_many, mark_done_many) on BATCH rows;
+sync_filesystem runs on one series whose raw files exist on disk, in the
+steady state of a job start (nothing new to register): once with the
+directory manifest current and once forced to rescan both directories.
+"""
+
+import os
+import random
+import time
+
+from audiobook.state import ChapterDB
+
+from .harness import benchmark, measure
+
+SERIES = 20
+BATCH = 1000
+
+
+def _populate(db, chapters, raws_dirs):
+    """Bulk-insert `chapters` rows directly (untimed setup)."""
+    rng = random.Random(0)
+    now = db._now()
+    series_ids = [db.upsert_series(f"Series {s:02d}", url=f"https://example.com/fiction/{s}")
+                  for s in range(SERIES)]
+    rows = []
+    for i in range(chapters):
+        s = i % SERIES
+        n = i // SERIES
+        roll = rng.random()
+        status = 'done' if roll < 0.90 else 'failed' if roll < 0.91 else 'pending'
+        base = f"2024-01-01_Chapter {n}"
+        rows.append((series_ids[s], f"Chapter {n}", '2024-01-01',
+                     f"https://example.com/fiction/{s}/chapter/{1_000_000 + i}", 1_000_000 + i,
+                     os.path.join(raws_dirs[s], f"{base}.txt"),
+                     os.path.join(raws_dirs[s], '..', f"{base}.mp3") if status == 'done' else None,
+                     status, 'TTS produced garbled audio' if status == 'failed' else None,
+                     now, now, now, 1200.0 if status == 'done' else None))
+    db._conn.executemany(
+        """INSERT INTO chapters
+               (series_id, title, published_date, source_url, chapter_index, raw_path,
+                output_path, status, error, scraped_at, created_at, updated_at, duration_s)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""", rows)
+    db._conn.commit()
+
+
+def _write_series_files(db, raws_dir, out_dir):
+    """Create raw .txt files (and MP3s for done chapters) for one series' rows."""
+    os.makedirs(raws_dir, exist_ok=True)
+    os.makedirs(out_dir, exist_ok=True)
+    for row in db.get_chapters('Series 00'):
+        with open(row['raw_path'], 'w', encoding='utf-8') as f:
+            f.write('text')
+        if row['status'] == 'done':
+            base = os.path.splitext(os.path.basename(row['raw_path']))[0]
+            open(os.path.join(out_dir, f"{base}.mp3"), 'wb').close()
+
+
+@benchmark('db')
+def bench_db(opts):
+    root = os.path.join(opts.workdir, 'db')
+    raws_dirs = [os.path.join(root, f"Series {s:02d}", 'raws') for s in range(SERIES)]
+    db = ChapterDB(os.path.join(root, 'audiobook.db'))
+    try:
+        t0 = time.perf_counter()
+        _populate(db, opts.chapters, raws_dirs)
+        populate_s = time.perf_counter() - t0
+        per_series = opts.chapters // SERIES
+        results = []
+
+        def add(name, result):
+            result['chapters'] = opts.chapters
+            results.append((f"db.{name}", result))
+
+        add('summary', measure(db.summary, opts.repeat, populate_s=populate_s))
+        add('summary_series', measure(lambda: db.summary('Series 07'), opts.repeat))
+        add('stats', measure(db.stats, opts.repeat))
+        names = [f"Series {s:02d}" for s in range(SERIES)]
+
+        def dashboard_per_series():
+            # list_series before dashboard(): summary + get_series per series, then stats
+            for name in names:
+                db.summary(name)
+                db.get_series(name)
+            db.stats()
+        add('dashboard_per_series', measure(dashboard_per_series, opts.repeat))
+        add('dashboard', measure(db.dashboard, opts.repeat))
+        add('get_failed', measure(db.get_failed, opts.repeat))
+        add('get_chapters', measure(lambda: db.get_chapters('Series 07'), opts.repeat,
+                                    items=per_series, unit='row'))
+        add('get_actionable', measure(lambda: db.get_actionable('Series 07'), opts.repeat))
+
+        counter = iter(range(10**9))
+
+        def register_batch():
+            for _ in range(BATCH):
+                n = next(counter)
+                db.register('Series 03', f"New {n}",
+                            os.path.join(raws_dirs[3], f"2025-01-01_New {n}.txt"))
+        add('register', measure(register_batch, opts.repeat, items=BATCH, unit='call'))
+
+        def register_many_batch():
+            chapters = []
+            for _ in range(BATCH):
+                n = next(counter)
+                chapters.append({'title': f"New {n}", 'raw_path': os.path.join(
+                    raws_dirs[3], f"2025-01-01_New {n}.txt")})
+            db.register_many('Series 03', chapters)
+        add('register_many', measure(register_many_batch, opts.repeat, items=BATCH,
+                                     unit='chapter'))
+
+        targets = [r['raw_path'] for r in db.get_chapters('Series 05')[:BATCH]]
+
+        def mark_done_batch():
+            for raw_path in targets:
+                db.mark_done(raw_path)
+        add('mark_done', measure(mark_done_batch, opts.repeat, items=len(targets), unit='call'))
+        add('mark_done_many', measure(lambda: db.mark_done_many((p, None) for p in targets),
+                                      opts.repeat, items=len(targets), unit='chapter'))
+
+        _write_series_files(db, raws_dirs[0], os.path.dirname(raws_dirs[0]))
+        out_dir = os.path.dirname(raws_dirs[0])
+        # Settle to steady state: a listing is cached once a second scan, past
+        # the manifest's racy window, confirms it (backdate the first scan)
+        db.sync_filesystem('Series 00', raws_dirs[0], out_dir)
+        db._conn.execute("UPDATE dir_manifest SET seen_at = seen_at - 60")
+        db._conn.commit()
+        db.sync_filesystem('Series 00', raws_dirs[0], out_dir)
+        add('sync_filesystem', measure(
+            lambda: db.sync_filesystem('Series 00', raws_dirs[0], out_dir), opts.repeat,
+            items=per_series, unit='chapter'))
+
+        def forget_manifest():
+            db._conn.execute("DELETE FROM dir_manifest")
+            db._conn.commit()
+        add('sync_filesystem_rescan', measure(
+            lambda: db.sync_filesystem('Series 00', raws_dirs[0], out_dir), opts.repeat,
+            setup=forget_manifest, items=per_series, unit='chapter'))
+        return results
+    finally:
+        db.close()
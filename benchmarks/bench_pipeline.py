@@ -0,0 +1,75 @@
+"""Full chapter processing through the synthetic TTS engine.
+
+chapter_synthesize covers everything a chapter costs apart from the model and
+ffmpeg: TTSProcessor setup, cleaning, chunking, batching, post-processing,
+validation, and buffering. process_chapter is the real end-to-end path (DB
+updates, streamed MP3, move to the output dir) and needs ffmpeg.
+"""
+
+import os
+
+from audiobook.processors.processing import process_chapter
+from audiobook.state import ChapterDB
+
+from .bench_audio import _require_ffmpeg
+from .bench_text import chapter_text, make_processor
+from .harness import benchmark, measure
+
+SERIES_CFG = {'name': 'Bench', 'narrator': 'onyx', 'tts_engine': 'synthetic',
+              'chunk_cache_gb': 0, 'system': {'voice': 'fable', 'speed': 1.1},
+              'narrators': {'onyx': {'volume': 0.9}}}
+
+
+def _raw_chapter(workdir, name):
+    raws = os.path.join(workdir, 'pipeline', 'raws')
+    os.makedirs(raws, exist_ok=True)
+    path = os.path.join(raws, f"2024-01-01_{name}.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(chapter_text())
+    return path
+
+
+@benchmark('pipeline.chapter_synthesize')
+def bench_chapter_synthesize(opts):
+    raw_path = _raw_chapter(opts.workdir, 'Synthesize')
+    state = {}
+
+    def run():
+        processor = make_processor(opts, raw_path, **SERIES_CFG)
+        try:
+            processor.validate_file({})
+            processor.synthesize_chunks()
+            state['chunks'] = len(processor._slot_keys)
+        finally:
+            processor.buffer.remove()
+            processor.clean_up()
+    result = measure(run, opts.repeat)
+    result.update(chunks=state['chunks'], chars=len(chapter_text()))
+    return result
+
+
+@benchmark('pipeline.process_chapter')
+def bench_process_chapter(opts):
+    _require_ffmpeg()
+    raw_path = _raw_chapter(opts.workdir, 'Process')
+    output_base = os.path.join(opts.workdir, 'pipeline', 'out')
+    tmp_dir = os.path.join(opts.workdir, 'pipeline', 'tmp')
+    mp3 = os.path.join(output_base, SERIES_CFG['name'],
+                       os.path.splitext(os.path.basename(raw_path))[0] + '.mp3')
+    db = ChapterDB(os.path.join(opts.workdir, 'pipeline', 'audiobook.db'))
+    db.register(SERIES_CFG['name'], 'Process', raw_path)
+
+    def reset():
+        if os.path.exists(mp3):
+            os.remove(mp3)
+        db.reset_chapter(raw_path)
+
+    def run():
+        process_chapter(raw_path, SERIES_CFG, output_base, tmp_dir, db=db)
+        status = db.get_chapters(SERIES_CFG['name'])[0]['status']
+        if status != 'done':
+            raise RuntimeError(f"chapter ended {status}")
+    try:
+        return measure(run, opts.repeat, setup=reset, chars=len(chapter_text()))
+    finally:
+        db.close()
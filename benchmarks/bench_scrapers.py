@@ -0,0 +1,58 @@
+"""Scraper HTML parsing on saved chapter pages (fixtures/<site>/*.html).
+
+Any page saved from a browser ("Save page as, HTML only") can be dropped into
+the site's fixture directory; every file there is parsed on each repetition.
+"""
+
+import glob
+import os
+
+from bs4 import BeautifulSoup
+
+from .harness import FIXTURES, Skip, benchmark, measure
+
+SYSTEM_TYPES = ['table', 'bold', 'bracket']
+
+
+def _pages(site):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, site, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    if not pages:
+        raise Skip(f"no fixtures in fixtures/{site}/")
+    return pages
+
+
+def _config(url):
+    return {'name': "The Archivist's Clerk", 'latest': url, 'url': url,
+            'system': {'type': SYSTEM_TYPES}}
+
+
+def _parse_all(scraper, pages):
+    for page in pages:
+        title, content, _ = scraper._parse_chapter(BeautifulSoup(page, 'html.parser'))
+        if content == 'Content not found':
+            raise ValueError(f"fixture parsed to no content (title {title!r})")
+
+
+@benchmark('scrape.royalroad_parse')
+def bench_royalroad(opts):
+    from audiobook.scrapers.royalroad import RoyalRoadScraper
+    pages = _pages('royalroad')
+    scraper = RoyalRoadScraper(
+        _config('https://www.royalroad.com/fiction/12345/the-archivists-clerk'),
+        output_dir=os.path.join(opts.workdir, 'rr'))
+    return measure(lambda: _parse_all(scraper, pages), opts.repeat, items=len(pages),
+                   unit='page', bytes=sum(len(p) for p in pages))
+
+
+@benchmark('scrape.scribblehub_parse')
+def bench_scribblehub(opts):
+    from audiobook.scrapers.scribblehub import ScribbleHubScraper
+    pages = _pages('scribblehub')
+    scraper = ScribbleHubScraper(
+        _config('https://www.scribblehub.com/series/123456/the-archivists-clerk/'),
+        output_dir=os.path.join(opts.workdir, 'sh'))
+    return measure(lambda: _parse_all(scraper, pages), opts.repeat, items=len(pages),
+                   unit='page', bytes=sum(len(p) for p in pages))
@@ -0,0 +1,67 @@
+"""Text cleaning (clean_text) and chunking (TTSProcessor._split_text / collect_chunks)."""
+
+import os
+
+import nltk
+
+from audiobook.processors.tts_processor import TTSProcessor
+from audiobook.validators.validate_file import clean_text
+
+from .harness import FIXTURES, Skip, benchmark, measure
+
+COPIES = 4   # fixture chapter x4 ≈ a typical 15-20k character chapter
+
+REPLACEMENTS = {'Mara': 'Marra', 'Archivist': 'Ark-ivist', 'Westmarch': 'West March'}
+
+
+def chapter_text():
+    with open(os.path.join(FIXTURES, 'chapter.txt'), encoding='utf-8') as f:
+        return '\n'.join([f.read()] * COPIES)
+
+
+def require_punkt():
+    """Sentence splitting needs NLTK's punkt_tab; offline runs cannot download it."""
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        raise Skip("nltk punkt_tab data not installed (run the pipeline once online)")
+
+
+def make_processor(opts, raw_path, **cfg):
+    """TTSProcessor on the synthetic engine with the chunk cache off."""
+    require_punkt()
+    config = {'name': 'Bench', 'tts_engine': 'synthetic', 'chunk_cache_gb': 0,
+              'system': {'voice': 'fable'}, **cfg}
+    out_dir = os.path.join(opts.workdir, 'out')
+    tmp_dir = os.path.join(opts.workdir, 'tmp')
+    os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(tmp_dir, exist_ok=True)
+    return TTSProcessor(raw_path, config, output_dir=out_dir, tmp_dir=tmp_dir)
+
+
+@benchmark('text.clean_text')
+def bench_clean_text(opts):
+    text = chapter_text()
+    return measure(lambda: clean_text(text, REPLACEMENTS), opts.repeat, items=len(text),
+                   unit='char')
+
+
+@benchmark('text.split_text')
+def bench_split_text(opts):
+    text = clean_text(chapter_text(), REPLACEMENTS)
+    processor = make_processor(opts, os.path.join(opts.workdir, 'split.txt'))
+    chunks = processor._split_text(text)
+    return measure(lambda: processor._split_text(text), opts.repeat, items=len(text),
+                   unit='char', chunks=len(chunks))
+
+
+@benchmark('text.collect_chunks')
+def bench_collect_chunks(opts):
+    """Speaker-tag parsing, chunking, and chunk keys for a whole cleaned chapter."""
+    cleaned = os.path.join(opts.workdir, 'collect_cleaned.txt')
+    with open(cleaned, 'w', encoding='utf-8') as f:
+        f.write(clean_text(chapter_text(), REPLACEMENTS))
+    processor = make_processor(opts, os.path.join(opts.workdir, 'collect.txt'))
+    processor.cleaned_file_name = cleaned
+    chunks = sum(len(g['items']) for g in processor.collect_chunks().values())
+    return measure(processor.collect_chunks, opts.repeat, items=chunks, unit='chunk')
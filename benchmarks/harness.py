@@ -0,0 +1,157 @@
+"""Benchmark registry, timing, and JSON result files."""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures')
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+
+REGRESSION_THRESHOLD = 0.10   # --compare flags medians this much slower
+
+_BENCHMARKS = []   # [(name, fn)] in registration order
+
+
+class Skip(Exception):
+    """Raised by a benchmark that cannot run here (e.g. ffmpeg not installed)."""
+
+
+class Options:
+    """Run options shared by every benchmark.
+
+    Args:
+        repeat: Timed repetitions per measurement.
+        chapters: Row count for the ChapterDB benchmarks.
+        workdir: Scratch directory, removed after the run.
+    """
+
+    def __init__(self, repeat, chapters, workdir):
+        self.repeat = repeat
+        self.chapters = chapters
+        self.workdir = workdir
+
+
+def benchmark(name):
+    """Register `fn(opts)` under `name`; it returns a result dict or a list of (name, result)."""
+    def register(fn):
+        _BENCHMARKS.append((name, fn))
+        return fn
+    return register
+
+
+def measure(fn, repeat, setup=None, items=None, **extra):
+    """Time `fn()` `repeat` times; `setup()` runs untimed before each call.
+
+    Returns a result dict with wall-time statistics in seconds and, when
+    `items` (work per call) is given, the median time per item in microseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    result = {
+        'repeat': repeat,
+        'min_s': min(times),
+        'median_s': statistics.median(times),
+        'mean_s': statistics.fmean(times),
+        'max_s': max(times),
+    }
+    if items:
+        result['items'] = items
+        result['per_item_us'] = result['median_s'] / items * 1e6
+    result.update(extra)
+    return result
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def metadata(opts):
+    return {
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'repeat': opts.repeat,
+        'chapters': opts.chapters,
+    }
+
+
+def run(opts, only=None):
+    """Run registered benchmarks whose name starts with any prefix in `only`.
+
+    Pipeline code prints progress (and tqdm bars); both streams are captured
+    so the report stays readable.
+    Returns {'meta': ..., 'results': {name: result}}.
+    """
+    results = {}
+    for name, fn in _BENCHMARKS:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        print(f"{name} ...", end=' ', flush=True)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                out = fn(opts)
+        except Skip as e:
+            print(f"skipped ({e})")
+            results[name] = {'skipped': str(e)}
+            continue
+        except Exception as e:
+            print(f"error: {e!r}")
+            results[name] = {'error': repr(e)}
+            continue
+        entries = out if isinstance(out, list) else [(name, out)]
+        for entry_name, result in entries:
+            results[entry_name] = result
+        print(', '.join(f"{n} {r['median_s'] * 1e3:.1f}ms" for n, r in entries))
+    return {'meta': metadata(opts), 'results': results}
+
+
+def write_results(report, path=None):
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = report['meta']['timestamp'].replace(':', '').replace('-', '')
+        path = os.path.join(RESULTS_DIR, f"{stamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    return path
+
+
+def compare(report, baseline_path, out=sys.stdout):
+    """Print median ratios against a previous result file. Returns the regressed names."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    regressed = []
+    for name, result in report['results'].items():
+        old = baseline.get(name)
+        if not old or 'median_s' not in old or 'median_s' not in result:
+            continue
+        ratio = result['median_s'] / old['median_s'] if old['median_s'] else float('inf')
+        flag = ''
+        if ratio > 1 + REGRESSION_THRESHOLD:
+            flag = '  REGRESSED'
+            regressed.append(name)
+        elif ratio < 1 - REGRESSION_THRESHOLD:
+            flag = '  improved'
+        print(f"{name:<40} {old['median_s'] * 1e3:>10.2f}ms -> "
+              f"{result['median_s'] * 1e3:>10.2f}ms  x{ratio:.2f}{flag}", file=out)
+    return regressed
@@ -23,7 +23,7 @@ export const getStatus = (logSince: number) =>
   api.get<StatusResponse>(`/api/status?log_since=${logSince}`)
 export const getHealth = () => api.get<Health>('/api/health')
 export const clearLog = () => api.post<{ ok: boolean }>('/api/log/clear')
-export const syncFilesystem = () => api.post<{ ok: boolean }>('/api/sync')
+export const syncFilesystem = () => api.post<SubmitResponse & { ok: boolean }>('/api/sync')
 
 // ── jobs ────────────────────────────────────────────────────────
 export const startFullPipeline = () => api.post<SubmitResponse>('/api/jobs/full')
@@ -8,11 +8,14 @@ export interface JobProgress {
   chapter?: string
   raw_path?: string
   pct?: number
+  preempted_by?: string
 }
 
 export interface JobSnapshot {
   id: string
   type: string
+  lane: 'gpu' | 'scrape' | 'maintenance'
+  priority: 'interactive' | 'series' | 'bulk'
   label: string
   series: string | null
   chapter_id: number | null
@@ -27,6 +30,7 @@ export interface JobSnapshot {
 
 export interface QueueSnapshot {
   current: JobSnapshot | null
+  running: JobSnapshot[]
   queued: JobSnapshot[]
   history: JobSnapshot[]
 }
@@ -49,6 +53,8 @@ export interface Health {
   share_ok: boolean
   disk_free_gb?: number
   db_size_mb?: number
+  replication_lag_s?: number
+  replication_error?: string
   vram_used_gb?: number
   vram_total_gb?: number
   model_loaded: boolean
@@ -7,6 +7,7 @@ const SUCCESS = 'var(--color-success)'
 const WARNING = 'var(--color-warning)'
 const ERROR = 'var(--color-error)'
 const DIM = 'var(--color-dim)'
+const REPLICATION_LAG_WARN_S = 600
 
 export function HealthStrip() {
   const { data: health } = useQuery({
@@ -33,6 +34,13 @@ export function HealthStrip() {
   } else {
     chips.push({ label: 'share unreachable', color: ERROR })
   }
+  if (health.replication_lag_s != null) {
+    const lag = health.replication_lag_s
+    chips.push({
+      label: lag ? `replica ${(lag / 60).toFixed(0)}m behind` : 'replica current',
+      color: health.replication_error ? ERROR : lag > REPLICATION_LAG_WARN_S ? WARNING : SUCCESS,
+    })
+  }
 
   const vram =
     health.vram_used_gb != null && health.vram_total_gb != null
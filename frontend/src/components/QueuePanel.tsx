@@ -67,6 +67,7 @@ function CurrentJob({ job }: { job: JobSnapshot }) {
           {seriesCounter}
         </span>
         <span className="ml-auto shrink-0 text-[12px] text-dim">
+          {p.preempted_by && !cancelling && <span className="mr-1.5 text-info">paused</span>}
           {cancelling ? 'cancelling…' : fmtDuration(elapsed)}
         </span>
         <IconButton
@@ -117,13 +118,15 @@ function QueuedJob({ job }: { job: JobSnapshot }) {
 export function QueuePanel({ status }: { status: StatusResponse | undefined }) {
   const queue = status?.queue
   if (!queue) return null
-  const { current, queued, history } = queue
-  if (!current && queued.length === 0 && history.length === 0) return null
+  const { running, queued, history } = queue
+  if (running.length === 0 && queued.length === 0 && history.length === 0) return null
 
   return (
     <section className="flex w-full flex-col gap-1.5">
       <Kicker>queue</Kicker>
-      {current && <CurrentJob job={current} />}
+      {running.map((j) => (
+        <CurrentJob key={j.id} job={j} />
+      ))}
       {queued.map((j) => (
         <QueuedJob key={j.id} job={j} />
       ))}
@@ -112,7 +112,7 @@ export function DashboardPage() {
     setSyncing(true)
     try {
       await syncFilesystem()
-      toast.success('Sync complete')
+      toast.success('Sync queued')
     } catch (err) {
       toast.error(err instanceof ApiError ? err.message : 'Sync failed')
     } finally {